@@ -57,271 +57,208 @@ if "backbone" not in _sys.modules:
 if not __package__:  # imported without package context (e.g. pytest setup)
     __package__ = "backbone"    # type: ignore[assignment]
 
-del _sys, _os, _types, _here
+del _sys, _types, _here
+
+import functools as _functools
+import importlib as _importlib
+from types import ModuleType as _ModuleType
+from typing import Optional as _Optional
 
 # Framework version
 __version__ = "0.1.0"
 __author__ = "Backbone Framework Team"
 __license__ = "MIT"
 
-# === DOMAIN LAYER EXPORTS ===
-from .domain.exceptions import (
-    BaseKernelException,
-    DomainException,
-    BusinessRuleViolationException,
-    InvalidEntityStateException,
-    InvalidValueObjectException
-)
-
-# === EVENT SYSTEM EXPORTS ===
-from .domain.ports.event_bus import (
-    EventBus,
-    EventStore,
-    BaseEvent,
-    DomainEvent,
-    IntegrationEvent,
-    SystemEvent,
-    EventHandler
-)
-
-from .domain.repositories import (
-    IRepository,
-    IReadOnlyRepository,
-    IUnitOfWork
-)
-
-from .domain.specifications import (
-    Specification,
-    FilterSpecification,
-    CompositeSpecification,
-    AndSpecification,
-    OrSpecification,
-    NotSpecification,
-    EqualSpecification,
-    NotEqualSpecification,
-    LessThanSpecification,
-    LessThanOrEqualSpecification,
-    GreaterThanSpecification,
-    GreaterThanOrEqualSpecification,
-    LikeSpecification,
-    InSpecification,
-    BetweenSpecification,
-    IsNullSpecification,
-    IsNotNullSpecification,
-    FilterParser,
-    MultipleSortSpecification,
-    SortSpecification,
-    SortDirection
-)
-
-# === APPLICATION LAYER EXPORTS ===
-from .application.exceptions import (
-    ApplicationException,
-    UseCaseException,
-    ValidationException,
-    AuthorizationException,
-    ResourceNotFoundException,
-    ResourceConflictException
-)
+# === LAZY PUBLIC API ===
+# Los nombres públicos se resuelven bajo demanda (PEP 562, estilo SPEC 1 /
+# lazy_loader.attach): `import backbone` solo carga este archivo y cada
+# submódulo se importa la primera vez que se accede a uno de sus nombres.
+# Los tipos para IDEs/mypy se declaran en __init__.pyi.
+_SUBMOD_ATTRS = {
+    "domain.ports.event_bus": [
+        "EventBus",
+        "EventStore",
+        "BaseEvent",
+        "DomainEvent",
+        "IntegrationEvent",
+        "SystemEvent",
+        "EventHandler",
+    ],
+    "infrastructure.events.base_event": [
+        "EventMetadata",
+    ],
+    "domain.exceptions": [
+        "BaseKernelException",
+        "DomainException",
+        "BusinessRuleViolationException",
+        "InvalidEntityStateException",
+        "InvalidValueObjectException",
+    ],
+    "domain.repositories": [
+        "IRepository",
+        "IReadOnlyRepository",
+        "IUnitOfWork",
+    ],
+    "domain.specifications": [
+        "Specification",
+        "FilterSpecification",
+        "CompositeSpecification",
+        "AndSpecification",
+        "OrSpecification",
+        "NotSpecification",
+        "EqualSpecification",
+        "NotEqualSpecification",
+        "LessThanSpecification",
+        "LessThanOrEqualSpecification",
+        "GreaterThanSpecification",
+        "GreaterThanOrEqualSpecification",
+        "LikeSpecification",
+        "InSpecification",
+        "BetweenSpecification",
+        "IsNullSpecification",
+        "IsNotNullSpecification",
+        "FilterParser",
+        "MultipleSortSpecification",
+        "SortSpecification",
+        "SortDirection",
+    ],
+    "application.exceptions": [
+        "ApplicationException",
+        "UseCaseException",
+        "ValidationException",
+        "AuthorizationException",
+        "ResourceNotFoundException",
+        "ResourceConflictException",
+    ],
+    "application.event_handlers": [
+        "event_handler",
+        "RetryPolicy",
+        "EventHandlerRegistry",
+    ],
+    "infrastructure.exceptions": [
+        "InfrastructureException",
+        "DatabaseException",
+        "ExternalServiceException",
+        "ConfigurationException",
+    ],
+    "infrastructure.logging": [
+        "StructuredLogger",
+        "ConcreteStructuredLogger",
+        "LoggerFactory",
+        "JSONFormatter",
+        "ConsoleFormatter",
+        "CompactJSONFormatter",
+        "FileFormatter",
+        "LogContext",
+    ],
+    "infrastructure.configuration": [
+        "BaseAppConfig",
+        "get_config",
+        "load_config",
+        "get_feature_flags",
+    ],
+    "infrastructure.testing": [
+        "BaseTestCase",
+        "BaseAsyncTestCase",
+        "MockRepository",
+        "BaseFixtureFactory",
+        "TestDataBuilder",
+    ],
+    "infrastructure.messaging": [
+        "KafkaEventBusAdapter",
+        "RabbitMQEventBusAdapter",
+        "RedisEventBusAdapter",
+        "EventBusAdapterFactory",
+    ],
+    "infrastructure.persistence.event_store": [
+        "JsonFileEventStore",
+        "InMemoryEventStore",
+    ],
+    "infrastructure.persistence": [
+        "BaseUnitOfWork",
+        "get_available_adapters",
+        "is_sqlalchemy_adapter_available",
+        "is_mongodb_adapter_available",
+    ],
+    "interfaces.exceptions": [
+        "PresentationException",
+        "RequestValidationException",
+        "HttpException",
+        "SerializationException",
+        "DeserializationException",
+    ],
+    "interfaces.response_builders": [
+        "ProcessResponseBuilder",
+        "SimpleObjectResponseBuilder",
+        "PaginatedResponseBuilder",
+        "ErrorResponseBuilder",
+    ],
+}
 
-# === INFRASTRUCTURE LAYER EXPORTS ===
-from .infrastructure.exceptions import (
-    InfrastructureException,
-    DatabaseException,
-    ExternalServiceException,
-    ConfigurationException
-)
 
-# === INFRASTRUCTURE MESSAGING ===
-from .infrastructure.messaging import (
-    KafkaEventBusAdapter,
-    RabbitMQEventBusAdapter,
-    RedisEventBusAdapter,
-    EventBusAdapterFactory
-)
+# Subpaquetes accesibles como atributo (`backbone.domain`), también perezosos
+_SUBMODULES = ["domain", "application", "infrastructure", "interfaces"]
 
-from .infrastructure.persistence.event_store import (
-    JsonFileEventStore,
-    InMemoryEventStore
-)
 
-from .infrastructure.events.base_event import (
-    EventMetadata
-)
+def _attach(
+    package_name: str,
+    submodules: list[str],
+    submod_attrs: dict[str, list[str]],
+):
+    """
+    Genera `__getattr__`, `__dir__` y `__all__` a partir de una tabla declarativa.
 
-# === APPLICATION EVENT HANDLERS ===
-from .application.event_handlers import (
-    event_handler,
-    RetryPolicy,
-    EventHandlerRegistry
-)
+    Equivalente mínimo de `lazy_loader.attach`, sin dependencia externa.
+    """
+    attr_to_modules = {
+        attr: f".{module}"
+        for module, attrs in submod_attrs.items()
+        for attr in attrs
+    }
+    submodule_set = frozenset(submodules)
+    public = ("__version__", "__author__", "__license__", *attr_to_modules)
+    public_set = frozenset(public).union(submodule_set)
 
-from .infrastructure.logging import (
-    StructuredLogger,
-    ConcreteStructuredLogger,
-    LoggerFactory,
-    JSONFormatter,
-    ConsoleFormatter,
-    CompactJSONFormatter,
-    FileFormatter,
-    LogContext
-)
+    def __getattr__(name: str):
+        if name in submodule_set:
+            return _importlib.import_module(f".{name}", package_name)
+        try:
+            module_name = attr_to_modules[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {package_name!r} has no attribute {name!r}"
+            ) from None
 
-from .infrastructure.configuration import (
-    BaseAppConfig,
-    get_config,
-    load_config,
-    get_feature_flags
-)
+        value = getattr(_importlib.import_module(module_name, package_name), name)
+        globals()[name] = value
+        return value
 
-from .infrastructure.testing import (
-    BaseTestCase,
-    BaseAsyncTestCase,
-    MockRepository,
-    BaseFixtureFactory,
-    TestDataBuilder
-)
+    def __dir__() -> list[str]:
+        return sorted(public_set.union(globals()))
 
-# Persistence - exportación condicional
-try:
-    from .infrastructure.persistence import (
-        IUnitOfWork,
-        BaseUnitOfWork,
-        get_available_adapters,
-        is_sqlalchemy_adapter_available,
-        is_mongodb_adapter_available
-    )
-    _persistence_available = True
-except ImportError:
-    _persistence_available = False
+    return __getattr__, __dir__, public
 
-# === INTERFACES LAYER EXPORTS ===
-from .interfaces.exceptions import (
-    PresentationException,
-    RequestValidationException,
-    HttpException,
-    SerializationException,
-    DeserializationException
-)
 
-from .interfaces.response_builders import (
-    ProcessResponseBuilder,
-    SimpleObjectResponseBuilder,
-    PaginatedResponseBuilder,
-    ErrorResponseBuilder
+_attr_getattr, __dir__, _PUBLIC = _attach(__name__, _SUBMODULES, _SUBMOD_ATTRS)
+# Exports que dependen de que el paquete de persistencia importe
+_PERSISTENCE_ATTRS = frozenset(
+    attr
+    for module, attrs in _SUBMOD_ATTRS.items()
+    if module == "infrastructure.persistence" or module.startswith("infrastructure.persistence.")
+    for attr in attrs
 )
 
-# === PUBLIC API ===
-__all__ = [
-    # Version info
-    "__version__",
-    "__author__", 
-    "__license__",
-    
-    # Domain Layer - Events
-    "EventBus",
-    "EventStore",
-    "BaseEvent",
-    "DomainEvent",
-    "IntegrationEvent",
-    "SystemEvent",
-    "EventHandler",
-    "EventMetadata",
-    
-    # Domain Layer - Core
-    "BaseKernelException",
-    "DomainException",
-    "BusinessRuleViolationException",
-    "InvalidEntityStateException", 
-    "InvalidValueObjectException",
-    "IRepository",
-    "IReadOnlyRepository",
-    "IUnitOfWork",
-    "Specification",
-    "FilterSpecification",
-    "CompositeSpecification", 
-    "AndSpecification",
-    "OrSpecification",
-    "NotSpecification",
-    "EqualSpecification",
-    "NotEqualSpecification",
-    "LessThanSpecification",
-    "LessThanOrEqualSpecification",
-    "GreaterThanSpecification",
-    "GreaterThanOrEqualSpecification",
-    "LikeSpecification",
-    "InSpecification",
-    "BetweenSpecification",
-    "IsNullSpecification",
-    "IsNotNullSpecification",
-    "FilterParser",
-    "MultipleSortSpecification",
-    "SortSpecification",
-    "SortDirection",
-    
-    # Application Layer
-    "ApplicationException",
-    "UseCaseException",
-    "ValidationException", 
-    "AuthorizationException",
-    "ResourceNotFoundException",
-    "ResourceConflictException",
-    "event_handler",
-    "RetryPolicy",
-    "EventHandlerRegistry",
-    
-    # Infrastructure Layer - Core
-    "InfrastructureException", 
-    "DatabaseException",
-    "ExternalServiceException",
-    "ConfigurationException",
-    "StructuredLogger",
-    "ConcreteStructuredLogger",
-    "LoggerFactory",
-    "JSONFormatter",
-    "ConsoleFormatter",
-    "CompactJSONFormatter",
-    "FileFormatter",
-    "LogContext",
-    "BaseAppConfig",
-    "get_config",
-    "load_config",
-    "get_feature_flags",
-    "BaseTestCase",
-    "BaseAsyncTestCase", 
-    "MockRepository",
-    "BaseFixtureFactory",
-    "TestDataBuilder",
-    
-    # Infrastructure Layer - Messaging
-    "KafkaEventBusAdapter",
-    "RabbitMQEventBusAdapter",
-    "RedisEventBusAdapter",
-    "EventBusAdapterFactory",
-    "JsonFileEventStore",
-    "InMemoryEventStore",
-    
-    # Interfaces Layer
-    "PresentationException",
-    "RequestValidationException",
-    "HttpException",
-    "SerializationException", 
-    "DeserializationException",
-    "ProcessResponseBuilder",
-    "SimpleObjectResponseBuilder",
-    "PaginatedResponseBuilder", 
-    "ErrorResponseBuilder"
-]
 
-# Agregar persistence exports si está disponible
-if _persistence_available:
-    __all__.extend([
-        "IUnitOfWork",
-        "BaseUnitOfWork", 
-        "get_available_adapters",
-        "is_sqlalchemy_adapter_available",
-        "is_mongodb_adapter_available"
-    ])
+def __getattr__(name: str):
+    if name == "__all__":
+        # Como en la versión eager, los exports de persistencia solo se
+        # listan si el módulo importa; se resuelve en el primer `import *`
+        public = _PUBLIC
+        if _persistence() is None:
+            public = tuple(attr for attr in _PUBLIC if attr not in _PERSISTENCE_ATTRS)
+        globals()["__all__"] = public
+        return public
+    return _attr_getattr(name)
 
 # === UTILITY FUNCTIONS ===
 
@@ -329,6 +266,29 @@ def get_version() -> str:
     """Retorna versión del framework."""
     return __version__
 
+@_functools.cache
+def _persistence() -> _Optional[_ModuleType]:
+    """
+    Retorna el módulo de persistencia o None si no puede importarse.
+
+    El resultado (incluido el fallo) se memoriza: la búsqueda de import
+    se hace una sola vez por proceso.
+    """
+    try:
+        return _importlib.import_module(".infrastructure.persistence", __name__)
+    except ImportError:
+        return None
+
+# Carga completa al importar (convención EAGER_IMPORT de SPEC 1 / mkinit);
+# sin los extras de persistencia sus exports se omiten, como en __all__
+if _os.environ.get("EAGER_IMPORT") or _os.environ.get("BACKBONE_EAGER_IMPORT"):
+    _skipped = _PERSISTENCE_ATTRS if _persistence() is None else frozenset()
+    for _attrs in _SUBMOD_ATTRS.values():
+        for _name in _attrs:
+            if _name not in _skipped:
+                __getattr__(_name)
+    del _skipped, _attrs, _name
+
 def get_available_features() -> dict:
     """
     Retorna características disponibles del framework.
@@ -336,6 +296,7 @@ def get_available_features() -> dict:
     Returns:
         Diccionario con features disponibles
     """
+    persistence = _persistence()
     features = {
         "domain_layer": True,
         "application_layer": True,
@@ -347,12 +308,11 @@ def get_available_features() -> dict:
         "structured_logging": True,
         "configuration_system": True,
         "testing_framework": True,
-        "persistence_layer": _persistence_available
+        "persistence_layer": persistence is not None
     }
     
-    if _persistence_available:
-        from .infrastructure.persistence import get_available_adapters
-        adapters = get_available_adapters()
+    if persistence is not None:
+        adapters = persistence.get_available_adapters()
         features.update({
             "sqlalchemy_adapter": "sqlalchemy" in adapters,
             "mongodb_adapter": "mongodb" in adapters
@@ -362,27 +322,6 @@ def get_available_features() -> dict:
 
 def print_banner():
     """Imprime banner informativo del framework."""
-    banner = f"""
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                                                                              ║
-║    🏗️  BACKBONE - CLEAN ARCHITECTURE FRAMEWORK                              ║
-║                                                                              ║
-║    Version: {__version__:<10} | License: {__license__:<10} | Python 3.8+     ║
-║                                                                              ║
-║    🎯 Clean Architecture & Hexagonal Architecture                           ║
-║    🔢 8-digit error codes by layer                                          ║
-║    🔧 Framework-agnostic response builders                                  ║
-║    🎯 Dynamic filtering with Specification Pattern                          ║
-║    📋 Repository Pattern with multiple adapters                             ║
-║    🗄️ Unit of Work Pattern for transactions                                 ║
-║    📊 Structured JSON logging for ELK Stack                                 ║
-║    🧪 Complete testing framework                                            ║
-║    ⚙️ Type-safe configuration with Pydantic                                 ║
-║    🗄️ Persistence layer with multiple adapters                              ║
-║    📖 Docs: https://docs.backbone-framework.com                             ║
-║    🐛 Issues: https://github.com/backbone/backbone/issues                   ║
-║                                                                              ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-    """.strip()
+    from ._banner import BANNER_TEMPLATE
     
-    print(banner)
\ No newline at end of file
+    print(BANNER_TEMPLATE.format(version=__version__, license=__license__))
@@ -0,0 +1,135 @@
+"""Type stub for the lazily-resolved backbone public API."""
+
+from . import (
+    domain as domain,
+    application as application,
+    infrastructure as infrastructure,
+    interfaces as interfaces,
+)
+from .domain.ports.event_bus import (
+    EventBus as EventBus,
+    EventStore as EventStore,
+    BaseEvent as BaseEvent,
+    DomainEvent as DomainEvent,
+    IntegrationEvent as IntegrationEvent,
+    SystemEvent as SystemEvent,
+    EventHandler as EventHandler,
+)
+from .infrastructure.events.base_event import (
+    EventMetadata as EventMetadata,
+)
+from .domain.exceptions import (
+    BaseKernelException as BaseKernelException,
+    DomainException as DomainException,
+    BusinessRuleViolationException as BusinessRuleViolationException,
+    InvalidEntityStateException as InvalidEntityStateException,
+    InvalidValueObjectException as InvalidValueObjectException,
+)
+from .domain.repositories import (
+    IRepository as IRepository,
+    IReadOnlyRepository as IReadOnlyRepository,
+    IUnitOfWork as IUnitOfWork,
+)
+from .domain.specifications import (
+    Specification as Specification,
+    FilterSpecification as FilterSpecification,
+    CompositeSpecification as CompositeSpecification,
+    AndSpecification as AndSpecification,
+    OrSpecification as OrSpecification,
+    NotSpecification as NotSpecification,
+    EqualSpecification as EqualSpecification,
+    NotEqualSpecification as NotEqualSpecification,
+    LessThanSpecification as LessThanSpecification,
+    LessThanOrEqualSpecification as LessThanOrEqualSpecification,
+    GreaterThanSpecification as GreaterThanSpecification,
+    GreaterThanOrEqualSpecification as GreaterThanOrEqualSpecification,
+    LikeSpecification as LikeSpecification,
+    InSpecification as InSpecification,
+    BetweenSpecification as BetweenSpecification,
+    IsNullSpecification as IsNullSpecification,
+    IsNotNullSpecification as IsNotNullSpecification,
+    FilterParser as FilterParser,
+    MultipleSortSpecification as MultipleSortSpecification,
+    SortSpecification as SortSpecification,
+    SortDirection as SortDirection,
+)
+from .application.exceptions import (
+    ApplicationException as ApplicationException,
+    UseCaseException as UseCaseException,
+    ValidationException as ValidationException,
+    AuthorizationException as AuthorizationException,
+    ResourceNotFoundException as ResourceNotFoundException,
+    ResourceConflictException as ResourceConflictException,
+)
+from .application.event_handlers import (
+    event_handler as event_handler,
+    RetryPolicy as RetryPolicy,
+    EventHandlerRegistry as EventHandlerRegistry,
+)
+from .infrastructure.exceptions import (
+    InfrastructureException as InfrastructureException,
+    DatabaseException as DatabaseException,
+    ExternalServiceException as ExternalServiceException,
+    ConfigurationException as ConfigurationException,
+)
+from .infrastructure.logging import (
+    StructuredLogger as StructuredLogger,
+    ConcreteStructuredLogger as ConcreteStructuredLogger,
+    LoggerFactory as LoggerFactory,
+    JSONFormatter as JSONFormatter,
+    ConsoleFormatter as ConsoleFormatter,
+    CompactJSONFormatter as CompactJSONFormatter,
+    FileFormatter as FileFormatter,
+    LogContext as LogContext,
+)
+from .infrastructure.configuration import (
+    BaseAppConfig as BaseAppConfig,
+    get_config as get_config,
+    load_config as load_config,
+    get_feature_flags as get_feature_flags,
+)
+from .infrastructure.testing import (
+    BaseTestCase as BaseTestCase,
+    BaseAsyncTestCase as BaseAsyncTestCase,
+    MockRepository as MockRepository,
+    BaseFixtureFactory as BaseFixtureFactory,
+    TestDataBuilder as TestDataBuilder,
+)
+from .infrastructure.messaging import (
+    KafkaEventBusAdapter as KafkaEventBusAdapter,
+    RabbitMQEventBusAdapter as RabbitMQEventBusAdapter,
+    RedisEventBusAdapter as RedisEventBusAdapter,
+    EventBusAdapterFactory as EventBusAdapterFactory,
+)
+from .infrastructure.persistence.event_store import (
+    JsonFileEventStore as JsonFileEventStore,
+    InMemoryEventStore as InMemoryEventStore,
+)
+from .infrastructure.persistence import (
+    BaseUnitOfWork as BaseUnitOfWork,
+    get_available_adapters as get_available_adapters,
+    is_sqlalchemy_adapter_available as is_sqlalchemy_adapter_available,
+    is_mongodb_adapter_available as is_mongodb_adapter_available,
+)
+from .interfaces.exceptions import (
+    PresentationException as PresentationException,
+    RequestValidationException as RequestValidationException,
+    HttpException as HttpException,
+    SerializationException as SerializationException,
+    DeserializationException as DeserializationException,
+)
+from .interfaces.response_builders import (
+    ProcessResponseBuilder as ProcessResponseBuilder,
+    SimpleObjectResponseBuilder as SimpleObjectResponseBuilder,
+    PaginatedResponseBuilder as PaginatedResponseBuilder,
+    ErrorResponseBuilder as ErrorResponseBuilder,
+)
+
+__version__: str
+__author__: str
+__license__: str
+__all__: tuple[str, ...]
+
+def get_version() -> str: ...
+def get_available_features() -> dict: ...
+def print_banner() -> None: ...
@@ -0,0 +1,26 @@
+"""
+Banner del framework, importado solo cuando se llama a `print_banner()`.
+"""
+
+BANNER_TEMPLATE = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                                                                              ║
+║    🏗️  BACKBONE - CLEAN ARCHITECTURE FRAMEWORK                              ║
+║                                                                              ║
+║    Version: {version:<10} | License: {license:<10} | Python 3.8+     ║
+║                                                                              ║
+║    🎯 Clean Architecture & Hexagonal Architecture                           ║
+║    🔢 8-digit error codes by layer                                          ║
+║    🔧 Framework-agnostic response builders                                  ║
+║    🎯 Dynamic filtering with Specification Pattern                          ║
+║    📋 Repository Pattern with multiple adapters                             ║
+║    🗄️ Unit of Work Pattern for transactions                                 ║
+║    📊 Structured JSON logging for ELK Stack                                 ║
+║    🧪 Complete testing framework                                            ║
+║    ⚙️ Type-safe configuration with Pydantic                                 ║
+║    🗄️ Persistence layer with multiple adapters                              ║
+║    📖 Docs: https://docs.backbone-framework.com                             ║
+║    🐛 Issues: https://github.com/backbone/backbone/issues                   ║
+║                                                                              ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+    """.strip()
@@ -1,28 +1,63 @@
 """
 Event Handlers - Application layer event handling decorators and utilities
 """
-from typing import Any, Dict, Optional, Callable, Awaitable, List
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Optional, Callable, Awaitable, List, Iterator, Tuple
+import asyncio
 import inspect
-from functools import wraps
+import operator
+import weakref
+from dataclasses import dataclass
+from functools import cached_property
 from backbone.domain.ports.event_bus import BaseEvent, EventHandler, EventBus
 from ..exceptions import ApplicationException
-from backbone.infrastructure.logging.structured_logger import StructuredLogger
+
+if TYPE_CHECKING:
+    from backbone.infrastructure.logging.structured_logger import StructuredLogger
+
+_sleep = asyncio.sleep
+
+# Required event fields, resolved with a single attrgetter call
+_REQUIRED_FIELDS = ("event_id", "event_name", "source", "timestamp", "data", "metadata")
+_get_required_fields = operator.attrgetter(*_REQUIRED_FIELDS)
+
+# Required metadata keys (tuple keeps the reporting order stable)
+_REQUIRED_METADATA = ("microservice", "functionality", "correlationId")
 
 
+@dataclass(frozen=True)
 class RetryPolicy:
-    """Retry policy configuration for event handlers."""
+    """Retry policy configuration for event handlers (immutable, shareable)."""
     
-    def __init__(
-        self,
-        max_attempts: int = 3,
-        delay_seconds: int = 1,
-        exponential_backoff: bool = True,
-        max_delay_seconds: int = 60
-    ):
-        self.max_attempts = max_attempts
-        self.delay_seconds = delay_seconds
-        self.exponential_backoff = exponential_backoff
-        self.max_delay_seconds = max_delay_seconds
+    max_attempts: int = 3
+    delay_seconds: int = 1
+    exponential_backoff: bool = True
+    max_delay_seconds: int = 60
+    
+    @cached_property
+    def as_dict(self) -> Dict[str, Any]:
+        """Policy as the dict passed to EventBus.subscribe, built once per policy."""
+        return {
+            "max_attempts": self.max_attempts,
+            "delay_seconds": self.delay_seconds,
+            "exponential_backoff": self.exponential_backoff,
+            "max_delay_seconds": self.max_delay_seconds
+        }
+
+
+# Default policy shared by handlers that do not define their own
+_DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+@dataclass(slots=True, frozen=True)
+class _HandlerMeta:
+    """Registration metadata attached by event_handler to the wrapper."""
+    event_name: str
+    retry_policy: Optional[RetryPolicy]
+    dead_letter_enabled: bool
+    validate_event: bool
+    original_handler: EventHandler
 
 
 def event_handler(
@@ -34,6 +69,9 @@ def event_handler(
     """
     Decorator for event handlers with automatic logging, error handling and retry.
     
+    The decorated handler must be an async function; a TypeError is
+    raised at decoration time otherwise.
+    
     Features:
     - Automatic event validation
     - Error handling with proper exceptions
@@ -48,7 +86,14 @@ def event_handler(
             pass
     """
     def decorator(handler_func: EventHandler) -> EventHandler:
-        @wraps(handler_func)
+        # Handlers must be coroutines; checked once at decoration time
+        if not inspect.iscoroutinefunction(handler_func):
+            raise TypeError(
+                f"Event handler '{getattr(handler_func, '__name__', handler_func)}' "
+                f"for '{event_name}' must be an async function"
+            )
+        effective_policy = retry_policy or _DEFAULT_RETRY_POLICY
+        
         async def wrapper(event: BaseEvent, logger: Optional[StructuredLogger] = None) -> None:
             handler_name = handler_func.__name__
             
@@ -73,7 +118,7 @@ def event_handler(
             await _execute_with_retry(
                 handler_func,
                 event,
-                retry_policy or RetryPolicy(),
+                effective_policy,
                 handler_name,
                 logger
             )
@@ -91,12 +136,22 @@ def event_handler(
                     }
                 )
         
+        # Copy only the identity attributes the registry and logs rely on
+        # (functools.wraps would also merge __dict__ and __annotations__)
+        wrapper.__name__ = handler_func.__name__
+        wrapper.__qualname__ = handler_func.__qualname__
+        wrapper.__doc__ = handler_func.__doc__
+        wrapper.__module__ = handler_func.__module__
+        wrapper.__wrapped__ = handler_func
+        
         # Store metadata on function for registration
-        wrapper._event_name = event_name
-        wrapper._retry_policy = retry_policy
-        wrapper._dead_letter_enabled = dead_letter_enabled
-        wrapper._validate_event = validate_event
-        wrapper._original_handler = handler_func
+        wrapper._backbone_meta = _HandlerMeta(
+            event_name,
+            retry_policy,
+            dead_letter_enabled,
+            validate_event,
+            handler_func
+        )
         
         return wrapper
     
@@ -121,37 +176,39 @@ async def _validate_event(event: BaseEvent, expected_name: str, logger: Optional
             event.mark_as_failed()
             return False
         
-        # Check required fields
-        required_fields = ["event_id", "event_name", "source", "timestamp", "data", "metadata"]
-        for field in required_fields:
-            if not hasattr(event, field) or getattr(event, field) is None:
-                error_msg = f"Missing required field: {field}"
-                if logger:
-                    logger.error(
-                        error_msg,
-                        extra_data={
-                            "event_id": event.event_id,
-                            "missing_field": field
-                        }
-                    )
-                event.mark_as_failed()
-                return False
+        # Check required fields and metadata, reporting every gap in one record
+        try:
+            values = _get_required_fields(event)
+        except AttributeError:
+            values = tuple(getattr(event, field, None) for field in _REQUIRED_FIELDS)
         
-        # Check metadata structure
-        required_metadata = ["microservice", "functionality", "correlationId"]
-        for field in required_metadata:
-            if field not in event.metadata or event.metadata[field] is None:
-                error_msg = f"Missing required metadata field: {field}"
-                if logger:
-                    logger.error(
-                        error_msg,
-                        extra_data={
-                            "event_id": event.event_id,
-                            "missing_metadata": field
-                        }
-                    )
-                event.mark_as_failed()
-                return False
+        missing_fields = []
+        if any(value is None for value in values):
+            missing_fields = [
+                field for field, value in zip(_REQUIRED_FIELDS, values) if value is None
+            ]
+        
+        metadata = values[-1]
+        missing_metadata = []
+        if metadata is not None and any(
+            metadata.get(key) is None for key in _REQUIRED_METADATA
+        ):
+            missing_metadata = [
+                key for key in _REQUIRED_METADATA if metadata.get(key) is None
+            ]
+        
+        if missing_fields or missing_metadata:
+            if logger:
+                logger.error(
+                    "Event validation failed: missing required fields",
+                    extra_data={
+                        "event_id": values[0],
+                        "missing_fields": missing_fields,
+                        "missing_metadata": missing_metadata
+                    }
+                )
+            event.mark_as_failed()
+            return False
         
         return True
         
@@ -177,17 +234,16 @@ async def _execute_with_retry(
     logger: Optional[StructuredLogger]
 ) -> None:
     """Executes handler with retry policy."""
-    import asyncio
-    
     last_error = None
+    max_attempts = retry_policy.max_attempts
+    base_delay = retry_policy.delay_seconds
+    max_delay = retry_policy.max_delay_seconds
+    exponential_backoff = retry_policy.exponential_backoff
     
-    for attempt in range(retry_policy.max_attempts):
+    for attempt in range(max_attempts):
         try:
             # Execute the handler
-            if inspect.iscoroutinefunction(handler_func):
-                await handler_func(event)
-            else:
-                handler_func(event)
+            await handler_func(event)
             
             # Success - exit retry loop
             return
@@ -203,20 +259,17 @@ async def _execute_with_retry(
                         "event_id": event.event_id,
                         "handler": handler_name,
                         "attempt": attempt_num,
-                        "max_attempts": retry_policy.max_attempts,
+                        "max_attempts": max_attempts,
                         "error": str(e)
                     }
                 )
             
             # If not last attempt, wait before retry
-            if attempt_num < retry_policy.max_attempts:
-                delay = retry_policy.delay_seconds
-                
-                if retry_policy.exponential_backoff:
-                    delay = min(
-                        retry_policy.delay_seconds * (2 ** attempt),
-                        retry_policy.max_delay_seconds
-                    )
+            if attempt_num < max_attempts:
+                if exponential_backoff:
+                    delay = min(base_delay * (1 << attempt), max_delay)
+                else:
+                    delay = base_delay
                 
                 if logger:
                     logger.info(
@@ -228,14 +281,14 @@ async def _execute_with_retry(
                         }
                     )
                 
-                await asyncio.sleep(delay)
+                await _sleep(delay)
     
     # All attempts failed
     event.mark_as_failed()
     
     if logger:
         logger.error(
-            f"Event handler failed after {retry_policy.max_attempts} attempts",
+            f"Event handler failed after {max_attempts} attempts",
             extra_data={
                 "event_id": event.event_id,
                 "handler": handler_name,
@@ -249,7 +302,7 @@ async def _execute_with_retry(
     else:
         raise ApplicationException(
             code=10006001,
-            message=f"Event handler failed after {retry_policy.max_attempts} attempts: {str(last_error)}",
+            message=f"Event handler failed after {max_attempts} attempts: {str(last_error)}",
             details={
                 "operation": f"execute_event_handler_{handler_name}",
                 "original_error": str(last_error)
@@ -257,13 +310,61 @@ async def _execute_with_retry(
         )
 
 
+# Decorated handler names per class, computed once per class
+_class_handler_names: "weakref.WeakKeyDictionary[type, Tuple[str, ...]]" = weakref.WeakKeyDictionary()
+
+
+def _is_decorated_handler(raw: Any) -> bool:
+    """Checks whether a raw attribute (descriptors unresolved) is a decorated handler."""
+    return getattr(getattr(raw, "__func__", raw), "_backbone_meta", None) is not None
+
+
+def _get_class_handler_names(klass: type) -> Tuple[str, ...]:
+    """Walks the class MRO for decorated handlers without evaluating properties."""
+    names = _class_handler_names.get(klass)
+    if names is None:
+        seen = set()
+        found = []
+        for base in klass.__mro__:
+            for name, raw in base.__dict__.items():
+                if name.startswith('_') or name in seen:
+                    continue
+                seen.add(name)
+                if _is_decorated_handler(raw):
+                    found.append(name)
+        names = tuple(found)
+        _class_handler_names[klass] = names
+    return names
+
+
+def _iter_object_handlers(obj: Any) -> Iterator[Any]:
+    """Yields the decorated (bound) handlers of an object, class or module."""
+    if isinstance(obj, type):
+        for name in _get_class_handler_names(obj):
+            yield getattr(obj, name)
+        return
+    
+    instance_attrs = getattr(obj, '__dict__', {})
+    for name, raw in instance_attrs.items():
+        if not name.startswith('_') and _is_decorated_handler(raw):
+            yield raw
+    
+    for name in _get_class_handler_names(type(obj)):
+        if name not in instance_attrs:
+            yield getattr(obj, name)
+
+
 class EventHandlerRegistry:
     """Registry for automatically registering decorated event handlers."""
     
     def __init__(self, event_bus: EventBus, logger: Optional[StructuredLogger] = None):
         self.event_bus = event_bus
         self.logger = logger
-        self.registered_handlers: Dict[str, List[EventHandler]] = {}
+        # Dispatch table: tuples are replaced (copy-on-write) on every change,
+        # so readers never copy or observe a half-applied mutation.
+        self.registered_handlers: Dict[str, Tuple[EventHandler, ...]] = {}
+        # Cached name view for get_registered_handlers, reset on every change
+        self._cached_names: Optional[Dict[str, List[str]]] = None
     
     async def register_handlers(self, *handler_objects: Any) -> None:
         """
@@ -283,45 +384,29 @@ class EventHandlerRegistry:
             *handler_functions: Decorated handler functions
         """
         for handler in handler_functions:
-            if hasattr(handler, '_event_name'):
+            if hasattr(handler, '_backbone_meta'):
                 await self._register_single_handler(handler)
     
     async def _register_object_handlers(self, obj: Any) -> None:
         """Registers handlers from a specific object."""
-        for attr_name in dir(obj):
-            if attr_name.startswith('_'):
-                continue
-                
-            attr = getattr(obj, attr_name)
-            
-            if (
-                callable(attr) and
-                hasattr(attr, '_event_name') and
-                hasattr(attr, '_original_handler')
-            ):
-                # Bind method to object
-                bound_handler = attr
-                await self._register_single_handler(bound_handler)
+        for handler in _iter_object_handlers(obj):
+            if callable(handler):
+                await self._register_single_handler(handler)
     
     async def _register_single_handler(self, handler: EventHandler) -> None:
         """Registers a single decorated handler."""
-        event_name = handler._event_name
-        retry_policy_dict = None
-        
-        if handler._retry_policy:
-            retry_policy_dict = {
-                "max_attempts": handler._retry_policy.max_attempts,
-                "delay_seconds": handler._retry_policy.delay_seconds,
-                "exponential_backoff": handler._retry_policy.exponential_backoff,
-                "max_delay_seconds": handler._retry_policy.max_delay_seconds
-            }
+        meta = handler._backbone_meta
+        event_name = meta.event_name
+        retry_policy_dict = meta.retry_policy.as_dict if meta.retry_policy else None
         
         await self.event_bus.subscribe(event_name, handler, retry_policy_dict)
         
         # Track registered handlers
-        if event_name not in self.registered_handlers:
-            self.registered_handlers[event_name] = []
-        self.registered_handlers[event_name].append(handler)
+        self.registered_handlers[event_name] = (
+            *self.registered_handlers.get(event_name, ()),
+            handler
+        )
+        self._cached_names = None
         
         if self.logger:
             await self.logger.info(
@@ -340,27 +425,22 @@ class EventHandlerRegistry:
     
     async def _unregister_object_handlers(self, obj: Any) -> None:
         """Unregisters handlers from a specific object."""
-        for attr_name in dir(obj):
-            if attr_name.startswith('_'):
-                continue
-                
-            attr = getattr(obj, attr_name)
-            
-            if (
-                callable(attr) and
-                hasattr(attr, '_event_name')
-            ):
-                event_name = attr._event_name
+        for attr in _iter_object_handlers(obj):
+            if callable(attr):
+                event_name = attr._backbone_meta.event_name
                 
                 await self.event_bus.unsubscribe(event_name, attr)
                 
                 # Remove from tracking
-                if event_name in self.registered_handlers:
-                    if attr in self.registered_handlers[event_name]:
-                        self.registered_handlers[event_name].remove(attr)
-                    
-                    if not self.registered_handlers[event_name]:
+                handlers = self.registered_handlers.get(event_name)
+                if handlers is not None and attr in handlers:
+                    index = handlers.index(attr)
+                    remaining = handlers[:index] + handlers[index + 1:]
+                    if remaining:
+                        self.registered_handlers[event_name] = remaining
+                    else:
                         del self.registered_handlers[event_name]
+                    self._cached_names = None
                 
                 if self.logger:
                     await self.logger.info(
@@ -371,9 +451,24 @@ class EventHandlerRegistry:
                         }
                     )
     
+    def get_handlers(self, event_name: str) -> Tuple[EventHandler, ...]:
+        """
+        Gets the handlers registered for an event, in registration order.
+        
+        Returns the stored tuple directly (no copy).
+        """
+        return self.registered_handlers.get(event_name, ())
+    
     def get_registered_handlers(self) -> Dict[str, List[str]]:
-        """Gets list of registered handlers by event name."""
-        return {
-            event_name: [handler.__name__ for handler in handlers]
-            for event_name, handlers in self.registered_handlers.items()
-        }
\ No newline at end of file
+        """
+        Gets list of registered handlers by event name.
+        
+        The result is cached until the next register/unregister call and
+        must be treated as read-only.
+        """
+        if self._cached_names is None:
+            self._cached_names = {
+                event_name: [handler.__name__ for handler in handlers]
+                for event_name, handlers in self.registered_handlers.items()
+            }
+        return self._cached_names
\ No newline at end of file
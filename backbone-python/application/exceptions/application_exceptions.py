@@ -1,6 +1,7 @@
 """
 Application layer exceptions - Códigos 10XXXXXX
 """
+from enum import IntEnum
 from typing import Dict, Any, Optional, List
 from .base_application_exception import ApplicationException
 
@@ -14,18 +15,16 @@ class UseCaseException(ApplicationException):
     - Caso de uso de actualización fallido
     """
     
+    _DETAIL_FIELDS = (("use_case_name", "use_case"),)
+    
     def __init__(
         self,
         message: str,
         use_case_name: str,
         code: int = 10001001,
-        **kwargs
-    ):
-        details = kwargs.get('details', {})
-        details.update({"use_case": use_case_name})
-        kwargs['details'] = details
-        
-        super().__init__(code, message, **kwargs)
+        **kwargs: Any
+    ) -> None:
+        super().__init__(code, message, **self._merge_details(kwargs, use_case_name))
 
 
 class ValidationException(ApplicationException):
@@ -36,19 +35,17 @@ class ValidationException(ApplicationException):
     Estas son validaciones de casos de uso.
     """
     
+    _DETAIL_FIELDS = (("validation_errors", "validation_errors"),)
+    _SKIP_EMPTY_DETAILS = True
+    
     def __init__(
         self,
         message: str,
-        validation_errors: List[Dict[str, str]] = None,
+        validation_errors: Optional[List[Dict[str, str]]] = None,
         code: int = 10002001,
-        **kwargs
-    ):
-        details = kwargs.get('details', {})
-        if validation_errors:
-            details.update({"validation_errors": validation_errors})
-        kwargs['details'] = details
-        
-        super().__init__(code, message, http_code=400, **kwargs)
+        **kwargs: Any
+    ) -> None:
+        super().__init__(code, message, http_code=400, **self._merge_details(kwargs, validation_errors))
 
 
 class AuthorizationException(ApplicationException):
@@ -58,22 +55,24 @@ class AuthorizationException(ApplicationException):
     Usuario autenticado pero sin permisos.
     """
     
+    _DETAIL_FIELDS = (
+        ("required_permission", "required_permission"),
+        ("user_id", "user_id"),
+    )
+    _SKIP_EMPTY_DETAILS = True
+    
     def __init__(
         self,
         message: str,
-        required_permission: str = None,
-        user_id: str = None,
+        required_permission: Optional[str] = None,
+        user_id: Optional[str] = None,
         code: int = 10003001,
-        **kwargs
-    ):
-        details = kwargs.get('details', {})
-        if required_permission:
-            details.update({"required_permission": required_permission})
-        if user_id:
-            details.update({"user_id": user_id})
-        kwargs['details'] = details
-        
-        super().__init__(code, message, http_code=403, **kwargs)
+        **kwargs: Any
+    ) -> None:
+        super().__init__(
+            code, message, http_code=403,
+            **self._merge_details(kwargs, required_permission, user_id)
+        )
 
 
 class ResourceNotFoundException(ApplicationException):
@@ -81,22 +80,23 @@ class ResourceNotFoundException(ApplicationException):
     Excepción para recursos no encontrados.
     """
     
+    _DETAIL_FIELDS = (
+        ("resource_type", "resource_type"),
+        ("resource_id", "resource_id"),
+    )
+    
     def __init__(
         self,
         message: str,
         resource_type: str,
         resource_id: str,
         code: int = 10004001,
-        **kwargs
-    ):
-        details = kwargs.get('details', {})
-        details.update({
-            "resource_type": resource_type,
-            "resource_id": resource_id
-        })
-        kwargs['details'] = details
-        
-        super().__init__(code, message, http_code=404, **kwargs)
+        **kwargs: Any
+    ) -> None:
+        super().__init__(
+            code, message, http_code=404,
+            **self._merge_details(kwargs, resource_type, resource_id)
+        )
 
 
 class ResourceConflictException(ApplicationException):
@@ -108,6 +108,12 @@ class ResourceConflictException(ApplicationException):
     - Licencia ya registrada
     """
     
+    _DETAIL_FIELDS = (
+        ("resource_type", "resource_type"),
+        ("conflict_field", "conflict_field"),
+        ("conflict_value", "conflict_value"),
+    )
+    
     def __init__(
         self,
         message: str,
@@ -115,17 +121,12 @@ class ResourceConflictException(ApplicationException):
         conflict_field: str,
         conflict_value: str,
         code: int = 10005001,
-        **kwargs
-    ):
-        details = kwargs.get('details', {})
-        details.update({
-            "resource_type": resource_type,
-            "conflict_field": conflict_field,
-            "conflict_value": conflict_value
-        })
-        kwargs['details'] = details
-        
-        super().__init__(code, message, http_code=409, **kwargs)
+        **kwargs: Any
+    ) -> None:
+        super().__init__(
+            code, message, http_code=409,
+            **self._merge_details(kwargs, resource_type, conflict_field, conflict_value)
+        )
 
 
 class ApplicationServiceException(ApplicationException):
@@ -133,27 +134,30 @@ class ApplicationServiceException(ApplicationException):
     Excepción para servicios de aplicación.
     """
     
+    _DETAIL_FIELDS = (
+        ("service_name", "service_name"),
+        ("operation", "operation"),
+    )
+    
     def __init__(
         self,
         message: str,
         service_name: str,
         operation: str,
         code: int = 10006001,
-        **kwargs
-    ):
-        details = kwargs.get('details', {})
-        details.update({
-            "service_name": service_name,
-            "operation": operation
-        })
-        kwargs['details'] = details
-        
-        super().__init__(code, message, **kwargs)
+        **kwargs: Any
+    ) -> None:
+        super().__init__(code, message, **self._merge_details(kwargs, service_name, operation))
 
 
 # Catálogo de códigos de aplicación
-class ApplicationErrorCodes:
-    """Códigos de error específicos de aplicación 10XXXXXX"""
+class ApplicationErrorCodes(IntEnum):
+    """
+    Códigos de error específicos de aplicación 10XXXXXX.
+    
+    Al ser IntEnum, cada miembro sigue siendo un `int` (compatible con los
+    `code` existentes) y expone `.name` para logging.
+    """
     
     # Use Cases (10001XXX)
     USE_CASE_ERROR = 10001001
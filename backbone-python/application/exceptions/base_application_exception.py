@@ -1,7 +1,7 @@
 """
 Base Application Exception - Códigos 10XXXXXX
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Tuple
 from ...domain.exceptions.base_kernel_exception import BaseKernelException
 
 
@@ -19,15 +19,46 @@ class ApplicationException(BaseKernelException):
     - Autorización
     """
     
+    # Campos que cada subclase copia en `details`: ((parámetro, clave), ...)
+    _DETAIL_FIELDS: Tuple[Tuple[str, str], ...] = ()
+    # Si es True, los campos vacíos no se copian en `details`
+    _SKIP_EMPTY_DETAILS: bool = False
+    # Claves de `details`, precalculadas por subclase
+    _DETAIL_KEYS: Tuple[str, ...] = ()
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._DETAIL_KEYS = tuple(key for _, key in cls._DETAIL_FIELDS)
+    
     def __init__(
         self, 
         code: int, 
         message: str, 
         http_code: int = 422,
-        **kwargs
-    ):
+        **kwargs: Any
+    ) -> None:
         # Acepta códigos legacy 10XXXXXX y nuevos 9-dígitos 12XXXXXXX (Application layer)
-        if not ((10000000 <= code <= 10999999) or (120000000 <= code <= 129999999)):
+        if code // 1000000 != 10 and code // 10000000 != 12:
             raise ValueError(f"Application exception code must be in range 10000000-10999999 or 120000000-129999999, got: {code}")
         
-        super().__init__(code, message, http_code, **kwargs)
\ No newline at end of file
+        # Ambos sub-rangos caen dentro del rango general del kernel
+        super().__init__(code, message, http_code, _skip_validation=True, **kwargs)
+    
+    @classmethod
+    def _merge_details(cls, kwargs: Dict[str, Any], *values: Any) -> Dict[str, Any]:
+        """
+        Copia los valores de `_DETAIL_FIELDS` en `kwargs['details']`.
+        
+        Args:
+            kwargs: Argumentos extra recibidos por la subclase
+            *values: Valores en el mismo orden que `_DETAIL_FIELDS`
+            
+        Returns:
+            Los mismos kwargs con `details` actualizado (sin mutar el dict original)
+        """
+        details = dict(kwargs.get('details') or {})
+        for key, value in zip(cls._DETAIL_KEYS, values):
+            if value or not cls._SKIP_EMPTY_DETAILS:
+                details[key] = value
+        kwargs['details'] = details
+        return kwargs
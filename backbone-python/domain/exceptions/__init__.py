@@ -1,18 +1,45 @@
 """
 Domain layer exceptions - Códigos 11XXXXXX
 """
-from .base_kernel_exception import BaseKernelException
-from .domain_exceptions import (
-    DomainException,
-    BusinessRuleViolationException,
-    InvalidEntityStateException,
-    InvalidValueObjectException,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base_kernel_exception import BaseKernelException
+    from .domain_exceptions import DomainException, BusinessRuleViolationException, InvalidEntityStateException, InvalidValueObjectException, DomainErrorCodes
+
+# Las clases se importan al accederlas; así importar solo base_kernel_exception
+# (p. ej. desde application.exceptions) no carga las excepciones de dominio.
+_EXPORTS = {
+    "BaseKernelException": ".base_kernel_exception",
+    "DomainException": ".domain_exceptions",
+    "BusinessRuleViolationException": ".domain_exceptions",
+    "InvalidEntityStateException": ".domain_exceptions",
+    "InvalidValueObjectException": ".domain_exceptions",
+    "DomainErrorCodes": ".domain_exceptions",
+}
 
 __all__ = [
     "BaseKernelException",
-    "DomainException", 
+    "DomainException",
     "BusinessRuleViolationException",
     "InvalidEntityStateException",
     "InvalidValueObjectException",
-]
\ No newline at end of file
+    "DomainErrorCodes",
+]
+
+
+def __getattr__(name: str):
+    """Importa perezosamente las excepciones de dominio (PEP 562)."""
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
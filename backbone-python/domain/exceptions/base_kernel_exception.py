@@ -1,9 +1,69 @@
 """
 Base Kernel Exception - Excepción base para todo el sistema backbone
 """
-import uuid
+import os
+import threading
+import time
+from functools import cached_property
 from typing import Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
+
+
+class _RidPool:
+    """
+    Pool de entropía para generar identificadores sin una syscall por llamada.
+
+    Lee _SIZE bytes de os.urandom de una vez y entrega ventanas de 16 bytes.
+    """
+
+    _SIZE = 4096
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buf = bytearray()
+        self._pos = self._SIZE
+
+    def take(self, n: int = 16) -> bytearray:
+        """Devuelve `n` bytes aleatorios (n <= _SIZE)."""
+        with self._lock:
+            if self._pos + n > self._SIZE:
+                self._buf = bytearray(os.urandom(self._SIZE))
+                self._pos = 0
+            pos = self._pos
+            self._pos = pos + n
+            return self._buf[pos:pos + n]
+
+    def next_rid(self) -> str:
+        """Devuelve 32 caracteres hex aleatorios (mismo formato que uuid4().hex)."""
+        return self.take().hex()
+
+    def next_uuid(self) -> str:
+        """Devuelve un UUID v4 en formato canónico 8-4-4-4-12."""
+        raw = self.take()
+        raw[6] = (raw[6] & 0x0F) | 0x40
+        raw[8] = (raw[8] & 0x3F) | 0x80
+        h = raw.hex()
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+    def reset(self) -> None:
+        """Descarta el buffer actual (usado tras fork para no repetir IDs)."""
+        self._lock = threading.Lock()
+        self._pos = self._SIZE
+
+
+_RID_POOL = _RidPool()
+
+# Código de capa (primeros 2 dígitos) -> nombre de la capa
+_LAYER_NAMES: Dict[int, str] = {
+    10: "Application",
+    11: "Domain",
+    12: "Infrastructure",
+    13: "Presentation",
+    14: "Security",
+}
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_RID_POOL.reset)
 
 
 class BaseKernelException(Exception):
@@ -23,6 +83,10 @@ class BaseKernelException(Exception):
         raise ApplicationException(10001001, "Usuario no encontrado")
     """
     
+    # BaseException ya aporta __dict__ (lo usa el cached_property `timestamp`);
+    # los slots convierten los campos fijos en descriptores de acceso directo.
+    __slots__ = ('code', 'message', 'http_code', 'details', 'rid', 'internal_data', '_ts')
+    
     def __init__(
         self,
         code: int,
@@ -30,7 +94,9 @@ class BaseKernelException(Exception):
         http_code: int = 500,
         details: Optional[Dict[str, Any]] = None,
         rid: Optional[str] = None,
-        internal_data: Optional[Dict[str, Any]] = None
+        internal_data: Optional[Dict[str, Any]] = None,
+        extra_details: Optional[Dict[str, Any]] = None,
+        _skip_validation: bool = False
     ):
         """
         Inicializa una excepción del kernel.
@@ -42,25 +108,37 @@ class BaseKernelException(Exception):
             details: Información adicional (NO se envía al cliente)
             rid: Request ID para trazabilidad (se genera si no se provee)
             internal_data: Datos internos para debugging (solo logs)
+            extra_details: Campos fijos de la subclase que se combinan con
+                `details` en un dict nuevo (el del llamador no se modifica)
+            _skip_validation: Uso interno; las subclases que ya validaron su
+                sub-rango evitan repetir la comprobación del rango general
         """
         self.code = code
         self.message = message
         self.http_code = http_code
+        if extra_details:
+            details = {**details, **extra_details} if details else extra_details
         self.details = details or {}
         self.rid = rid or self._generate_rid()
         self.internal_data = internal_data or {}
-        self.timestamp = datetime.utcnow().isoformat()
+        # Solo se guarda el instante; el ISO string se formatea al leer `timestamp`
+        self._ts = time.time()
         
         # Validar código de 8 o 9 dígitos (formato LL_NNNNNNN)
-        if not (10000000 <= code <= 999999999):
+        if not _skip_validation and not (10000000 <= code <= 999999999):
             raise ValueError(f"Error code must be 8 or 9 digits, got: {code}")
         
         super().__init__(message)
     
+    @cached_property
+    def timestamp(self) -> str:
+        """Momento de creación en ISO 8601 (UTC, sin offset), formateado bajo demanda."""
+        return datetime.fromtimestamp(self._ts, tz=timezone.utc).replace(tzinfo=None).isoformat()
+    
     @staticmethod
     def _generate_rid() -> str:
         """Genera un Request ID único para trazabilidad."""
-        return uuid.uuid4().hex
+        return _RID_POOL.next_rid()
     
     def to_error_contract(self) -> Dict[str, Any]:
         """
@@ -93,6 +171,7 @@ class BaseKernelException(Exception):
         Returns:
             Dict con información completa para logs
         """
+        layer_code = self.code // 1000000
         return {
             # Campos públicos
             "rid": self.rid,
@@ -102,8 +181,8 @@ class BaseKernelException(Exception):
             # Campos internos (solo para logs)
             "httpCode": self.http_code,
             "timestamp": self.timestamp,
-            "layer_code": self.layer_code,
-            "layer_name": self.layer_name,
+            "layer_code": layer_code,
+            "layer_name": _LAYER_NAMES.get(layer_code, "Unknown"),
             "details": self.details,
             "internal_data": self.internal_data,
             "exception_type": self.__class__.__name__
@@ -117,14 +196,7 @@ class BaseKernelException(Exception):
     @property 
     def layer_name(self) -> str:
         """Nombre de la capa basado en el código."""
-        layer_map = {
-            10: "Application",
-            11: "Domain", 
-            12: "Infrastructure",
-            13: "Presentation",
-            14: "Security"
-        }
-        return layer_map.get(self.layer_code, "Unknown")
+        return _LAYER_NAMES.get(self.code // 1000000, "Unknown")
     
     @property
     def specific_code(self) -> int:
@@ -1,6 +1,7 @@
 """
 Domain layer exceptions - Códigos 11XXXXXX
 """
+from enum import IntEnum
 from typing import Dict, Any, Optional
 from .base_kernel_exception import BaseKernelException
 
@@ -23,10 +24,51 @@ class DomainException(BaseKernelException):
         **kwargs
     ):
         # Validar que el código pertenezca a la capa de dominio
-        if not (11000000 <= code <= 11999999):
+        if code // 1000000 != 11:
             raise ValueError(f"Domain exception code must be in range 11000000-11999999, got: {code}")
         
-        super().__init__(code, message, http_code, **kwargs)
+        # El sub-rango 11XXXXXX ya cae dentro del rango general del kernel
+        super().__init__(code, message, http_code, _skip_validation=True, **kwargs)
+    
+    @classmethod
+    def from_code(
+        cls,
+        code: "DomainErrorCodes",
+        message: str,
+        **kwargs
+    ) -> "DomainException":
+        """
+        Construye la excepción a partir de un código del catálogo.
+        
+        El HTTP se toma de la tabla precalculada. Un código 11XXXXXX fuera
+        del catálogo usa el HTTP por defecto (400) y uno fuera del rango de
+        dominio lanza ValueError, igual que el constructor.
+        
+        Las subclases con campos propios (rule_name, entity_type...) deben
+        construirse con su constructor.
+        
+        Args:
+            code: Miembro de DomainErrorCodes (o código 11XXXXXX)
+            message: Mensaje para el usuario final
+            **kwargs: details, rid, internal_data
+            
+        Returns:
+            Excepción con el HTTP correspondiente al código
+            
+        Raises:
+            ValueError: Si el código no pertenece a la capa de dominio
+        """
+        http_code = _DOMAIN_HTTP_CODES.get(code)
+        if http_code is None:
+            if code // 1000000 != 11:
+                raise ValueError(f"Domain exception code must be in range 11000000-11999999, got: {code}")
+            http_code = 400
+        
+        exception = cls.__new__(cls)
+        BaseKernelException.__init__(
+            exception, code, message, http_code, _skip_validation=True, **kwargs
+        )
+        return exception
 
 
 class BusinessRuleViolationException(DomainException):
@@ -46,11 +88,7 @@ class BusinessRuleViolationException(DomainException):
         code: int = 11001001,
         **kwargs
     ):
-        details = kwargs.get('details', {})
-        details.update({"rule_violated": rule_name})
-        kwargs['details'] = details
-        
-        super().__init__(code, message, **kwargs)
+        super().__init__(code, message, extra_details={"rule_violated": rule_name}, **kwargs)
 
 
 class InvalidEntityStateException(DomainException):
@@ -73,16 +111,18 @@ class InvalidEntityStateException(DomainException):
         code: int = 11002001,
         **kwargs
     ):
-        details = kwargs.get('details', {})
-        details.update({
-            "entity_type": entity_type,
-            "entity_id": entity_id,
-            "current_state": current_state,
-            "required_state": required_state
-        })
-        kwargs['details'] = details
-        
-        super().__init__(code, message, http_code=412, **kwargs)
+        super().__init__(
+            code,
+            message,
+            http_code=412,
+            extra_details={
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "current_state": current_state,
+                "required_state": required_state
+            },
+            **kwargs
+        )
 
 
 class InvalidValueObjectException(DomainException):
@@ -103,19 +143,26 @@ class InvalidValueObjectException(DomainException):
         code: int = 11003001,
         **kwargs
     ):
-        details = kwargs.get('details', {})
-        details.update({
-            "value_object_type": value_object_type,
-            "invalid_value": str(invalid_value)
-        })
-        kwargs['details'] = details
-        
-        super().__init__(code, message, **kwargs)
+        super().__init__(
+            code,
+            message,
+            extra_details={
+                "value_object_type": value_object_type,
+                # Los str (email, teléfono...) se guardan tal cual, sin llamar a str()
+                "invalid_value": invalid_value if type(invalid_value) is str else str(invalid_value)
+            },
+            **kwargs
+        )
 
 
 # Catálogo de códigos de dominio
-class DomainErrorCodes:
-    """Códigos de error específicos del dominio 11XXXXXX"""
+class DomainErrorCodes(IntEnum):
+    """
+    Códigos de error específicos del dominio 11XXXXXX.
+    
+    Al ser IntEnum, cada miembro sigue siendo un `int` y permite la
+    búsqueda inversa: DomainErrorCodes(11001002).name == "UNDERAGE_USER".
+    """
     
     # Business Rules (11001XXX)
     BUSINESS_RULE_VIOLATION = 11001001
@@ -147,4 +194,11 @@ class DomainErrorCodes:
     # Domain Services (11005XXX)
     DOMAIN_SERVICE_ERROR = 11005001
     DISTANCE_CALCULATION_ERROR = 11005002
-    PRICE_CALCULATION_ERROR = 11005003
\ No newline at end of file
+    PRICE_CALCULATION_ERROR = 11005003
+
+
+# Código -> HTTP, resuelto una vez al importar (estados de entidad: 412)
+_DOMAIN_HTTP_CODES: Dict[int, int] = {
+    code: 412 if code // 1000 == 11002 else 400
+    for code in DomainErrorCodes
+}
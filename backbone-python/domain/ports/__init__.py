@@ -1,14 +1,46 @@
 """
 Domain Ports - Interfaces for external dependencies in Clean Architecture
 """
-from .event_bus import EventBus, EventStore, BaseEvent, DomainEvent, IntegrationEvent, SystemEvent, EventHandler
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .event_bus import EventBus, EventStore, BaseEvent, DomainEvent, IntegrationEvent, SystemEvent, EventHandler
+
+# Names are imported on first access, so importing a sibling module such as
+# ._ids does not load the whole event_bus module.
+_EXPORTS = {
+    "EventBus": ".event_bus",
+    "EventStore": ".event_bus",
+    "BaseEvent": ".event_bus",
+    "DomainEvent": ".event_bus",
+    "IntegrationEvent": ".event_bus",
+    "SystemEvent": ".event_bus",
+    "EventHandler": ".event_bus",
+}
 
 __all__ = [
     "EventBus",
-    "EventStore", 
+    "EventStore",
     "BaseEvent",
     "DomainEvent",
     "IntegrationEvent",
     "SystemEvent",
-    "EventHandler"
-]
\ No newline at end of file
+    "EventHandler",
+]
+
+
+def __getattr__(name: str):
+    """Lazily import the event bus ports (PEP 562)."""
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
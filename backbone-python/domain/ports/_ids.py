@@ -0,0 +1,80 @@
+"""
+Generación de identificadores para eventos.
+
+Por defecto se usan ULIDs: 48 bits de timestamp en milisegundos + 80 bits
+aleatorios, codificados en Crockford base32 (26 caracteres). Ordenan
+lexicográficamente por fecha de creación, lo que mejora la localidad de
+índices en los event stores.
+
+Para consumidores que requieren RFC 4122, definir
+BACKBONE_EVENT_ID_FORMAT=uuid4 en el entorno.
+"""
+import os
+import time
+from base64 import b32encode
+from typing import List
+
+from ..exceptions.base_kernel_exception import _RID_POOL
+
+# Alfabeto base32 estándar -> alfabeto Crockford (sin I, L, O, U)
+_CROCKFORD = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567",
+    b"0123456789ABCDEFGHJKMNPQRSTVWXYZ",
+)
+
+_UUID4_IDS = os.environ.get("BACKBONE_EVENT_ID_FORMAT", "ulid").lower() == "uuid4"
+
+
+def new_ulid() -> str:
+    """
+    Genera un ULID.
+
+    Los 128 bits se desplazan 6 bits a la izquierda para ocupar 17 bytes
+    alineados a 5 bits; los primeros 26 caracteres de b32encode son el ULID.
+
+    Returns:
+        ULID de 26 caracteres
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(_RID_POOL.take(10), "big")
+    return b32encode((value << 6).to_bytes(17, "big"))[:26].translate(_CROCKFORD).decode("ascii")
+
+
+def new_ulids(count: int) -> List[str]:
+    """
+    Genera `count` ULIDs con una única lectura del reloj.
+
+    Args:
+        count: Número de IDs
+
+    Returns:
+        Lista de ULIDs que comparten el prefijo de timestamp
+    """
+    prefix = (time.time_ns() // 1_000_000) << 80
+    take = _RID_POOL.take
+    return [
+        b32encode(((prefix | int.from_bytes(take(10), "big")) << 6).to_bytes(17, "big"))[:26]
+        .translate(_CROCKFORD).decode("ascii")
+        for _ in range(count)
+    ]
+
+
+def new_ids(count: int) -> List[str]:
+    """Genera `count` IDs en el formato configurado (ULID o UUID4)."""
+    if _UUID4_IDS:
+        next_uuid = _RID_POOL.next_uuid
+        return [next_uuid() for _ in range(count)]
+    return new_ulids(count)
+
+
+def new_event_id() -> str:
+    """ID por defecto para BaseEvent.event_id."""
+    if _UUID4_IDS:
+        return _RID_POOL.next_uuid()
+    return new_ulid()
+
+
+def new_correlation_id() -> str:
+    """ID por defecto para metadata["correlationId"]."""
+    if _UUID4_IDS:
+        return _RID_POOL.next_uuid()
+    return new_ulid()
@@ -1,10 +1,28 @@
 """
 Event Bus Port - Domain contract for event publishing and subscription
 """
+import json
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Callable, Optional, Awaitable
 from datetime import datetime, timezone
 
+from ._ids import new_event_id, new_correlation_id, new_ids
+
+try:
+    import orjson
+    _orjson_available = True
+except ImportError:
+    _orjson_available = False
+
+_utcnow = datetime.now
+_UTC = timezone.utc
+
+# BaseEvent.__init__ keyword arguments accepted by BaseEvent.make_batch
+_EVENT_INIT_PARAMS = frozenset((
+    "event_name", "source", "data", "microservice", "functionality",
+    "correlation_id", "event_version", "event_id",
+))
+
 EventHandler = Callable[['BaseEvent'], Awaitable[None]]
 
 
@@ -14,7 +32,7 @@ class BaseEvent:
     
     Format:
     {
-        "eventId": "uuid",
+        "eventId": "ulid",
         "eventName": "UserCreated", 
         "eventVersion": "1.0",
         "source": "industrial_prom",
@@ -23,7 +41,7 @@ class BaseEvent:
         "metadata": {
             "microservice": "users-service",
             "functionality": "create-user", 
-            "correlationId": "uuid"
+            "correlationId": "ulid"
         },
         "createdAt": "ISO8601",
         "updatedAt": "ISO8601", 
@@ -31,6 +49,11 @@ class BaseEvent:
     }
     """
     
+    __slots__ = (
+        "event_id", "event_name", "event_version", "source", "timestamp",
+        "data", "metadata", "created_at", "updated_at", "status",
+    )
+    
     def __init__(
         self,
         event_name: str,
@@ -42,61 +65,119 @@ class BaseEvent:
         event_version: str = "1.0",
         event_id: Optional[str] = None
     ):
-        from uuid import uuid4
-        from datetime import datetime, timezone
-        
-        self.event_id = event_id or str(uuid4())
+        self.event_id = event_id or new_event_id()
         self.event_name = event_name
         self.event_version = event_version
         self.source = source
-        self.timestamp = datetime.now(timezone.utc)
+        # datetime is immutable: read the clock once and share it
+        self.timestamp = self.created_at = self.updated_at = _utcnow(_UTC)
         self.data = data
         self.metadata = {
             "microservice": microservice,
             "functionality": functionality,
-            "correlationId": correlation_id or str(uuid4())
+            "correlationId": correlation_id or new_correlation_id()
         }
-        self.created_at = datetime.now(timezone.utc)
-        self.updated_at = datetime.now(timezone.utc)
         self.status = "created"
     
+    @classmethod
+    def make_batch(cls, specs: List[Dict[str, Any]]) -> List['BaseEvent']:
+        """
+        Builds several events at once, e.g. before EventBus.publish_batch.
+        
+        All events share a single clock read and their default ids are
+        generated in one pass, instead of per-event. Each spec holds the
+        constructor keyword arguments.
+        
+        Args:
+            specs: List of constructor kwargs, one per event
+            
+        Returns:
+            List of events in the same order as specs
+            
+        Raises:
+            TypeError: If the class overrides __init__ (use the constructor),
+                or a spec has a key the constructor does not accept
+        """
+        if cls.__init__ is not BaseEvent.__init__:
+            raise TypeError(f"{cls.__name__} overrides __init__; build its events with the constructor")
+        
+        now = _utcnow(_UTC)
+        ids = iter(new_ids(2 * len(specs)))
+        new = cls.__new__
+        events = []
+        for spec in specs:
+            if not _EVENT_INIT_PARAMS.issuperset(spec):
+                unexpected = ", ".join(sorted(set(spec) - _EVENT_INIT_PARAMS))
+                raise TypeError(f"make_batch() got unexpected event arguments: {unexpected}")
+            event = new(cls)
+            event.event_id = spec.get("event_id") or next(ids)
+            event.event_name = spec["event_name"]
+            event.event_version = spec.get("event_version", "1.0")
+            event.source = spec["source"]
+            event.timestamp = event.created_at = event.updated_at = now
+            event.data = spec["data"]
+            event.metadata = {
+                "microservice": spec["microservice"],
+                "functionality": spec["functionality"],
+                "correlationId": spec.get("correlation_id") or next(ids)
+            }
+            event.status = "created"
+            events.append(event)
+        return events
+    
     def mark_as_published(self) -> None:
         """Marks event as published."""
-        from datetime import datetime, timezone
         self.status = "published"
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _utcnow(_UTC)
     
     def mark_as_failed(self) -> None:
         """Marks event as failed."""
-        from datetime import datetime, timezone
         self.status = "failed"
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _utcnow(_UTC)
     
     def mark_as_processed(self) -> None:
         """Marks event as processed."""
-        from datetime import datetime, timezone
         self.status = "processed"
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _utcnow(_UTC)
     
     def to_dict(self) -> Dict[str, Any]:
         """Converts event to dictionary."""
+        # Until the first status change all three timestamps are the same
+        # object, so each distinct datetime is formatted only once.
+        timestamp = self.timestamp
+        created_at = self.created_at
+        updated_at = self.updated_at
+        timestamp_iso = timestamp.isoformat()
+        created_iso = timestamp_iso if created_at is timestamp else created_at.isoformat()
+        updated_iso = created_iso if updated_at is created_at else updated_at.isoformat()
         return {
             "eventId": self.event_id,
             "eventName": self.event_name,
             "eventVersion": self.event_version,
             "source": self.source,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": timestamp_iso,
             "data": self.data,
             "metadata": self.metadata,
-            "createdAt": self.created_at.isoformat(),
-            "updatedAt": self.updated_at.isoformat(),
+            "createdAt": created_iso,
+            "updatedAt": updated_iso,
             "status": self.status
         }
     
     def to_json(self) -> str:
-        """Converts event to JSON string."""
-        import json
-        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+        """
+        Converts event to a compact JSON string.
+        
+        Uses orjson when installed, falling back to the stdlib encoder.
+        """
+        data = self.to_dict()
+        if _orjson_available:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+            except TypeError:
+                # orjson.JSONEncodeError, e.g. ints beyond 64 bits: the
+                # stdlib encoder handles them
+                pass
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
     
     def is_valid(self) -> bool:
         """
@@ -105,17 +186,20 @@ class BaseEvent:
         Returns:
             True if event is valid
         """
-        return all([
-            self.event_name,
-            self.source,
-            self.metadata.get("microservice"),
-            self.metadata.get("functionality")
-        ])
+        metadata = self.metadata
+        return bool(
+            self.event_name
+            and self.source
+            and metadata.get("microservice")
+            and metadata.get("functionality")
+        )
 
 
 class DomainEvent(BaseEvent):
     """Domain event for business logic changes."""
     
+    __slots__ = ("aggregate_id", "aggregate_type", "aggregate_version", "event_type")
+    
     def __init__(
         self,
         event_name: str,
@@ -144,20 +228,21 @@ class DomainEvent(BaseEvent):
         self.event_type = "domain"
         
         # Add to metadata
-        self.metadata.update({
-            "eventType": "domain"
-        })
+        metadata = self.metadata
+        metadata["eventType"] = "domain"
         if aggregate_id:
-            self.metadata["aggregateId"] = aggregate_id
+            metadata["aggregateId"] = aggregate_id
         if aggregate_type:
-            self.metadata["aggregateType"] = aggregate_type
+            metadata["aggregateType"] = aggregate_type
         if aggregate_version is not None:
-            self.metadata["aggregateVersion"] = aggregate_version
+            metadata["aggregateVersion"] = aggregate_version
 
 
 class IntegrationEvent(BaseEvent):
     """Integration event for cross-microservice communication."""
     
+    __slots__ = ("target_services", "event_type")
+    
     def __init__(
         self,
         event_name: str,
@@ -181,15 +266,16 @@ class IntegrationEvent(BaseEvent):
         self.target_services = target_services
         self.event_type = "integration"
         
-        self.metadata.update({
-            "targetServices": target_services,
-            "eventType": "integration"
-        })
+        metadata = self.metadata
+        metadata["targetServices"] = target_services
+        metadata["eventType"] = "integration"
 
 
 class SystemEvent(BaseEvent):
     """System event for infrastructure/operational concerns."""
     
+    __slots__ = ("severity", "system_component", "event_type")
+    
     def __init__(
         self,
         event_name: str,
@@ -215,12 +301,11 @@ class SystemEvent(BaseEvent):
         self.system_component = system_component
         self.event_type = "system"
         
-        self.metadata.update({
-            "severity": severity,
-            "eventType": "system"
-        })
+        metadata = self.metadata
+        metadata["severity"] = severity
+        metadata["eventType"] = "system"
         if system_component:
-            self.metadata["systemComponent"] = system_component
+            metadata["systemComponent"] = system_component
 
 
 class EventBus(ABC):
@@ -1,13 +1,48 @@
 """
 Domain Repositories - Contratos de repositorio (puertos)
 """
-from .base_repository import IRepository, IReadOnlyRepository
-from .unit_of_work import IUnitOfWork
-from .query_builder import QueryBuilder
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base_repository import IRepository, IReadOnlyRepository
+    from .unit_of_work import IUnitOfWork, UnitOfWorkFullError
+    from .query_builder import QueryBuilder, JoinSpec, JoinType
+
+# Los contratos se importan al accederlos (query_builder no se carga si
+# solo se usan los repositorios).
+_EXPORTS = {
+    "IRepository": ".base_repository",
+    "IReadOnlyRepository": ".base_repository",
+    "IUnitOfWork": ".unit_of_work",
+    "UnitOfWorkFullError": ".unit_of_work",
+    "QueryBuilder": ".query_builder",
+    "JoinSpec": ".query_builder",
+    "JoinType": ".query_builder",
+}
 
 __all__ = [
     "IRepository",
-    "IReadOnlyRepository", 
+    "IReadOnlyRepository",
     "IUnitOfWork",
+    "UnitOfWorkFullError",
     "QueryBuilder",
-]
\ No newline at end of file
+    "JoinSpec",
+    "JoinType",
+]
+
+
+def __getattr__(name: str):
+    """Importa perezosamente los contratos de repositorio (PEP 562)."""
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
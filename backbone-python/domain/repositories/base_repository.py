@@ -131,6 +131,10 @@ class IRepository(IReadOnlyRepository[T, ID]):
         """
         Guarda múltiples entidades.
         
+        Los adaptadores deben usar la operación masiva nativa de su motor
+        (add_all + flush, bulk_write, etc.). Los que no la tengan pueden
+        heredar de SequentialSaveAllMixin.
+        
         Args:
             entities: Lista de entidades a guardar
             
@@ -232,7 +236,16 @@ class BaseReadOnlyRepository(IReadOnlyRepository[T, ID]):
     los adaptadores específicos (SQLAlchemy, MongoDB, etc.)
     """
     
-    def __init__(self, entity_class: type):
+    # Las subclases ligadas a una sola entidad pueden fijarla aquí
+    # en lugar de pasarla en cada instanciación
+    ENTITY_CLASS: Optional[type] = None
+    
+    def __init__(self, entity_class: Optional[type] = None):
+        entity_class = entity_class or self.ENTITY_CLASS
+        if entity_class is None:
+            raise TypeError(
+                f"{type(self).__name__} requires entity_class or a class-level ENTITY_CLASS"
+            )
         self.entity_class = entity_class
     
     async def exists_by_specification(self, spec: Specification[T]) -> bool:
@@ -244,20 +257,50 @@ class BaseReadOnlyRepository(IReadOnlyRepository[T, ID]):
 class BaseRepository(BaseReadOnlyRepository[T, ID], IRepository[T, ID]):
     """
     Clase base para implementaciones de repositorio completo.
+    
+    `save_all` no tiene implementación por defecto: cada adaptador
+    debe exponer su operación masiva nativa.
     """
     
-    async def save_all(self, entities: List[T]) -> List[T]:
-        """Implementación por defecto usando save individual."""
-        saved_entities = []
-        for entity in entities:
-            saved_entity = await self.save(entity)
-            saved_entities.append(saved_entity)
-        return saved_entities
+    async def _save_all_sequential(self, entities: List[T]) -> List[T]:
+        """Guarda las entidades una a una con `save` (un round trip por entidad)."""
+        return [await self.save(entity) for entity in entities]
     
-    async def delete_by_id(self, entity_id: ID) -> bool:
-        """Implementación por defecto usando find + delete."""
+    async def _delete_by_id_native(self, entity_id: ID) -> int:
+        """
+        Elimina por ID y retorna cuántas entidades se eliminaron.
+        
+        Por defecto usa find + delete (dos round trips); los adaptadores
+        con borrado nativo (DELETE ... WHERE id = ?) lo sobrescriben.
+        
+        Args:
+            entity_id: ID de la entidad
+            
+        Returns:
+            Número de entidades eliminadas
+        """
         entity = await self.find_by_id(entity_id)
         if entity:
             await self.delete(entity)
-            return True
-        return False
\ No newline at end of file
+            return 1
+        return 0
+    
+    async def delete_by_id(self, entity_id: ID) -> bool:
+        """Elimina por ID con la operación nativa del adaptador si existe."""
+        return await self._delete_by_id_native(entity_id) > 0
+
+
+class SequentialSaveAllMixin:
+    """
+    Mixin para adaptadores sin operación masiva nativa.
+    
+    Implementa `save_all` llamando a `save` por cada entidad.
+    Debe ir antes de BaseRepository en la lista de bases:
+    
+        class InMemoryRepository(SequentialSaveAllMixin, BaseRepository[T, ID]):
+            ...
+    """
+    
+    async def save_all(self, entities: List[T]) -> List[T]:
+        """Guarda múltiples entidades secuencialmente."""
+        return await self._save_all_sequential(entities)
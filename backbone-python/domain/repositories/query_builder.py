@@ -1,10 +1,41 @@
 """
 Query Builder - Constructor de queries abstrato
 """
-from typing import Dict, Any, List, Optional, Union
-from ..specifications.base_specification import Specification
+from enum import IntEnum
+from hashlib import blake2b
+from operator import attrgetter
+from typing import Callable, Dict, Any, List, NamedTuple, Optional, Tuple, Union
+from ..specifications.base_specification import Specification, AndSpecification
+from ..specifications.filter_specification import (
+    FilterSpecification,
+    EqualSpecification,
+    InSpecification,
+    IsNullSpecification,
+    IsNotNullSpecification,
+)
 from ..specifications.sort_specification import MultipleSortSpecification
 
+_selectivity = attrgetter("selectivity_hint")
+
+
+def _accept_all(candidate: Any) -> bool:
+    return True
+
+
+class JoinType(IntEnum):
+    """Tipos de JOIN soportados."""
+    INNER = 0
+    LEFT = 1
+    RIGHT = 2
+    OUTER = 3
+
+
+class JoinSpec(NamedTuple):
+    """Definición inmutable de un JOIN."""
+    entity_type: type
+    condition: str
+    join_type: JoinType
+
 
 class QueryBuilder:
     """
@@ -17,12 +48,17 @@ class QueryBuilder:
     
     def __init__(self, entity_type: type):
         self.entity_type = entity_type
-        self._filters: List[Specification] = []
+        # Tuplas inmutables: clone() comparte la estructura sin copiarla
+        self._filters: Tuple[Specification, ...] = ()
         self._sorts: Optional[MultipleSortSpecification] = None
         self._limit: Optional[int] = None
         self._offset: Optional[int] = None
-        self._select_fields: Optional[List[str]] = None
-        self._joins: List[Dict[str, Any]] = []
+        self._select_fields: Optional[Tuple[str, ...]] = None
+        self._joins: Tuple[JoinSpec, ...] = ()
+        # Derivados de _filters, se invalidan al cambiar los filtros
+        self._predicate: Optional[Callable[[Any], bool]] = None
+        self._canonical: Optional[Tuple[Tuple[Specification, ...], bool]] = None
+        self._filter_exprs: Optional[Tuple[Any, ...]] = None
     
     def filter(self, spec: Specification) -> 'QueryBuilder':
         """
@@ -34,7 +70,10 @@ class QueryBuilder:
         Returns:
             Self para method chaining
         """
-        self._filters.append(spec)
+        self._filters += (spec,)
+        self._predicate = None
+        self._canonical = None
+        self._filter_exprs = None
         return self
     
     def sort(self, sort_spec: MultipleSortSpecification) -> 'QueryBuilder':
@@ -86,14 +125,14 @@ class QueryBuilder:
         Returns:
             Self para method chaining
         """
-        self._select_fields = fields
+        self._select_fields = tuple(fields)
         return self
     
     def join(
         self, 
         entity_type: type, 
         condition: str,
-        join_type: str = "inner"
+        join_type: Union[str, JoinType] = JoinType.INNER
     ) -> 'QueryBuilder':
         """
         Agrega un JOIN.
@@ -101,16 +140,20 @@ class QueryBuilder:
         Args:
             entity_type: Tipo de entidad a joinear
             condition: Condición del join
-            join_type: Tipo de join (inner, left, right, outer)
+            join_type: Tipo de join (JoinType o inner, left, right, outer)
             
         Returns:
             Self para method chaining
+            
+        Raises:
+            ValueError: Si el tipo de join no es válido
         """
-        self._joins.append({
-            "entity_type": entity_type,
-            "condition": condition,
-            "join_type": join_type
-        })
+        if not isinstance(join_type, JoinType):
+            try:
+                join_type = JoinType[join_type.upper()]
+            except KeyError:
+                raise ValueError(f"Invalid join type: {join_type}") from None
+        self._joins += (JoinSpec(entity_type, condition, join_type),)
         return self
     
     def paginate(self, page: int, page_size: int) -> 'QueryBuilder':
@@ -138,16 +181,160 @@ class QueryBuilder:
         Returns:
             Dict con la definición de la query
         """
+        filters, empty = self._canonical_filters()
+        filter_exprs = self._filter_exprs
+        if filter_exprs is None:
+            filter_exprs = self._filter_exprs = tuple(f.to_expression() for f in filters)
         return {
             "entity_type": self.entity_type,
-            "filters": [f.to_expression() for f in self._filters],
+            "filters": filter_exprs,
+            # True si los filtros son contradictorios: el adaptador puede
+            # devolver un resultado vacío sin consultar la base de datos
+            "empty": empty,
             "sorts": self._sorts.to_expression() if self._sorts else None,
             "limit": self._limit,
             "offset": self._offset,
-            "select_fields": self._select_fields,
+            "select_fields": list(self._select_fields) if self._select_fields is not None else None,
             "joins": self._joins
         }
     
+    def _canonical_filters(self) -> Tuple[Tuple[Specification, ...], bool]:
+        """
+        Filtros canónicos en orden de emisión y flag de contradicción.
+        
+        Los filtros se combinan con AND: se emiten primero los más selectivos
+        para que los adaptadores cortocircuiten antes (sort estable). Se
+        calcula una vez y se reutiliza entre páginas.
+        """
+        canonical = self._canonical
+        if canonical is None:
+            filters, empty = self._canonicalize()
+            canonical = self._canonical = (tuple(sorted(filters, key=_selectivity)), empty)
+        return canonical
+    
+    def _canonicalize(self) -> Tuple[List[Specification], bool]:
+        """
+        Simplifica los filtros (combinados con AND) antes de emitirlos.
+        
+        - Elimina filtros duplicados
+        - Intersecta Equal/In sobre un mismo campo en un único filtro
+        - Detecta contradicciones (sin valores en común, IS NULL y IS NOT NULL)
+        
+        Los filtros contradictorios se siguen emitiendo, de modo que un
+        adaptador que ignore el flag tampoco devuelve resultados.
+        
+        Returns:
+            Tupla (filtros canónicos, True si la query no puede tener resultados)
+        """
+        specs: List[Specification] = []
+        for spec in self._filters:
+            if isinstance(spec, AndSpecification):
+                specs.extend(spec.children)
+            else:
+                specs.append(spec)
+        
+        result: List[Specification] = []
+        seen = set()
+        # campo -> [posición en result, valores permitidos, nº de filtros fusionados]
+        allowed: Dict[str, list] = {}
+        null_checks: Dict[str, set] = {}
+        
+        for spec in specs:
+            kind = type(spec)
+            if kind is EqualSpecification or kind is InSpecification:
+                values = (spec.value,) if kind is EqualSpecification else spec.value
+                try:
+                    hash(values)
+                except TypeError:
+                    result.append(spec)
+                    continue
+                entry = allowed.get(spec.field)
+                if entry is None:
+                    allowed[spec.field] = [len(result), tuple(dict.fromkeys(values)), 1]
+                    result.append(spec)
+                else:
+                    entry[1] = tuple(value for value in entry[1] if value in values)
+                    entry[2] += 1
+                continue
+            
+            if isinstance(spec, FilterSpecification):
+                key = (kind, spec.field, spec.operator, spec.value)
+                if kind is IsNullSpecification or kind is IsNotNullSpecification:
+                    null_checks.setdefault(spec.field, set()).add(kind)
+            else:
+                key = id(spec)
+            try:
+                if key in seen:
+                    continue
+                seen.add(key)
+            except TypeError:
+                pass
+            result.append(spec)
+        
+        empty = any(len(kinds) == 2 for kinds in null_checks.values())
+        for field, (index, values, merged) in allowed.items():
+            if merged == 1:
+                continue
+            if not values:
+                empty = True
+            result[index] = (
+                EqualSpecification(field, values[0]) if len(values) == 1
+                else InSpecification(field, values)
+            )
+        return result, empty
+    
+    def compile_predicate(self) -> Callable[[Any], bool]:
+        """
+        Combina los filtros en un único predicado para evaluar en memoria.
+        
+        El predicado se construye una vez (un AND n-ario con los filtros
+        ordenados por selectividad) y se reutiliza hasta que cambien los
+        filtros.
+        
+        Returns:
+            Función que recibe una entidad y retorna True si cumple todos los filtros
+        """
+        predicate = self._predicate
+        if predicate is None:
+            if not self._filters:
+                predicate = _accept_all
+            elif len(self._filters) == 1:
+                predicate = self._filters[0].is_satisfied_by
+            else:
+                predicate = AndSpecification(*self._filters).is_satisfied_by
+            self._predicate = predicate
+        return predicate
+    
+    def plan_key(self) -> bytes:
+        """
+        Clave estable de la forma de la query, sin valores literales.
+        
+        Queries que solo difieren en los parámetros (valores de filtros,
+        límite u offset concretos) comparten clave, de modo que los
+        adaptadores pueden reutilizar SQL compilado o sentencias preparadas.
+        
+        Returns:
+            Digest blake2b de 16 bytes
+        """
+        entity_type = self.entity_type
+        # Misma forma que emite to_query_definition (filtros canónicos)
+        filters, empty = self._canonical_filters()
+        shape = (
+            f"{entity_type.__module__}.{entity_type.__qualname__}",
+            tuple(f.shape() for f in filters),
+            empty,
+            tuple(self._sorts.to_sort_criteria()) if self._sorts else (),
+            tuple(
+                (f"{join.entity_type.__module__}.{join.entity_type.__qualname__}",
+                 join.condition, int(join.join_type))
+                for join in self._joins
+            ),
+            self._limit is not None,
+            self._offset is not None,
+            self._select_fields or (),
+        )
+        return blake2b(repr(shape).encode(), digest_size=16).digest()
+    
     def clear(self) -> 'QueryBuilder':
         """
         Limpia todos los filtros y configuraciones.
@@ -155,12 +342,15 @@ class QueryBuilder:
         Returns:
             Self para method chaining
         """
-        self._filters.clear()
+        self._filters = ()
+        self._predicate = None
+        self._canonical = None
+        self._filter_exprs = None
         self._sorts = None
         self._limit = None
         self._offset = None
         self._select_fields = None
-        self._joins.clear()
+        self._joins = ()
         return self
     
     def clone(self) -> 'QueryBuilder':
@@ -170,24 +360,21 @@ class QueryBuilder:
         Returns:
             Nueva instancia del QueryBuilder con la misma configuración
         """
-        new_builder = QueryBuilder(self.entity_type)
-        new_builder._filters = self._filters.copy()
-        new_builder._sorts = self._sorts
-        new_builder._limit = self._limit
-        new_builder._offset = self._offset
-        new_builder._select_fields = self._select_fields.copy() if self._select_fields else None
-        new_builder._joins = self._joins.copy()
+        # El estado es inmutable (tuplas, specs): basta una copia superficial
+        new_builder = object.__new__(type(self))
+        new_builder.__dict__.update(self.__dict__)
         return new_builder
     
     @property
     def has_filters(self) -> bool:
         """Verifica si tiene filtros configurados."""
-        return len(self._filters) > 0
+        return bool(self._filters)
     
     @property
     def has_sorting(self) -> bool:
         """Verifica si tiene ordenamiento configurado."""
-        return self._sorts is not None and not self._sorts.is_empty()
+        # Se lee la lista directamente: MultipleSortSpecification es mutable
+        return self._sorts is not None and bool(self._sorts.sorts)
     
     @property
     def has_pagination(self) -> bool:
@@ -197,9 +384,9 @@ class QueryBuilder:
     @property
     def has_field_selection(self) -> bool:
         """Verifica si tiene selección específica de campos."""
-        return self._select_fields is not None and len(self._select_fields) > 0
+        return bool(self._select_fields)
     
     @property 
     def has_joins(self) -> bool:
         """Verifica si tiene joins configurados."""
-        return len(self._joins) > 0
\ No newline at end of file
+        return bool(self._joins)
\ No newline at end of file
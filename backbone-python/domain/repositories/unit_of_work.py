@@ -1,8 +1,13 @@
 """
 Unit of Work - Patrón Unit of Work para transacciones
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
+
+
+class UnitOfWorkFullError(RuntimeError):
+    """Se alcanzó el máximo de cambios pendientes de un Unit of Work."""
 
 
 class IUnitOfWork(ABC):
@@ -131,11 +136,27 @@ class BaseUnitOfWork(IUnitOfWork):
     los adaptadores específicos.
     """
     
-    def __init__(self):
-        self._new_entities = []
-        self._dirty_entities = []
-        self._removed_entities = []
-        self._clean_entities = []
+    # True si commit() solo persiste las entidades registradas: al salir
+    # del context manager sin cambios se omite el commit (p.ej. lecturas).
+    # Los adaptadores cuyo commit confirma además trabajo no registrado
+    # (escrituras directas en la sesión) deben dejarlo en False.
+    _skip_empty_commit = False
+    
+    def __init__(self, max_pending: Optional[int] = None):
+        """
+        Args:
+            max_pending: Máximo de entidades con cambios pendientes antes de
+                rechazar nuevos registros (None = sin límite)
+        """
+        self.max_pending = max_pending
+        # Cada registro es un dict id(entidad) -> entidad: pertenencia por
+        # identidad en O(1), sin invocar __eq__ de las entidades.
+        self._new_entities: Dict[int, Any] = {}
+        self._dirty_entities: Dict[int, Any] = {}
+        self._removed_entities: Dict[int, Any] = {}
+        self._clean_entities: Dict[int, Any] = {}
+        # id(entidad) -> registro en el que está (cada entidad está en uno solo)
+        self._tracking: Dict[int, Dict[int, Any]] = {}
         self._committed = False
         self._rolled_back = False
     
@@ -148,76 +169,94 @@ class BaseUnitOfWork(IUnitOfWork):
         if exc_type is not None and not self._rolled_back:
             await self.rollback()
         elif not self._committed and not self._rolled_back:
+            if self._skip_empty_commit and not self.has_changes:
+                return
             # Auto-commit si no hubo excepciones y no se hizo commit explícito
             await self.commit()
     
+    def _move_to(self, entity: Any, target: Dict[int, Any]) -> None:
+        """Mueve la entidad al registro indicado, sacándola del anterior."""
+        key = id(entity)
+        current = self._tracking.get(key)
+        if current is not target:
+            if current is not None:
+                del current[key]
+            target[key] = entity
+            self._tracking[key] = target
+    
+    def _ensure_capacity(self, entity: Any) -> None:
+        """Aplica max_pending antes de registrar un cambio nuevo."""
+        if self.max_pending is None:
+            return
+        current = self._tracking.get(id(entity))
+        if current is not None and current is not self._clean_entities:
+            # Ya estaba pendiente: solo cambia de registro
+            return
+        if len(self._tracking) - len(self._clean_entities) >= self.max_pending:
+            raise UnitOfWorkFullError(
+                f"Unit of work has {self.max_pending} pending entities; commit before registering more"
+            )
+    
     def register_new(self, entity: Any) -> None:
         """Registra entidad nueva."""
-        if entity not in self._new_entities:
-            self._new_entities.append(entity)
-        
-        # Remover de otros registros si está presente
-        self._remove_from_other_lists(entity, self._new_entities)
+        self._ensure_capacity(entity)
+        self._move_to(entity, self._new_entities)
     
     def register_dirty(self, entity: Any) -> None:
         """Registra entidad modificada."""
-        if entity not in self._dirty_entities and entity not in self._new_entities:
-            self._dirty_entities.append(entity)
-        
-        # Remover de clean si estaba ahí
-        if entity in self._clean_entities:
-            self._clean_entities.remove(entity)
+        # Una entidad nueva se insertará con su estado actual y una
+        # eliminada se borrará igualmente: en ambos casos no cambia
+        current = self._tracking.get(id(entity))
+        if current is not self._new_entities and current is not self._removed_entities:
+            self._ensure_capacity(entity)
+            self._move_to(entity, self._dirty_entities)
     
     def register_removed(self, entity: Any) -> None:
         """Registra entidad para eliminar."""
-        if entity not in self._removed_entities:
-            self._removed_entities.append(entity)
-        
-        # Remover de otros registros
-        self._remove_from_other_lists(entity, self._removed_entities)
+        self._ensure_capacity(entity)
+        self._move_to(entity, self._removed_entities)
     
     def register_clean(self, entity: Any) -> None:
         """Registra entidad limpia."""
-        if (entity not in self._clean_entities and 
-            entity not in self._new_entities and
-            entity not in self._dirty_entities and
-            entity not in self._removed_entities):
-            self._clean_entities.append(entity)
-    
-    def _remove_from_other_lists(self, entity: Any, except_list: list) -> None:
-        """Remueve entidad de otras listas excepto la especificada."""
-        all_lists = [
-            self._new_entities,
-            self._dirty_entities, 
-            self._removed_entities,
-            self._clean_entities
-        ]
-        
-        for entity_list in all_lists:
-            if entity_list is not except_list and entity in entity_list:
-                entity_list.remove(entity)
+        if id(entity) not in self._tracking:
+            self._move_to(entity, self._clean_entities)
     
     @property
     def has_changes(self) -> bool:
         """Verifica si hay cambios pendientes."""
-        return (len(self._new_entities) > 0 or 
-                len(self._dirty_entities) > 0 or 
-                len(self._removed_entities) > 0)
+        return bool(self._new_entities or self._dirty_entities or self._removed_entities)
+    
+    def iter_new(self) -> Iterator[Any]:
+        """
+        Itera las entidades nuevas sin copiarlas.
+        
+        No se deben registrar entidades mientras se itera; para una copia
+        estable usar new_entities.
+        """
+        return iter(self._new_entities.values())
+    
+    def iter_dirty(self) -> Iterator[Any]:
+        """Itera las entidades modificadas sin copiarlas (ver iter_new)."""
+        return iter(self._dirty_entities.values())
+    
+    def iter_removed(self) -> Iterator[Any]:
+        """Itera las entidades a eliminar sin copiarlas (ver iter_new)."""
+        return iter(self._removed_entities.values())
     
     @property
     def new_entities(self) -> list:
-        """Entidades nuevas registradas."""
-        return self._new_entities.copy()
+        """Entidades nuevas registradas (copia)."""
+        return list(self._new_entities.values())
     
     @property
     def dirty_entities(self) -> list:
-        """Entidades modificadas registradas."""
-        return self._dirty_entities.copy()
+        """Entidades modificadas registradas (copia)."""
+        return list(self._dirty_entities.values())
     
     @property
     def removed_entities(self) -> list:
-        """Entidades a eliminar registradas."""
-        return self._removed_entities.copy()
+        """Entidades a eliminar registradas (copia)."""
+        return list(self._removed_entities.values())
     
     def clear_tracking(self) -> None:
         """Limpia el tracking de entidades."""
@@ -225,6 +264,7 @@ class BaseUnitOfWork(IUnitOfWork):
         self._dirty_entities.clear()
         self._removed_entities.clear()
         self._clean_entities.clear()
+        self._tracking.clear()
         self._committed = False
         self._rolled_back = False
 
@@ -264,23 +304,39 @@ class UnitOfWorkManager:
         return self._units_of_work.get(name)
     
     async def commit_all(self) -> None:
-        """Hace commit de todos los Unit of Work registrados."""
-        for name, uow in self._units_of_work.items():
-            try:
-                await uow.commit()
-            except Exception as e:
-                # Si falla uno, hacer rollback de todos
-                await self.rollback_all()
-                raise e
+        """
+        Hace commit de todos los Unit of Work registrados.
+        
+        Los commits se lanzan concurrentemente; si alguno falla se hace
+        rollback de todos.
+        
+        Raises:
+            BaseException: El error del commit fallido, o ExceptionGroup
+                (BaseExceptionGroup si alguno no es Exception, p.ej.
+                CancelledError) si fallaron varios
+        """
+        units = list(self._units_of_work.values())
+        results = await asyncio.gather(
+            *(uow.commit() for uow in units),
+            return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if not errors:
+            return
+        
+        await self.rollback_all()
+        if len(errors) == 1:
+            raise errors[0]
+        # BaseExceptionGroup devuelve un ExceptionGroup si todos son Exception
+        raise BaseExceptionGroup("commit_all failed", errors)
     
     async def rollback_all(self) -> None:
         """Hace rollback de todos los Unit of Work registrados."""
-        for name, uow in self._units_of_work.items():
-            try:
-                await uow.rollback()
-            except Exception:
-                # Continuar con rollback de otros incluso si uno falla
-                continue
+        # return_exceptions: continuar con el rollback de otros incluso si uno falla
+        await asyncio.gather(
+            *(uow.rollback() for uow in self._units_of_work.values()),
+            return_exceptions=True
+        )
     
     def clear(self) -> None:
         """Limpia todos los Unit of Work registrados."""
@@ -6,7 +6,8 @@ from .base_specification import (
     CompositeSpecification,
     AndSpecification,
     OrSpecification,
-    NotSpecification
+    NotSpecification,
+    OpExpr,
 )
 from .filter_specification import (
     FilterSpecification,
@@ -31,6 +32,7 @@ __all__ = [
     "AndSpecification",
     "OrSpecification", 
     "NotSpecification",
+    "OpExpr",
     "FilterSpecification",
     "EqualSpecification",
     "NotEqualSpecification",
@@ -2,11 +2,43 @@
 Base Specification - Patrón Specification para filtros dinámicos
 """
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Any, Union
+from itertools import compress
+from operator import attrgetter, itemgetter, not_
+from typing import TypeVar, Generic, Any, Dict, Iterable, List, Mapping, NamedTuple, Sequence, Union
 
 T = TypeVar('T')  # Tipo de entidad
 
 
+class OpExpr(NamedTuple):
+    """
+    Expresión compuesta: operador lógico (AND, OR, NOT) y sus operandos.
+    
+    Las hojas siguen siendo dicts {"field", "operator", "value"}.
+    """
+    op: str
+    operands: tuple
+    
+    @classmethod
+    def from_dict(cls, expression: Dict[str, Any]) -> 'OpExpr':
+        """
+        Convierte una expresión compuesta en formato dict (legacy).
+        
+        Args:
+            expression: Dict con "operator" y "operands", "left"/"right" o "spec"
+            
+        Returns:
+            Expresión equivalente
+        """
+        op = expression["operator"]
+        if "operands" in expression:
+            operands = tuple(expression["operands"])
+        elif op == "NOT":
+            operands = (expression["spec"],)
+        else:
+            operands = (expression["left"], expression["right"])
+        return cls(op, operands)
+
+
 class Specification(ABC, Generic[T]):
     """
     Specification abstracto para implementar el patrón Specification.
@@ -18,6 +50,15 @@ class Specification(ABC, Generic[T]):
     cómo convertirse a query de base de datos.
     """
     
+    # Fracción estimada de candidatos que cumplen la especificación
+    # (0 = muy selectiva). Se usa para evaluar primero lo más selectivo.
+    selectivity_hint: float = 0.5
+    
+    # Sin __dict__ por instancia; las subclases declaran sus propios slots.
+    # _expr_cache: las especificaciones son inmutables tras construirse, la
+    # expresión se construye una sola vez y se comparte entre llamadas
+    __slots__ = ("_expr_cache",)
+    
     @abstractmethod
     def is_satisfied_by(self, candidate: T) -> bool:
         """
@@ -31,7 +72,50 @@ class Specification(ABC, Generic[T]):
         """
         pass
     
-    @abstractmethod
+    def is_satisfied_by_batch(self, candidates: Sequence[T]) -> List[bool]:
+        """
+        Evalúa la especificación sobre una colección de entidades.
+        
+        Las especificaciones concretas pueden sobrescribirlo para evitar
+        una llamada a is_satisfied_by por entidad.
+        
+        Args:
+            candidates: Entidades a evaluar
+            
+        Returns:
+            Lista de booleanos alineada con candidates
+        """
+        is_satisfied_by = self.is_satisfied_by
+        return [is_satisfied_by(candidate) for candidate in candidates]
+    
+    def filter_many(self, candidates: Iterable[T]) -> List[T]:
+        """
+        Retorna las entidades que satisfacen la especificación.
+        
+        Usa la evaluación por lotes en lugar de una llamada por entidad.
+        
+        Args:
+            candidates: Entidades a filtrar
+            
+        Returns:
+            Entidades que cumplen, en el orden original
+        """
+        if not isinstance(candidates, Sequence):
+            candidates = list(candidates)
+        return list(compress(candidates, self.is_satisfied_by_batch(candidates)))
+    
+    def to_mask(self, columns: Mapping[str, Sequence[Any]]) -> List[bool]:
+        """
+        Evalúa la especificación sobre datos en columnas.
+        
+        Args:
+            columns: Campo -> valores, todas las columnas con la misma longitud
+            
+        Returns:
+            Lista de booleanos alineada con las filas
+        """
+        raise NotImplementedError(f"{type(self).__name__} no soporta evaluación columnar")
+    
     def to_expression(self) -> Any:
         """
         Convierte la especificación a expresión de query.
@@ -41,10 +125,35 @@ class Specification(ABC, Generic[T]):
         - MongoDB: retorna dict con filtro
         - ElasticSearch: retorna query DSL
         
+        La expresión se memoriza en la primera llamada; el resultado es
+        compartido y no debe modificarse.
+        
         Returns:
             Expresión de query específica del adaptador
         """
-        pass
+        try:
+            return self._expr_cache
+        except AttributeError:
+            # Slot sin asignar: primera llamada
+            expression = self._expr_cache = self._build_expression()
+            return expression
+    
+    def shape(self) -> Any:
+        """
+        Estructura de la especificación sin los valores literales.
+        
+        Dos especificaciones con la misma forma generan la misma query
+        salvo por los parámetros, por lo que sirve como clave de caché
+        de planes/sentencias preparadas.
+        
+        Returns:
+            Tupla anidada y hashable con los valores reemplazados por "?"
+        """
+        return _expression_shape(self.to_expression())
+    
+    def _build_expression(self) -> Any:
+        """Construye la expresión de query. Override en especificaciones concretas."""
+        raise NotImplementedError(f"{type(self).__name__} must implement _build_expression()")
     
     def and_spec(self, other: 'Specification[T]') -> 'CompositeSpecification[T]':
         """Combina con otra especificación usando AND."""
@@ -82,54 +191,186 @@ class CompositeSpecification(Specification[T]):
     Especificación compuesta que combina múltiples especificaciones.
     """
     
+    __slots__ = ("left", "right")
+    
     def __init__(self, left: Specification[T], right: Specification[T] = None):
         self.left = left
         self.right = right
 
 
+def _flatten(kind: type, specs: tuple) -> tuple:
+    """Aplana operandos del mismo tipo: (a AND b) AND c -> (a, b, c)."""
+    children = []
+    for spec in specs:
+        if isinstance(spec, kind):
+            children.extend(spec.children)
+        elif spec is not None:
+            children.append(spec)
+    return tuple(children)
+
+
+_selectivity = attrgetter("selectivity_hint")
+
+# Cada cuántas evaluaciones AndSpecification reordena sus operandos
+_REORDER_EVERY = 1024
+
+
+def _expression_shape(expression: Any) -> Any:
+    """Convierte una expresión en una tupla canónica sin literales."""
+    if isinstance(expression, dict):
+        return tuple(
+            (key, "?" if key == "value" else _expression_shape(value))
+            for key, value in sorted(expression.items())
+        )
+    if isinstance(expression, (list, tuple)):
+        return tuple(_expression_shape(item) for item in expression)
+    if expression is None or isinstance(expression, (str, int, float, bool)):
+        return expression
+    # Expresiones propias de un adaptador: solo se conserva su tipo
+    return type(expression).__qualname__
+
+
 class AndSpecification(CompositeSpecification[T]):
-    """Especificación AND - ambas deben ser verdaderas."""
+    """
+    Especificación AND - todas deben ser verdaderas.
+    
+    Es n-aria: combinar ANDs anidados produce una sola lista plana de
+    operandos (`children`) en lugar de un árbol binario de profundidad N.
+    
+    El orden de evaluación parte de selectivity_hint y se adapta: cada
+    _REORDER_EVERY evaluaciones se adelantan los operandos que más
+    rechazos han producido.
+    """
+    
+    __slots__ = ("children", "_ordered", "_rejections", "_calls")
+    
+    def __init__(self, left: Specification[T], right: Specification[T] = None, *more: Specification[T]):
+        super().__init__(left, right)
+        self.children = _flatten(AndSpecification, (left, right, *more))
+        # Evaluar primero lo más selectivo para cortocircuitar antes;
+        # children y to_expression() conservan el orden original
+        self._ordered = tuple(sorted(self.children, key=_selectivity))
+        # Rechazos por operando, alineado con _ordered
+        self._rejections = [0] * len(self._ordered)
+        self._calls = 0
+    
+    @property
+    def selectivity_hint(self) -> float:
+        return min(map(_selectivity, self.children))
     
     def is_satisfied_by(self, candidate: T) -> bool:
-        return (self.left.is_satisfied_by(candidate) and 
-                self.right.is_satisfied_by(candidate))
+        # Estadísticas best-effort: sin lock, una carrera solo afecta al orden
+        calls = self._calls = self._calls + 1
+        if calls >= _REORDER_EVERY:
+            self._reorder()
+        for index, spec in enumerate(self._ordered):
+            if not spec.is_satisfied_by(candidate):
+                self._rejections[index] += 1
+                return False
+        return True
     
-    def to_expression(self) -> Any:
+    def _reorder(self) -> None:
+        """Ordena los operandos por rechazos observados (desempate estable)."""
+        ranked = sorted(zip(self._rejections, self._ordered), key=itemgetter(0), reverse=True)
+        self._ordered = tuple(spec for _, spec in ranked)
+        # Decaimiento a la mitad: pesa más el comportamiento reciente
+        self._rejections = [count // 2 for count, _ in ranked]
+        self._calls = 0
+    
+    def is_satisfied_by_batch(self, candidates: Sequence[T]) -> List[bool]:
+        # Cada operando solo evalúa los candidatos que siguen en pie
+        pending = range(len(candidates))
+        for spec in self._ordered:
+            if not pending:
+                break
+            mask = spec.is_satisfied_by_batch([candidates[i] for i in pending])
+            pending = list(compress(pending, mask))
+        results = [False] * len(candidates)
+        for i in pending:
+            results[i] = True
+        return results
+    
+    def to_mask(self, columns: Mapping[str, Sequence[Any]]) -> List[bool]:
+        return list(map(all, zip(*[spec.to_mask(columns) for spec in self.children])))
+    
+    def _build_expression(self) -> Any:
         # La implementación específica será en los adaptadores
-        return {
-            "operator": "AND",
-            "left": self.left.to_expression(),
-            "right": self.right.to_expression()
-        }
+        return OpExpr("AND", tuple(spec.to_expression() for spec in self.children))
 
 
 class OrSpecification(CompositeSpecification[T]):
-    """Especificación OR - al menos una debe ser verdadera."""
+    """
+    Especificación OR - al menos una debe ser verdadera.
+    
+    N-aria como AndSpecification.
+    """
+    
+    __slots__ = ("children", "_ordered")
+    
+    def __init__(self, left: Specification[T], right: Specification[T] = None, *more: Specification[T]):
+        super().__init__(left, right)
+        self.children = _flatten(OrSpecification, (left, right, *more))
+        # Evaluar primero lo menos selectivo (más probable que sea verdadero)
+        self._ordered = tuple(sorted(self.children, key=_selectivity, reverse=True))
+    
+    @property
+    def selectivity_hint(self) -> float:
+        return max(map(_selectivity, self.children))
     
     def is_satisfied_by(self, candidate: T) -> bool:
-        return (self.left.is_satisfied_by(candidate) or 
-                self.right.is_satisfied_by(candidate))
+        for spec in self._ordered:
+            if spec.is_satisfied_by(candidate):
+                return True
+        return False
     
-    def to_expression(self) -> Any:
-        return {
-            "operator": "OR",
-            "left": self.left.to_expression(),
-            "right": self.right.to_expression()
-        }
+    def is_satisfied_by_batch(self, candidates: Sequence[T]) -> List[bool]:
+        # Cada operando solo evalúa los candidatos aún no satisfechos
+        results = [False] * len(candidates)
+        pending = range(len(candidates))
+        for spec in self._ordered:
+            if not pending:
+                break
+            mask = spec.is_satisfied_by_batch([candidates[i] for i in pending])
+            for i in compress(pending, mask):
+                results[i] = True
+            pending = list(compress(pending, map(not_, mask)))
+        return results
+    
+    def to_mask(self, columns: Mapping[str, Sequence[Any]]) -> List[bool]:
+        return list(map(any, zip(*[spec.to_mask(columns) for spec in self.children])))
+    
+    def _build_expression(self) -> Any:
+        return OpExpr("OR", tuple(spec.to_expression() for spec in self.children))
 
 
 class NotSpecification(CompositeSpecification[T]):
     """Especificación NOT - negación de la especificación."""
     
+    __slots__ = ("spec",)
+    
     def __init__(self, spec: Specification[T]):
         super().__init__(spec)
         self.spec = spec
     
+    @property
+    def selectivity_hint(self) -> float:
+        return 1.0 - self.spec.selectivity_hint
+    
     def is_satisfied_by(self, candidate: T) -> bool:
         return not self.spec.is_satisfied_by(candidate)
     
-    def to_expression(self) -> Any:
-        return {
-            "operator": "NOT",
-            "spec": self.spec.to_expression()
-        }
\ No newline at end of file
+    def is_satisfied_by_batch(self, candidates: Sequence[T]) -> List[bool]:
+        return [not result for result in self.spec.is_satisfied_by_batch(candidates)]
+    
+    def to_mask(self, columns: Mapping[str, Sequence[Any]]) -> List[bool]:
+        return [not result for result in self.spec.to_mask(columns)]
+    
+    def not_spec(self) -> Specification[T]:
+        """Doble negación: NOT(NOT x) -> x."""
+        return self.spec
+    
+    def _build_expression(self) -> Any:
+        if isinstance(self.spec, NotSpecification):
+            # NotSpecification(NotSpecification(x)) construido directamente
+            return self.spec.spec.to_expression()
+        return OpExpr("NOT", (self.spec.to_expression(),))
\ No newline at end of file
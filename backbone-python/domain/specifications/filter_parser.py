@@ -1,12 +1,42 @@
 """
 Filter Parser - Parser para filtros dinámicos desde query parameters
 """
-from typing import List, Dict, Any, Optional, Union
+from functools import lru_cache
+from typing import Callable, List, Dict, Any, Optional, Union
 from .filter_specification import SpecificationFactory, FilterSpecification
-from .base_specification import Specification, T
+from .base_specification import Specification, AndSpecification, OrSpecification, T
 from ..exceptions.domain_exceptions import InvalidValueObjectException
 
 
+# Literales reconocidos por _convert_single_value (en minúsculas)
+_LITERALS: Dict[str, Any] = {"": None, "null": None, "none": None, "true": True, "false": False}
+_NOT_LITERAL = object()
+
+_COMBINATORS = {"and": AndSpecification, "or": OrSpecification}
+
+# Operadores cuyo valor no es un escalar simple (ver _parse_value)
+_VALUE_OPERATORS = frozenset({"in", "between", "is_null", "is_not_null"})
+
+# Máximo de formas de filtros dict con plan memorizado por parser
+_MAX_SHAPE_PLANS = 256
+
+# Operadores y conectores crudos -> forma canónica (strip + lower). Son pocos
+# valores distintos y se repiten en cada filtro de lista
+_TOKEN_CACHE: Dict[str, str] = {}
+_MAX_TOKENS = 512
+
+
+def _canon(token: str) -> str:
+    """Normaliza un operador/conector memorizando el resultado."""
+    try:
+        return _TOKEN_CACHE[token]
+    except KeyError:
+        canonical = token.strip().lower()
+        if len(_TOKEN_CACHE) < _MAX_TOKENS:
+            _TOKEN_CACHE[token] = canonical
+        return canonical
+
+
 class FilterParser:
     """
     Parser para convertir filtros de query parameters a especificaciones.
@@ -21,9 +51,15 @@ class FilterParser:
     - Dict simple: {"name": "Alice", "age__gt": "25"}
     """
     
-    def __init__(self):
-        self.supported_operators = SpecificationFactory.supported_operators()
-        self.supported_connectors = ["and", "or"]
+    def __init__(self, cache_size: int = 1024):
+        """
+        Args:
+            cache_size: Máximo de filtros parseados a memorizar (0 = sin caché)
+        """
+        # frozensets: la validación de cada filtro es O(1); la lista
+        # ordenada solo se construye para los mensajes de error
+        self.supported_operators = SpecificationFactory.supported_operators_set()
+        self.supported_connectors = frozenset({"and", "or"})
         # Map Django-style operators to internal operators
         self.operator_mapping = {
             "gt": "gt",
@@ -39,6 +75,17 @@ class FilterParser:
             "isnull": "isnull",
             "isnotnull": "isnotnull"
         }
+        # Sufijo "__op" (en minúsculas) -> operador interno ya validado:
+        # resuelve mapping + validación con una sola búsqueda por filtro
+        self._dict_operators = {
+            suffix: self.operator_mapping.get(suffix, suffix)
+            for suffix in (*self.operator_mapping, *self.supported_operators)
+            if self.operator_mapping.get(suffix, suffix) in self.supported_operators
+        }
+        self._shape_plans: Dict[tuple, tuple] = {}
+        # Las especificaciones son inmutables: filtros idénticos (p.ej. la
+        # misma query en cada página) pueden compartir el árbol ya construido
+        self._parse_cached = lru_cache(maxsize=cache_size)(self._parse_key) if cache_size else None
     
     def parse_filters(self, filters: Union[List[str], Dict[str, Any]]) -> Optional[Specification[T]]:
         """
@@ -61,6 +108,14 @@ class FilterParser:
         if not filters:
             return None
         
+        if self._parse_cached is not None:
+            key = ("dict", tuple(filters.items())) if isinstance(filters, dict) else ("list", tuple(filters))
+            try:
+                return self._parse_cached(key)
+            except TypeError:
+                # Valores no hashables (listas...): parsear sin caché
+                pass
+        
         # Handle dictionary format (query parameters)
         if isinstance(filters, dict):
             return self._parse_dict_filters(filters)
@@ -68,6 +123,13 @@ class FilterParser:
         # Handle list format (comma-separated strings)
         return self._parse_list_filters(filters)
     
+    def _parse_key(self, key: tuple) -> Optional[Specification[T]]:
+        """Parsea los filtros a partir de su clave canónica (ver parse_filters)."""
+        kind, items = key
+        if kind == "dict":
+            return self._parse_dict_filters(dict(items))
+        return self._parse_list_filters(list(items))
+    
     def _parse_dict_filters(self, filters_dict: Dict[str, Any]) -> Optional[Specification[T]]:
         """
         Parse dictionary-style filters (query parameters).
@@ -80,46 +142,66 @@ class FilterParser:
         if not filters_dict:
             return None
             
-        specifications = []
+        # Las claves (field__operator) suelen repetirse entre requests con
+        # distintos valores: el plan por forma ya tiene campo, conversor de
+        # valor y constructor resueltos
+        shape = tuple(filters_dict)
+        plan = self._shape_plans.get(shape)
+        if plan is None:
+            plan = self._build_shape_plan(shape)
+            if len(self._shape_plans) < _MAX_SHAPE_PLANS:
+                self._shape_plans[shape] = plan
+        
+        if len(plan) == 1:
+            # Caso más frecuente: un único filtro, sin lista ni nodo AND
+            (field, parse, build), = plan
+            value, = filters_dict.values()
+            return build(field, parse(value))
+        
+        # Combine all specifications with AND (un único nodo n-ario)
+        return AndSpecification(*[
+            build(field, parse(value))
+            for (field, parse, build), value in zip(plan, filters_dict.values())
+        ])
+    
+    def _build_shape_plan(self, shape: tuple) -> tuple:
+        """
+        Resuelve cada clave "field__operator" a (field, conversor de valor, constructor).
         
-        for field_expr, value in filters_dict.items():
+        Raises:
+            InvalidValueObjectException: Si algún operador no es soportado
+        """
+        dict_operators = self._dict_operators
+        plan = []
+        
+        for field_expr in shape:
             # Parse field and operator
-            if "__" in field_expr:
-                field, operator = field_expr.split("__", 1)
-                operator = operator.lower()
-            else:
-                field = field_expr
+            field, separator, suffix = field_expr.partition("__")
+            if not separator:
                 operator = "eq"  # Default to equality
+            else:
+                # Map + validate operator
+                operator = dict_operators.get(suffix) or dict_operators.get(suffix.lower())
             
-            # Map operator if needed
-            if operator in self.operator_mapping:
-                operator = self.operator_mapping[operator]
-            
-            # Validate operator
-            if operator not in self.supported_operators:
+            if operator is None:
+                operator = suffix.lower()
+                operator = self.operator_mapping.get(operator, operator)
                 raise InvalidValueObjectException(
-                    message=f"Operador no soportado: '{operator}'. Operadores disponibles: {self.supported_operators}",
+                    message=f"Operador no soportado: '{operator}'. Operadores disponibles: {SpecificationFactory.supported_operators()}",
                     value_object_type="FilterOperator",
                     invalid_value=operator,
                     code=11003008
                 )
             
-            # Convert value to appropriate type
-            parsed_value = self._parse_value(value, operator)
-            
-            # Create specification
-            spec = SpecificationFactory.create(field, operator, parsed_value)
-            specifications.append(spec)
+            plan.append((field, self._value_parser(operator), SpecificationFactory.constructor_for(operator)))
         
-        # Combine all specifications with AND
-        if len(specifications) == 1:
-            return specifications[0]
-        
-        result = specifications[0]
-        for spec in specifications[1:]:
-            result = result.and_(spec)
-        
-        return result
+        return tuple(plan)
+    
+    def _value_parser(self, operator: str) -> Callable[[Any], Any]:
+        """Conversor de valor especializado para un operador (ver _parse_value)."""
+        if operator in _VALUE_OPERATORS:
+            return lambda value: self._parse_value(value, operator)
+        return self._convert_single_value
     
     def _parse_list_filters(self, filters: List[str]) -> Optional[Specification[T]]:
         """
@@ -171,14 +253,14 @@ class FilterParser:
             )
         
         field = parts[0].strip()
-        operator = parts[1].strip().lower()
+        operator = _canon(parts[1])
         value_str = parts[2].strip()
-        connector = parts[3].strip().lower() if len(parts) > 3 else None
+        connector = _canon(parts[3]) if len(parts) > 3 else None
         
         # Validar operador
         if operator not in self.supported_operators:
             raise InvalidValueObjectException(
-                message=f"Operador no soportado: '{operator}'. Operadores disponibles: {self.supported_operators}",
+                message=f"Operador no soportado: '{operator}'. Operadores disponibles: {SpecificationFactory.supported_operators()}",
                 value_object_type="FilterOperator",
                 invalid_value=operator,
                 code=11003008
@@ -187,7 +269,7 @@ class FilterParser:
         # Validar conector
         if connector and connector not in self.supported_connectors:
             raise InvalidValueObjectException(
-                message=f"Conector lógico no soportado: '{connector}'. Conectores disponibles: {self.supported_connectors}",
+                message=f"Conector lógico no soportado: '{connector}'. Conectores disponibles: {sorted(self.supported_connectors)}",
                 value_object_type="LogicalConnector",
                 invalid_value=connector,
                 code=11003009
@@ -243,24 +325,26 @@ class FilterParser:
         Returns:
             Valor convertido (int, float, bool, None o str)
         """
-        # None/null
-        if value_str.lower() in ("null", "none", ""):
-            return None
-        
-        # Boolean
-        if value_str.lower() in ("true", "false"):
-            return value_str.lower() == "true"
+        # None/null y booleanos: los literales tienen como mucho 5 caracteres,
+        # así que solo se normaliza a minúsculas un string corto
+        if len(value_str) <= 5:
+            literal = _LITERALS.get(value_str, _NOT_LITERAL)
+            if literal is _NOT_LITERAL:
+                literal = _LITERALS.get(value_str.lower(), _NOT_LITERAL)
+            if literal is not _NOT_LITERAL:
+                return literal
         
         # Integer
-        if value_str.isdigit() or (value_str.startswith("-") and value_str[1:].isdigit()):
+        digits = value_str[1:] if value_str[:1] == "-" else value_str
+        if digits.isdigit():
             return int(value_str)
         
         # Float
-        try:
-            if "." in value_str:
+        if "." in value_str:
+            try:
                 return float(value_str)
-        except ValueError:
-            pass
+            except ValueError:
+                pass
         
         # String por defecto
         return value_str
@@ -286,19 +370,23 @@ class FilterParser:
         if len(specifications) == 1:
             return specifications[0]
         
-        # Empezar con la primera especificación
-        result = specifications[0]
+        # Evaluación de izquierda a derecha: cada tramo consecutivo con el
+        # mismo conector se agrupa en un único nodo n-ario
+        run = [specifications[0]]
+        run_connector = None
         
-        # Combinar con el resto usando conectores
         for i in range(1, len(specifications)):
             connector = connectors[i-1] if i-1 < len(connectors) else "and"
-            
-            if connector == "and":
-                result = result.and_spec(specifications[i])
-            elif connector == "or":
-                result = result.or_spec(specifications[i])
-        
-        return result
+            if connector not in _COMBINATORS:
+                continue
+            if connector != run_connector and len(run) > 1:
+                run = [_COMBINATORS[run_connector](*run)]
+            run_connector = connector
+            run.append(specifications[i])
+        
+        if len(run) == 1:
+            return run[0]
+        return _COMBINATORS[run_connector](*run)
     
     def validate_filter_field(self, field: str, allowed_fields: List[str]) -> bool:
         """
@@ -1,7 +1,9 @@
 """
 Filter Specifications - Especificaciones concretas para filtros
 """
-from typing import Any, List, Union
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, FrozenSet, List, Mapping, Sequence, Union
 from .base_specification import Specification, T
 
 
@@ -12,28 +14,54 @@ class FilterSpecification(Specification[T]):
     Encapsula el field, operator y value de un filtro.
     """
     
+    __slots__ = ("field", "operator", "value", "_get")
+    
     def __init__(self, field: str, operator: str, value: Any):
         self.field = field
         self.operator = operator
         self.value = value
+        # Getter en C resuelto una vez (admite rutas con puntos: "address.city")
+        self._get = attrgetter(field)
     
     def is_satisfied_by(self, candidate: T) -> bool:
         """
         Evalúa si la entidad satisface el filtro.
         
-        Usa getattr para acceder al campo de la entidad.
+        Accede al campo de la entidad con un attrgetter precalculado.
         """
         try:
-            field_value = getattr(candidate, self.field)
-            return self._compare_values(field_value, self.value)
+            field_value = self._get(candidate)
         except AttributeError:
             return False
+        return self._compare_values(field_value, self.value)
+    
+    def is_satisfied_by_batch(self, candidates: Sequence[T]) -> List[bool]:
+        """Evalúa el filtro sobre varias entidades resolviendo el campo una sola vez por entidad."""
+        get = self._get
+        value = self.value
+        compare = self._compare_values
+        try:
+            field_values = [get(candidate) for candidate in candidates]
+        except AttributeError:
+            # Algún candidato no tiene el campo: evaluación entidad a entidad
+            return super().is_satisfied_by_batch(candidates)
+        return [compare(field_value, value) for field_value in field_values]
+    
+    def to_mask(self, columns: Mapping[str, Sequence[Any]]) -> List[bool]:
+        """Evalúa el filtro sobre la columna del campo, sin acceso a atributos por fila."""
+        column = columns.get(self.field)
+        if column is None:
+            # Campo ausente: como en is_satisfied_by, ninguna fila cumple
+            return [False] * _row_count(columns)
+        value = self.value
+        compare = self._compare_values
+        return [compare(field_value, value) for field_value in column]
     
     def _compare_values(self, field_value: Any, filter_value: Any) -> bool:
         """Override en especificaciones concretas."""
         return field_value == filter_value
     
-    def to_expression(self) -> dict:
+    def _build_expression(self) -> dict:
         """
         Convierte a formato genérico que los adaptadores pueden interpretar.
         """
@@ -47,26 +75,55 @@ class FilterSpecification(Specification[T]):
 class EqualSpecification(FilterSpecification):
     """Especificación de igualdad: field = value"""
     
+    __slots__ = ()
+    
+    selectivity_hint = 0.05
+    
     def __init__(self, field: str, value: Any):
         super().__init__(field, "eq", value)
     
     def _compare_values(self, field_value: Any, filter_value: Any) -> bool:
         return field_value == filter_value
+    
+    def is_satisfied_by_batch(self, candidates: Sequence[T]) -> List[bool]:
+        get = self._get
+        value = self.value
+        try:
+            return [get(candidate) == value for candidate in candidates]
+        except AttributeError:
+            return super().is_satisfied_by_batch(candidates)
 
 
 class NotEqualSpecification(FilterSpecification):
     """Especificación de desigualdad: field != value"""
     
+    __slots__ = ()
+    
+    selectivity_hint = 0.95
+    
     def __init__(self, field: str, value: Any):
         super().__init__(field, "ne", value)
     
     def _compare_values(self, field_value: Any, filter_value: Any) -> bool:
         return field_value != filter_value
+    
+    def is_satisfied_by_batch(self, candidates: Sequence[T]) -> List[bool]:
+        get = self._get
+        value = self.value
+        try:
+            return [get(candidate) != value for candidate in candidates]
+        except (AttributeError, TypeError):
+            # Campos ausentes o no comparables: evaluación entidad a entidad
+            return super().is_satisfied_by_batch(candidates)
 
 
 class LessThanSpecification(FilterSpecification):
     """Especificación menor que: field < value"""
     
+    __slots__ = ()
+    
+    selectivity_hint = 0.3
+    
     def __init__(self, field: str, value: Union[int, float, str]):
         super().__init__(field, "lt", value)
     
@@ -75,11 +132,24 @@ class LessThanSpecification(FilterSpecification):
             return field_value < filter_value
         except TypeError:
             return False
+    
+    def is_satisfied_by_batch(self, candidates: Sequence[T]) -> List[bool]:
+        get = self._get
+        value = self.value
+        try:
+            return [get(candidate) < value for candidate in candidates]
+        except (AttributeError, TypeError):
+            # Campos ausentes o no comparables: evaluación entidad a entidad
+            return super().is_satisfied_by_batch(candidates)
 
 
 class LessThanOrEqualSpecification(FilterSpecification):
     """Especificación menor o igual que: field <= value"""
     
+    __slots__ = ()
+    
+    selectivity_hint = 0.3
+    
     def __init__(self, field: str, value: Union[int, float, str]):
         super().__init__(field, "lte", value)
     
@@ -88,11 +158,24 @@ class LessThanOrEqualSpecification(FilterSpecification):
             return field_value <= filter_value
         except TypeError:
             return False
+    
+    def is_satisfied_by_batch(self, candidates: Sequence[T]) -> List[bool]:
+        get = self._get
+        value = self.value
+        try:
+            return [get(candidate) <= value for candidate in candidates]
+        except (AttributeError, TypeError):
+            # Campos ausentes o no comparables: evaluación entidad a entidad
+            return super().is_satisfied_by_batch(candidates)
 
 
 class GreaterThanSpecification(FilterSpecification):
     """Especificación mayor que: field > value"""
     
+    __slots__ = ()
+    
+    selectivity_hint = 0.3
+    
     def __init__(self, field: str, value: Union[int, float, str]):
         super().__init__(field, "gt", value)
     
@@ -101,11 +184,24 @@ class GreaterThanSpecification(FilterSpecification):
             return field_value > filter_value
         except TypeError:
             return False
+    
+    def is_satisfied_by_batch(self, candidates: Sequence[T]) -> List[bool]:
+        get = self._get
+        value = self.value
+        try:
+            return [get(candidate) > value for candidate in candidates]
+        except (AttributeError, TypeError):
+            # Campos ausentes o no comparables: evaluación entidad a entidad
+            return super().is_satisfied_by_batch(candidates)
 
 
 class GreaterThanOrEqualSpecification(FilterSpecification):
     """Especificación mayor o igual que: field >= value"""
     
+    __slots__ = ()
+    
+    selectivity_hint = 0.3
+    
     def __init__(self, field: str, value: Union[int, float, str]):
         super().__init__(field, "gte", value)
     
@@ -114,11 +210,24 @@ class GreaterThanOrEqualSpecification(FilterSpecification):
             return field_value >= filter_value
         except TypeError:
             return False
+    
+    def is_satisfied_by_batch(self, candidates: Sequence[T]) -> List[bool]:
+        get = self._get
+        value = self.value
+        try:
+            return [get(candidate) >= value for candidate in candidates]
+        except (AttributeError, TypeError):
+            # Campos ausentes o no comparables: evaluación entidad a entidad
+            return super().is_satisfied_by_batch(candidates)
 
 
 class LikeSpecification(FilterSpecification):
     """Especificación LIKE: field LIKE '%value%' - pattern is automatically wrapped"""
     
+    __slots__ = ("_needle",)
+    
+    selectivity_hint = 0.7
+    
     def __init__(self, field: str, value: str):
         # Wrap pattern with % unless already wrapped
         wrapped_value = value
@@ -127,43 +236,112 @@ class LikeSpecification(FilterSpecification):
         if not wrapped_value.endswith("%"):
             wrapped_value = wrapped_value + "%"
         super().__init__(field, "like", wrapped_value)
+        # Remove % from pattern for substring matching (una vez, no por candidato)
+        self._needle = wrapped_value.strip("%").lower()
     
     def _compare_values(self, field_value: Any, filter_value: Any) -> bool:
         if field_value is None:
             return False
-        # Remove % from pattern for substring matching
-        pattern = str(filter_value).strip("%")
-        return pattern.lower() in str(field_value).lower()
+        if type(field_value) is str:
+            return self._needle in field_value.lower()
+        return self._needle in str(field_value).lower()
 
 
 class InSpecification(FilterSpecification):
     """Especificación IN: field IN (value1, value2, ...)"""
     
+    __slots__ = ("_value_set",)
+    
+    selectivity_hint = 0.1
+    
     def __init__(self, field: str, values: List[Any]):
-        super().__init__(field, "in", values)
+        # Tupla: el valor queda congelado y la expresión cacheada es segura
+        super().__init__(field, "in", tuple(values))
+        # Pertenencia O(1); None si algún valor no es hashable
+        try:
+            self._value_set = frozenset(self.value)
+        except TypeError:
+            self._value_set = None
     
     def _compare_values(self, field_value: Any, filter_values: List[Any]) -> bool:
+        value_set = self._value_set
+        if value_set is not None:
+            try:
+                return field_value in value_set
+            except TypeError:
+                # field_value no hashable: búsqueda lineal
+                pass
         return field_value in filter_values
+    
+    def is_satisfied_by_batch(self, candidates: Sequence[T]) -> List[bool]:
+        get = self._get
+        values = self._value_set if self._value_set is not None else self.value
+        try:
+            return [get(candidate) in values for candidate in candidates]
+        except (AttributeError, TypeError):
+            return super().is_satisfied_by_batch(candidates)
 
 
 class BetweenSpecification(FilterSpecification):
     """Especificación BETWEEN: field BETWEEN min_value AND max_value"""
     
+    __slots__ = ("min_value", "max_value", "_empty")
+    
+    selectivity_hint = 0.2
+    
     def __init__(self, field: str, min_value: Any, max_value: Any):
-        super().__init__(field, "between", [min_value, max_value])
+        super().__init__(field, "between", (min_value, max_value))
         self.min_value = min_value
         self.max_value = max_value
+        # Rango invertido (como en SQL, no se intercambian los límites): con
+        # números o strings ningún candidato puede cumplirlo
+        self._empty = (
+            (isinstance(min_value, (int, float)) and isinstance(max_value, (int, float))
+             or isinstance(min_value, str) and isinstance(max_value, str))
+            and min_value > max_value
+        )
+    
+    def is_satisfied_by(self, candidate: T) -> bool:
+        if self._empty:
+            return False
+        return super().is_satisfied_by(candidate)
     
     def _compare_values(self, field_value: Any, filter_value: List[Any]) -> bool:
+        # try sin coste en el camino feliz (CPython 3.11+): solo protege
+        # de valores no comparables (None, tipos mezclados)
         try:
             return self.min_value <= field_value <= self.max_value
         except TypeError:
             return False
+    
+    def to_mask(self, columns: Mapping[str, Sequence[Any]]) -> List[bool]:
+        if self._empty:
+            return [False] * _row_count(columns)
+        return super().to_mask(columns)
+    
+    def is_satisfied_by_batch(self, candidates: Sequence[T]) -> List[bool]:
+        if self._empty:
+            return [False] * len(candidates)
+        get = self._get
+        min_value = self.min_value
+        max_value = self.max_value
+        try:
+            return [
+                min_value <= get(candidate) <= max_value
+                for candidate in candidates
+            ]
+        except (AttributeError, TypeError):
+            # Campos ausentes o no comparables: evaluación entidad a entidad
+            return super().is_satisfied_by_batch(candidates)
 
 
 class IsNullSpecification(FilterSpecification):
     """Especificación IS NULL: field IS NULL"""
     
+    __slots__ = ()
+    
+    selectivity_hint = 0.5
+    
     def __init__(self, field: str):
         super().__init__(field, "is_null", None)
     
@@ -174,6 +352,10 @@ class IsNullSpecification(FilterSpecification):
 class IsNotNullSpecification(FilterSpecification):
     """Especificación IS NOT NULL: field IS NOT NULL"""
     
+    __slots__ = ()
+    
+    selectivity_hint = 0.5
+    
     def __init__(self, field: str):
         super().__init__(field, "is_not_null", None)
     
@@ -181,7 +363,31 @@ class IsNotNullSpecification(FilterSpecification):
         return field_value is not None
 
 
+def _row_count(columns: Mapping[str, Sequence[Any]]) -> int:
+    for column in columns.values():
+        return len(column)
+    return 0
+
+
 # Factory para crear especificaciones
+# Las comprobaciones de nulidad solo dependen del campo y son inmutables:
+# se comparte una instancia por campo entre queries
+@lru_cache(maxsize=256)
+def _make_is_null(field: str) -> IsNullSpecification:
+    return IsNullSpecification(field)
+
+
+@lru_cache(maxsize=256)
+def _make_is_not_null(field: str) -> IsNotNullSpecification:
+    return IsNotNullSpecification(field)
+
+
+def _create_between(field: str, value: Any) -> BetweenSpecification:
+    if not isinstance(value, (list, tuple)) or len(value) != 2:
+        raise ValueError("BETWEEN operator requires list/tuple with 2 values")
+    return BetweenSpecification(field, value[0], value[1])
+
+
 class SpecificationFactory:
     """
     Factory para crear especificaciones basado en operadores string.
@@ -200,6 +406,15 @@ class SpecificationFactory:
         "is_null": IsNullSpecification,
         "is_not_null": IsNotNullSpecification,
     }
+    # Conjunto inmutable para comprobar pertenencia en O(1)
+    _operators_set = frozenset(_operators)
+    # operador -> constructor (field, value): una búsqueda y una llamada por filtro
+    _constructors = {
+        **_operators,
+        "between": _create_between,
+        "is_null": lambda field, value: _make_is_null(field),
+        "is_not_null": lambda field, value: _make_is_not_null(field),
+    }
     
     @classmethod
     def create(cls, field: str, operator: str, value: Any) -> FilterSpecification:
@@ -217,22 +432,32 @@ class SpecificationFactory:
         Raises:
             ValueError: Si el operador no es soportado
         """
-        if operator not in cls._operators:
-            raise ValueError(f"Unsupported operator: {operator}. Supported: {list(cls._operators.keys())}")
+        try:
+            constructor = cls._constructors[operator]
+        except KeyError:
+            raise ValueError(f"Unsupported operator: {operator}. Supported: {list(cls._operators.keys())}") from None
         
-        spec_class = cls._operators[operator]
+        return constructor(field, value)
+    
+    @classmethod
+    def constructor_for(cls, operator: str) -> Callable[[str, Any], FilterSpecification]:
+        """
+        Retorna el constructor (field, value) de un operador.
         
-        # Casos especiales
-        if operator == "between":
-            if not isinstance(value, (list, tuple)) or len(value) != 2:
-                raise ValueError("BETWEEN operator requires list/tuple with 2 values")
-            return spec_class(field, value[0], value[1])
-        elif operator in ("is_null", "is_not_null"):
-            return spec_class(field)
-        else:
-            return spec_class(field, value)
+        Raises:
+            ValueError: Si el operador no es soportado
+        """
+        try:
+            return cls._constructors[operator]
+        except KeyError:
+            raise ValueError(f"Unsupported operator: {operator}. Supported: {list(cls._operators.keys())}") from None
     
     @classmethod
     def supported_operators(cls) -> List[str]:
         """Retorna lista de operadores soportados."""
-        return list(cls._operators.keys())
\ No newline at end of file
+        return list(cls._operators.keys())
+    
+    @classmethod
+    def supported_operators_set(cls) -> FrozenSet[str]:
+        """Retorna los operadores soportados como frozenset (pertenencia O(1))."""
+        return cls._operators_set
\ No newline at end of file
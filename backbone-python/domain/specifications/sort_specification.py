@@ -12,6 +12,9 @@ class SortDirection(str, Enum):
     DESC = "desc"
 
 
+_DIRECTIONS = {"asc": SortDirection.ASC, "desc": SortDirection.DESC}
+
+
 class SortSpecification:
     """
     Especificación para ordenamiento de resultados.
@@ -19,6 +22,8 @@ class SortSpecification:
     Permite especificar múltiples campos con diferentes direcciones.
     """
     
+    __slots__ = ("_direction", "_criterion")
+    
     def __init__(self, field: str, direction: SortDirection = SortDirection.ASC):
         """
         Inicializa especificación de ordenamiento.
@@ -27,9 +32,31 @@ class SortSpecification:
             field: Campo por el cual ordenar
             direction: Dirección del ordenamiento (asc/desc)
         """
-        self.field = field
+        # El criterio (field, "asc"/"desc") se calcula al asignar en lugar
+        # de resolver el enum en cada query
+        self._criterion = (field, None)
         self.direction = direction
     
+    @property
+    def field(self) -> str:
+        """Campo por el cual ordenar."""
+        return self._criterion[0]
+    
+    @field.setter
+    def field(self, field: str) -> None:
+        self._criterion = (field, self._criterion[1])
+    
+    @property
+    def direction(self) -> SortDirection:
+        """Dirección del ordenamiento."""
+        return self._direction
+    
+    @direction.setter
+    def direction(self, direction: SortDirection) -> None:
+        self._direction = direction
+        direction_str = direction.value if isinstance(direction, SortDirection) else str(direction).lower()
+        self._criterion = (self._criterion[0], direction_str)
+    
     def to_expression(self) -> dict:
         """
         Convierte a formato genérico para adaptadores.
@@ -37,9 +64,10 @@ class SortSpecification:
         Returns:
             Dict con información de ordenamiento
         """
+        field, direction = self._criterion
         return {
-            "field": self.field,
-            "direction": self.direction.value
+            "field": field,
+            "direction": direction
         }
     
     def to_sort_criteria(self) -> List[Tuple[str, str]]:
@@ -49,13 +77,13 @@ class SortSpecification:
         Returns:
             List of (field, direction) tuples
         """
-        return [(self.field, self.direction.value)]
+        return [self._criterion]
     
     def __str__(self) -> str:
-        return f"{self.field} {self.direction.value.upper()}"
+        return f"{self.field} {self._criterion[1].upper()}"
     
     def __repr__(self) -> str:
-        return f"SortSpecification(field='{self.field}', direction='{self.direction.value}')"
+        return f"SortSpecification(field='{self.field}', direction='{self._criterion[1]}')"
 
 
 class MultipleSortSpecification:
@@ -65,6 +93,8 @@ class MultipleSortSpecification:
     Permite ordenar por múltiples campos con diferentes direcciones.
     """
     
+    __slots__ = ("sorts",)
+    
     def __init__(self, sorts: Optional[List[SortSpecification]] = None):
         """
         Inicializa especificación de ordenamiento múltiple.
@@ -104,11 +134,11 @@ class MultipleSortSpecification:
         Returns:
             List of (field, direction) tuples
         """
-        return [(sort.field, sort.direction.value) for sort in self.sorts]
+        return [sort._criterion for sort in self.sorts]
     
     def is_empty(self) -> bool:
         """Verifica si no hay ordenamientos definidos."""
-        return len(self.sorts) == 0
+        return not self.sorts
     
     def __len__(self) -> int:
         return len(self.sorts)
@@ -145,6 +175,18 @@ class SortParser:
             - "created_at,desc" -> created_at DESC
             - "name,asc" -> name ASC
         """
+        single = self._parse_single(sort_str)
+        if single is None:
+            return None
+        return MultipleSortSpecification([single])
+    
+    def _parse_single(self, sort_str: Optional[str]) -> Optional[SortSpecification]:
+        """
+        Parsea un único "field[,direction]" sin envolverlo.
+        
+        Returns:
+            Especificación de ordenamiento o None si no hay campo
+        """
         if not sort_str or not sort_str.strip():
             return None
         
@@ -154,24 +196,21 @@ class SortParser:
         if not field:
             return None
         
-        # Determinar dirección
+        # Determinar dirección (la búsqueda valida y resuelve el enum a la vez)
         if len(parts) > 1:
             direction_str = parts[1].strip().lower()
-            if direction_str not in ("asc", "desc"):
+            direction = _DIRECTIONS.get(direction_str)
+            if direction is None:
                 raise InvalidValueObjectException(
                     message=f"Dirección de ordenamiento inválida: '{direction_str}'. Usar 'asc' o 'desc'",
                     value_object_type="SortDirection",
                     invalid_value=direction_str,
                     code=11003012
                 )
-            direction = SortDirection(direction_str)
         else:
             direction = SortDirection.ASC
         
-        # Crear especificación
-        spec = MultipleSortSpecification()
-        spec.add_sort(field, direction)
-        return spec
+        return SortSpecification(field, direction)
     
     def parse_multiple_sorts(self, sorts: List[str]) -> Optional[MultipleSortSpecification]:
         """
@@ -189,16 +228,11 @@ class SortParser:
         if not sorts:
             return None
         
-        spec = MultipleSortSpecification()
-        
-        for sort_str in sorts:
-            single_spec = self.parse_sort(sort_str)
-            if single_spec and not single_spec.is_empty():
-                # Agregar el primer sort de la especificación single
-                sort_item = single_spec.sorts[0]
-                spec.add_sort(sort_item.field, sort_item.direction)
+        parse_single = self._parse_single
+        parsed = [parse_single(sort_str) for sort_str in sorts]
+        items = [sort_item for sort_item in parsed if sort_item is not None]
         
-        return spec if not spec.is_empty() else None
+        return MultipleSortSpecification(items) if items else None
     
     def validate_sort_field(self, field: str, allowed_fields: List[str]) -> bool:
         """
@@ -1,40 +1,70 @@
 """
 Infrastructure Layer - External dependencies and adapters
 """
+import importlib
+from typing import TYPE_CHECKING
+
 # Configuration
 from .configuration import get_config
 
-# Logging
-from .logging.structured_logger import StructuredLogger
-
-# Event System
-from .messaging import (
-    KafkaEventBusAdapter,
-    RabbitMQEventBusAdapter,
-    RedisEventBusAdapter,
-    EventBusAdapterFactory
-)
-from .persistence.event_store import JsonFileEventStore, InMemoryEventStore
-
-# Testing
-from .testing import BaseTestCase, MockRepository
+if TYPE_CHECKING:
+    from .logging.structured_logger import StructuredLogger
+    from .persistence.event_store import JsonFileEventStore, InMemoryEventStore
+    from .messaging import (
+        KafkaEventBusAdapter,
+        RabbitMQEventBusAdapter,
+        RedisEventBusAdapter,
+        EventBusAdapterFactory
+    )
+    from .testing import BaseTestCase, MockRepository
 
 __all__ = [
     # Configuration
     "get_config",
-    
+
     # Logging
     "StructuredLogger",
-    
+
     # Event System
     "KafkaEventBusAdapter",
-    "RabbitMQEventBusAdapter", 
+    "RabbitMQEventBusAdapter",
     "RedisEventBusAdapter",
     "EventBusAdapterFactory",
     "JsonFileEventStore",
     "InMemoryEventStore",
-    
+
     # Testing
     "BaseTestCase",
     "MockRepository"
-]
\ No newline at end of file
+]
+
+# Solo la configuración se carga al importar el paquete; el resto (logging,
+# event store, adaptadores de mensajería con aiokafka/aio-pika/aioredis y
+# utilidades de testing) se importa al accederlo.
+_EXPORTS = {
+    "StructuredLogger": ".logging.structured_logger",
+    "JsonFileEventStore": ".persistence.event_store",
+    "InMemoryEventStore": ".persistence.event_store",
+    "KafkaEventBusAdapter": ".messaging",
+    "RabbitMQEventBusAdapter": ".messaging",
+    "RedisEventBusAdapter": ".messaging",
+    "EventBusAdapterFactory": ".messaging",
+    "BaseTestCase": ".testing",
+    "MockRepository": ".testing",
+}
+
+
+def __getattr__(name: str):
+    """Importa perezosamente los componentes de infraestructura (PEP 562)."""
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -2,11 +2,9 @@
 Infrastructure Configuration Package
 """
 
+from typing import TYPE_CHECKING
+
 from .base_config import (
-    BaseAppConfig,
-    TestingConfig,
-    DevelopmentConfig,
-    ProductionConfig,
     Environment,
     LogLevel,
     DatabaseType,
@@ -18,6 +16,9 @@ from .base_config import (
     get_feature_flags
 )
 
+if TYPE_CHECKING:
+    from .settings import BaseAppConfig, TestingConfig, DevelopmentConfig, ProductionConfig
+
 __all__ = [
     # Configuration classes
     "BaseAppConfig",
@@ -39,4 +40,22 @@ __all__ = [
     
     # Global config instance
     "get_config"
-]
\ No newline at end of file
+]
+
+
+# Las clases de configuración importan pydantic: se resuelven al accederlas
+_SETTINGS_CLASSES = frozenset({
+    "BaseAppConfig",
+    "TestingConfig",
+    "DevelopmentConfig",
+    "ProductionConfig",
+})
+
+
+def __getattr__(name: str):
+    if name in _SETTINGS_CLASSES:
+        from . import settings
+        value = getattr(settings, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,272 @@
+"""
+Settings - Clases de configuración con Pydantic Settings
+
+Se importa al primer acceso desde base_config: cargar pydantic no forma
+parte del import del paquete de configuración.
+"""
+from functools import cached_property
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping
+try:
+    from pydantic_settings import BaseSettings
+    from pydantic import Field, model_validator
+    
+    _PYDANTIC_V1 = False
+    
+    def _cross_field_validator(check):
+        """Validador de modelo (Pydantic v2): una pasada tras validar los campos."""
+        def validate(self):
+            check(self.__dict__)
+            return self
+        return model_validator(mode='after')(validate)
+except ImportError:
+    try:
+        # Fallback for older Pydantic versions
+        from pydantic import BaseSettings, Field, root_validator
+        
+        _PYDANTIC_V1 = True
+        
+        def _cross_field_validator(check):
+            """Validador de modelo (Pydantic v1) sobre el dict de valores."""
+            def validate(cls, values):
+                check(values)
+                return values
+            return root_validator(skip_on_failure=True, allow_reuse=True)(validate)
+    except ImportError:
+        # If pydantic-settings is not available, create a mock
+        _PYDANTIC_V1 = False
+        
+        class BaseSettings:
+            def __init__(self, **kwargs):
+                for key, value in kwargs.items():
+                    setattr(self, key, value)
+        
+        def Field(**kwargs):
+            return None
+        
+        def _cross_field_validator(check):
+            return staticmethod(check)
+
+from .base_config import LogLevel, Environment, DatabaseType
+
+
+def _check_cross_fields(values: Dict[str, Any]) -> None:
+    """
+    Valida las reglas que dependen de varios campos.
+    
+    Corrige values in place (log level, page size) o lanza ValueError.
+    """
+    if values.get('environment') == Environment.PRODUCTION:
+        # Debug debe ser False en producción
+        if values.get('debug'):
+            raise ValueError('Debug should be False in production')
+        # Validar CORS origins
+        if "*" in (values.get('cors_origins') or ()):
+            raise ValueError('CORS origins should not include "*" in production')
+        # En producción, log level no debe ser DEBUG
+        if values.get('log_level') == LogLevel.DEBUG:
+            values['log_level'] = LogLevel.INFO
+    
+    # Default page size debe ser menor que max page size
+    max_page_size = values.get('max_page_size', 100)
+    default_page_size = values.get('default_page_size')
+    if default_page_size is not None and default_page_size > max_page_size:
+        values['default_page_size'] = max_page_size
+
+
+class BaseAppConfig(BaseSettings):
+    """
+    Configuración base de la aplicación.
+    
+    Utiliza Pydantic Settings para cargar configuración
+    desde variables de entorno, archivos .env, etc.
+    """
+    
+    # === Configuración de aplicación ===
+    app_name: str = Field(default="Backbone App", env="APP_NAME")
+    app_version: str = Field(default="1.0.0", env="APP_VERSION")
+    environment: Environment = Field(default=Environment.DEVELOPMENT, env="ENVIRONMENT")
+    debug: bool = Field(default=True, env="DEBUG")
+    secret_key: str = Field(env="SECRET_KEY", min_length=32)
+    
+    # === Configuración de API ===
+    api_prefix: str = Field(default="/api/v1", env="API_PREFIX")
+    api_port: int = Field(default=8000, env="API_PORT", ge=1, le=65535)
+    api_host: str = Field(default="0.0.0.0", env="API_HOST")
+    cors_origins: List[str] = Field(default=["*"], env="CORS_ORIGINS")
+    
+    # === Configuración de logging ===
+    log_level: LogLevel = Field(default=LogLevel.INFO, env="LOG_LEVEL")
+    log_format: str = Field(default="json", env="LOG_FORMAT")  # json, text
+    log_file_path: Optional[str] = Field(default=None, env="LOG_FILE_PATH")
+    
+    # === Configuración de base de datos ===
+    database_type: DatabaseType = Field(default=DatabaseType.POSTGRESQL, env="DATABASE_TYPE")
+    database_url: str = Field(env="DATABASE_URL")
+    database_pool_size: int = Field(default=10, env="DATABASE_POOL_SIZE", ge=1)
+    database_max_overflow: int = Field(default=20, env="DATABASE_MAX_OVERFLOW", ge=0)
+    database_echo: bool = Field(default=False, env="DATABASE_ECHO")
+    
+    # === Configuración de Redis (opcional) ===
+    redis_url: Optional[str] = Field(default=None, env="REDIS_URL")
+    redis_timeout: int = Field(default=10, env="REDIS_TIMEOUT", ge=1)
+    
+    # === Configuración de seguridad ===
+    jwt_secret_key: str = Field(env="JWT_SECRET_KEY", min_length=32)
+    jwt_algorithm: str = Field(default="HS256", env="JWT_ALGORITHM")
+    jwt_expiration_minutes: int = Field(default=60, env="JWT_EXPIRATION_MINUTES", ge=1)
+    
+    # === Configuración de observabilidad ===
+    enable_metrics: bool = Field(default=True, env="ENABLE_METRICS")
+    enable_tracing: bool = Field(default=False, env="ENABLE_TRACING")
+    metrics_port: int = Field(default=9090, env="METRICS_PORT", ge=1, le=65535)
+    
+    # === Configuración específica del negocio ===
+    max_page_size: int = Field(default=100, env="MAX_PAGE_SIZE", ge=1, le=1000)
+    default_page_size: int = Field(default=20, env="DEFAULT_PAGE_SIZE", ge=1)
+    request_timeout: int = Field(default=30, env="REQUEST_TIMEOUT", ge=1)
+    
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        case_sensitive = False
+        
+        if _PYDANTIC_V1:
+            # Pydantic v1 trataría los cached_property como campos
+            keep_untouched = (cached_property,)
+        
+        # Para campos sensibles, usar SecretStr en producción
+        # secrets_dir = "/run/secrets"  # Para Docker secrets
+    
+    # Reglas entre campos en un único validador de modelo
+    cross_field_validation = _cross_field_validator(_check_cross_fields)
+    
+    @property
+    def is_development(self) -> bool:
+        """Verifica si está en desarrollo."""
+        return self.environment == Environment.DEVELOPMENT
+    
+    @property
+    def is_testing(self) -> bool:
+        """Verifica si está en testing."""
+        return self.environment == Environment.TESTING
+    
+    @property
+    def is_production(self) -> bool:
+        """Verifica si está en producción."""
+        return self.environment == Environment.PRODUCTION
+    
+    # Las vistas derivadas se construyen una vez por instancia (la
+    # configuración no cambia tras cargarse); los get_*_config devuelven
+    # copias mutables por compatibilidad
+    
+    @cached_property
+    def database_config(self) -> Mapping[str, Any]:
+        """Configuración específica de base de datos (solo lectura)."""
+        config = {
+            "url": self.database_url,
+            "echo": self.database_echo,
+        }
+        
+        if self.database_type in (DatabaseType.POSTGRESQL, DatabaseType.MYSQL):
+            config.update({
+                "pool_size": self.database_pool_size,
+                "max_overflow": self.database_max_overflow,
+                "pool_pre_ping": True,
+                "pool_recycle": 3600,  # 1 hora
+            })
+        
+        return MappingProxyType(config)
+    
+    @cached_property
+    def logging_config(self) -> Mapping[str, Any]:
+        """Configuración de logging estructurado (solo lectura)."""
+        return MappingProxyType({
+            "level": self.log_level.value,
+            "format": self.log_format,
+            "file_path": self.log_file_path,
+            "structured": True,
+            "include_timestamp": True,
+            "include_request_id": True,
+        })
+    
+    @cached_property
+    def api_config(self) -> Mapping[str, Any]:
+        """Configuración de API (solo lectura)."""
+        return MappingProxyType({
+            "host": self.api_host,
+            "port": self.api_port,
+            "prefix": self.api_prefix,
+            "cors_origins": self.cors_origins,
+            "debug": self.debug,
+            "docs_url": "/docs" if not self.is_production else None,
+            "redoc_url": "/redoc" if not self.is_production else None,
+        })
+    
+    @cached_property
+    def security_config(self) -> Mapping[str, Any]:
+        """Configuración de seguridad (solo lectura)."""
+        return MappingProxyType({
+            "jwt_secret": self.jwt_secret_key,
+            "jwt_algorithm": self.jwt_algorithm,
+            "jwt_expiration": self.jwt_expiration_minutes,
+            "secret_key": self.secret_key,
+        })
+    
+    def get_database_config(self) -> Dict[str, Any]:
+        """Obtiene configuración específica de base de datos."""
+        return dict(self.database_config)
+    
+    def get_logging_config(self) -> Dict[str, Any]:
+        """Obtiene configuración de logging estructurado."""
+        return dict(self.logging_config)
+    
+    def get_api_config(self) -> Dict[str, Any]:
+        """Obtiene configuración de API."""
+        return dict(self.api_config)
+    
+    def get_security_config(self) -> Dict[str, Any]:
+        """Obtiene configuración de seguridad."""
+        return dict(self.security_config)
+
+
+class TestingConfig(BaseAppConfig):
+    """Configuración específica para testing."""
+    
+    environment: Environment = Environment.TESTING
+    debug: bool = True
+    database_url: str = "sqlite:///:memory:"  # Base de datos en memoria
+    database_echo: bool = False
+    log_level: LogLevel = LogLevel.WARNING  # Menos verbose en tests
+    
+    # Overrides para testing
+    jwt_expiration_minutes: int = 5  # Tokens cortos para tests
+    max_page_size: int = 10  # Páginas pequeñas para tests
+    
+    class Config(BaseAppConfig.Config):
+        env_file = ".env.test"
+
+
+class DevelopmentConfig(BaseAppConfig):
+    """Configuración específica para desarrollo."""
+    
+    environment: Environment = Environment.DEVELOPMENT
+    debug: bool = True
+    log_level: LogLevel = LogLevel.DEBUG
+    database_echo: bool = True  # Ver queries SQL en desarrollo
+    
+    class Config(BaseAppConfig.Config):
+        env_file = ".env.dev"
+
+
+class ProductionConfig(BaseAppConfig):
+    """Configuración específica para producción."""
+    
+    environment: Environment = Environment.PRODUCTION
+    debug: bool = False
+    log_level: LogLevel = LogLevel.INFO
+    cors_origins: List[str] = []  # Debe ser configurado explícitamente
+    database_echo: bool = False
+    
+    class Config(BaseAppConfig.Config):
+        env_file = ".env.prod"
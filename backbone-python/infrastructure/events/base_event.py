@@ -2,19 +2,101 @@
 Base Event System - Event system for microservices
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, TypeVar, Generic, Type
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Generic, Type, Union
 from datetime import datetime, timezone
 from dataclasses import dataclass
-import uuid
+from functools import lru_cache
+from operator import attrgetter
 import json
+import sys
+
+from ...domain.exceptions.base_kernel_exception import _RID_POOL
+
+try:
+    import orjson
+    _orjson_available = True
+    # datetimes and dataclasses go through default=str, as with json.dumps,
+    # so the output does not depend on whether orjson is installed
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+except ImportError:
+    _orjson_available = False
+
+try:
+    from ciso8601 import parse_datetime as _parse_timestamp
+except ImportError:
+    _parse_timestamp = datetime.fromisoformat
 
 
 T = TypeVar('T')
 
+# Event ids come from the shared entropy pool (one os.urandom read per 256
+# ids, reset after fork) instead of a uuid.uuid4() syscall per event
+_new_event_id = _RID_POOL.next_uuid
+_utcnow = datetime.now
+_UTC = timezone.utc
+
+
+def _identity(payload: Any) -> Any:
+    return payload
+
+
+# Payload type -> serializer, resolved on the first payload of each type
+_PAYLOAD_SERIALIZERS: Dict[type, Callable[[Any], Any]] = {dict: _identity}
+
+
+def _resolve_payload_serializer(payload: Any) -> Callable[[Any], Any]:
+    """Picks the serializer for the payload's type and caches it."""
+    payload_type = type(payload)
+    if hasattr(payload, 'model_dump'):
+        serializer = payload_type.model_dump
+    elif hasattr(payload, 'dict'):
+        serializer = payload_type.dict
+    elif hasattr(payload, '__dict__'):
+        serializer = attrgetter('__dict__')
+    else:
+        serializer = _identity
+    _PAYLOAD_SERIALIZERS[payload_type] = serializer
+    return serializer
+
+
+class _LazyTimestamp:
+    """
+    Wraps the `timestamp` slot of EventMetadata.
+    
+    The slot may hold the ISO-8601 string the metadata was stored with;
+    it is parsed on first read and the datetime is written back.
+    """
+    
+    __slots__ = ("_slot",)
+    
+    def __init__(self, slot: Any):
+        self._slot = slot
+    
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        timestamp = self._slot.__get__(instance, owner)
+        if type(timestamp) is str:
+            timestamp = _parse_timestamp(timestamp)
+            self._slot.__set__(instance, timestamp)
+        return timestamp
+    
+    def __set__(self, instance: Any, value: Union[datetime, str]) -> None:
+        self._slot.__set__(instance, value)
+
 
-@dataclass
+@dataclass(slots=True)
 class EventMetadata:
-    """Event metadata for traceability."""
+    """
+    Event metadata for traceability.
+    
+    The timestamp may be kept as the ISO-8601 string it was stored with
+    (see from_dict); it is parsed on first access.
+    """
     event_id: str
     timestamp: datetime
     source_service: str
@@ -26,9 +108,11 @@ class EventMetadata:
     
     def to_dict(self) -> Dict[str, Any]:
         """Converts metadata to dictionary."""
+        timestamp = _timestamp_slot.__get__(self)
         return {
             "event_id": self.event_id,
-            "timestamp": self.timestamp.isoformat(),
+            # Still unparsed: re-emit the stored string as-is
+            "timestamp": timestamp if type(timestamp) is str else timestamp.isoformat(),
             "source_service": self.source_service,
             "correlation_id": self.correlation_id,
             "trace_id": self.trace_id,
@@ -39,10 +123,15 @@ class EventMetadata:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'EventMetadata':
-        """Creates metadata from dictionary."""
+        """
+        Creates metadata from dictionary.
+        
+        The timestamp string is not parsed here: replaying an event store
+        only pays for the timestamps that are actually read.
+        """
         return cls(
             event_id=data["event_id"],
-            timestamp=datetime.fromisoformat(data["timestamp"]),
+            timestamp=data["timestamp"],
             source_service=data["source_service"],
             correlation_id=data.get("correlation_id"),
             trace_id=data.get("trace_id"),
@@ -52,6 +141,11 @@ class EventMetadata:
         )
 
 
+# Reads of `timestamp` go through _LazyTimestamp; to_dict reads the raw slot
+_timestamp_slot = EventMetadata.timestamp
+EventMetadata.timestamp = _LazyTimestamp(_timestamp_slot)
+
+
 class BaseEvent(ABC, Generic[T]):
     """
     Base event for the event system.
@@ -60,6 +154,22 @@ class BaseEvent(ABC, Generic[T]):
     and provide a typed payload.
     """
     
+    # _dict_cache/_json_cache stay unset until the first serialization
+    __slots__ = ("payload", "event_type", "metadata", "_dict_cache", "_json_cache")
+    
+    # Extra attributes a subclass adds to to_dict(); merged along the MRO
+    # into _extra_fields once per class (see __init_subclass__)
+    _serialized_fields: Tuple[str, ...] = ()
+    _extra_fields: Tuple[str, ...] = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._extra_fields = tuple(dict.fromkeys(
+            name
+            for klass in reversed(cls.__mro__)
+            for name in klass.__dict__.get("_serialized_fields", ())
+        ))
+    
     def __init__(
         self,
         payload: T,
@@ -71,10 +181,12 @@ class BaseEvent(ABC, Generic[T]):
         request_id: Optional[str] = None
     ):
         self.payload = payload
-        self.event_type = event_type
+        # Event types read back from JSON (stores, brokers) are fresh strings;
+        # interning them makes handler-registry lookups identity hits
+        self.event_type = sys.intern(event_type) if type(event_type) is str else event_type
         self.metadata = EventMetadata(
-            event_id=str(uuid.uuid4()),
-            timestamp=datetime.now(timezone.utc),
+            event_id=_new_event_id(),
+            timestamp=_utcnow(_UTC),
             source_service=source_service,
             correlation_id=correlation_id,
             trace_id=trace_id,
@@ -96,23 +208,65 @@ class BaseEvent(ABC, Generic[T]):
         """
         Serializes complete event to dictionary.
         
+        Events are treated as immutable once serialized: the dictionary is
+        built on the first call and shared afterwards, so it must not be
+        modified.
+        
         Returns:
             Dictionary with complete event
         """
-        return {
+        try:
+            return self._dict_cache
+        except AttributeError:
+            data = self._dict_cache = self._build_dict()
+            return data
+    
+    def _build_dict(self) -> Dict[str, Any]:
+        """
+        Builds the serialized form of the event.
+        
+        Subclasses list extra attributes in _serialized_fields, or extend
+        this method (not to_dict) for computed fields.
+        """
+        data = {
             "event_type": self.event_type,
             "payload": self._serialize_payload(),
             "metadata": self.metadata.to_dict()
         }
+        for name in self._extra_fields:
+            data[name] = getattr(self, name)
+        return data
     
     def to_json(self) -> str:
         """
         Serializes event to JSON.
         
+        Uses orjson when installed, falling back to the stdlib encoder.
+        Values neither encoder supports natively are serialized with str().
+        
         Returns:
             JSON string of the event
         """
-        return json.dumps(self.to_dict(), default=str)
+        try:
+            return self._json_cache
+        except AttributeError:
+            pass
+        data = self.to_dict()
+        encoded = None
+        if _orjson_available:
+            try:
+                encoded = orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode()
+            except TypeError:
+                # orjson.JSONEncodeError, e.g. ints beyond 64 bits: the
+                # stdlib encoder handles them
+                pass
+        if encoded is None:
+            # Same compact, non-ASCII-escaped layout orjson produces
+            encoded = json.dumps(
+                data, default=str, separators=(",", ":"), ensure_ascii=False
+            )
+        self._json_cache = encoded
+        return encoded
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any], payload_class: Type[T]) -> 'BaseEvent[T]':
@@ -162,12 +316,11 @@ class BaseEvent(ABC, Generic[T]):
         
         Override this method for complex payloads.
         """
-        if hasattr(self.payload, 'dict'):
-            return self.payload.dict()
-        elif hasattr(self.payload, '__dict__'):
-            return self.payload.__dict__
-        else:
-            return self.payload
+        payload = self.payload
+        serializer = _PAYLOAD_SERIALIZERS.get(type(payload))
+        if serializer is None:
+            serializer = _resolve_payload_serializer(payload)
+        return serializer(payload)
     
     def __str__(self) -> str:
         return f"{self.event_type}({self.event_id})"
@@ -179,6 +332,8 @@ class BaseEvent(ABC, Generic[T]):
 class DomainEvent(BaseEvent[T]):
     """Domain event - represents something that happened in the business."""
     
+    __slots__ = ()
+    
     def __init__(self, payload: T, event_type: str, **kwargs):
         super().__init__(payload, event_type, **kwargs)
 
@@ -186,6 +341,9 @@ class DomainEvent(BaseEvent[T]):
 class IntegrationEvent(BaseEvent[T]):
     """Integration event - for communication between microservices."""
     
+    __slots__ = ("target_service",)
+    _serialized_fields = ("target_service",)
+    
     def __init__(
         self,
         payload: T,
@@ -195,26 +353,23 @@ class IntegrationEvent(BaseEvent[T]):
     ):
         super().__init__(payload, event_type, **kwargs)
         self.target_service = target_service
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Includes target_service in serialization."""
-        data = super().to_dict()
-        data["target_service"] = self.target_service
-        return data
 
 
 class SystemEvent(BaseEvent[T]):
     """System event - for technical/infrastructure events."""
     
+    __slots__ = ("severity",)
+    _serialized_fields = ("severity",)
+    
     def __init__(self, payload: T, event_type: str, severity: str = "INFO", **kwargs):
         super().__init__(payload, event_type, **kwargs)
         self.severity = severity
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Includes severity in serialization."""
-        data = super().to_dict()
-        data["severity"] = self.severity
-        return data
+
+
+@lru_cache(maxsize=512)
+def _entity_event_type(entity_type: str, action: str) -> str:
+    """Builds (and interns) the "<entity>.<action>" event type once per entity type."""
+    return sys.intern(f"{entity_type.lower()}.{action}")
 
 
 # Common predefined events
@@ -222,6 +377,8 @@ class SystemEvent(BaseEvent[T]):
 class UserCreatedEvent(DomainEvent[Dict[str, Any]]):
     """Event: User created."""
     
+    __slots__ = ()
+    
     def __init__(self, user_data: Dict[str, Any], **kwargs):
         super().__init__(
             payload=user_data,
@@ -233,6 +390,8 @@ class UserCreatedEvent(DomainEvent[Dict[str, Any]]):
 class UserUpdatedEvent(DomainEvent[Dict[str, Any]]):
     """Event: User updated."""
     
+    __slots__ = ()
+    
     def __init__(self, user_data: Dict[str, Any], **kwargs):
         super().__init__(
             payload=user_data,
@@ -244,6 +403,8 @@ class UserUpdatedEvent(DomainEvent[Dict[str, Any]]):
 class UserDeletedEvent(DomainEvent[Dict[str, Any]]):
     """Event: User deleted."""
     
+    __slots__ = ()
+    
     def __init__(self, user_id: str, reason: Optional[str] = None, **kwargs):
         super().__init__(
             payload={"user_id": user_id, "reason": reason},
@@ -255,10 +416,12 @@ class UserDeletedEvent(DomainEvent[Dict[str, Any]]):
 class EntityCreatedEvent(DomainEvent[Dict[str, Any]]):
     """Generic event: Entity created."""
     
+    __slots__ = ()
+    
     def __init__(self, entity_type: str, entity_data: Dict[str, Any], **kwargs):
         super().__init__(
             payload={"entity_type": entity_type, "data": entity_data},
-            event_type=f"{entity_type.lower()}.created",
+            event_type=_entity_event_type(entity_type, "created"),
             **kwargs
         )
 
@@ -266,10 +429,12 @@ class EntityCreatedEvent(DomainEvent[Dict[str, Any]]):
 class EntityUpdatedEvent(DomainEvent[Dict[str, Any]]):
     """Generic event: Entity updated."""
     
+    __slots__ = ()
+    
     def __init__(self, entity_type: str, entity_data: Dict[str, Any], **kwargs):
         super().__init__(
             payload={"entity_type": entity_type, "data": entity_data},
-            event_type=f"{entity_type.lower()}.updated",
+            event_type=_entity_event_type(entity_type, "updated"),
             **kwargs
         )
 
@@ -277,9 +442,11 @@ class EntityUpdatedEvent(DomainEvent[Dict[str, Any]]):
 class EntityDeletedEvent(DomainEvent[Dict[str, Any]]):
     """Generic event: Entity deleted."""
     
+    __slots__ = ()
+    
     def __init__(self, entity_type: str, entity_id: str, **kwargs):
         super().__init__(
             payload={"entity_type": entity_type, "entity_id": entity_id},
-            event_type=f"{entity_type.lower()}.deleted",
+            event_type=_entity_event_type(entity_type, "deleted"),
             **kwargs
         )
\ No newline at end of file
@@ -1,17 +1,46 @@
 """
 Messaging Infrastructure - Event bus adapters for different message brokers
 """
-from .kafka_adapter import KafkaEventBusAdapter
-from .rabbitmq_adapter import RabbitMQEventBusAdapter
-from .redis_adapter import RedisEventBusAdapter
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .kafka_adapter import KafkaEventBusAdapter
+    from .rabbitmq_adapter import RabbitMQEventBusAdapter
+    from .redis_adapter import RedisEventBusAdapter
+
+# Cada adaptador vive en su propio submódulo y se importa solo al accederlo,
+# así usar Kafka no carga aio-pika ni aioredis.
+_ADAPTER_MODULES = {
+    "KafkaEventBusAdapter": ".kafka_adapter",
+    "RabbitMQEventBusAdapter": ".rabbitmq_adapter",
+    "RedisEventBusAdapter": ".redis_adapter",
+}
 
 __all__ = [
     "KafkaEventBusAdapter",
     "RabbitMQEventBusAdapter", 
-    "RedisEventBusAdapter"
+    "RedisEventBusAdapter",
+    "EventBusAdapterFactory"
 ]
 
 
+def __getattr__(name: str):
+    """Importa perezosamente los adaptadores de mensajería (PEP 562)."""
+    try:
+        module_name = _ADAPTER_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
 class EventBusAdapterFactory:
     """Factory for creating event bus adapters."""
     
@@ -23,6 +52,7 @@ class EventBusAdapterFactory:
         logger=None
     ) -> "KafkaEventBusAdapter":
         """Creates Kafka event bus adapter."""
+        from .kafka_adapter import KafkaEventBusAdapter
         return KafkaEventBusAdapter(bootstrap_servers, topic_prefix, group_id, logger)
     
     @staticmethod
@@ -33,6 +63,7 @@ class EventBusAdapterFactory:
         logger=None
     ) -> "RabbitMQEventBusAdapter":
         """Creates RabbitMQ event bus adapter."""
+        from .rabbitmq_adapter import RabbitMQEventBusAdapter
         return RabbitMQEventBusAdapter(connection_url, exchange_name, queue_prefix, logger)
     
     @staticmethod
@@ -42,6 +73,7 @@ class EventBusAdapterFactory:
         logger=None
     ) -> "RedisEventBusAdapter":
         """Creates Redis event bus adapter."""
+        from .redis_adapter import RedisEventBusAdapter
         return RedisEventBusAdapter(redis_url, channel_prefix, logger)
     
     @staticmethod
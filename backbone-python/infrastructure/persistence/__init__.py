@@ -3,7 +3,7 @@ Infrastructure Persistence Layer
 """
 
 # Repositorio base y UnitOfWork
-from ...domain.repositories.base_repository import IRepository, BaseRepository
+from ...domain.repositories.base_repository import IRepository, BaseRepository, SequentialSaveAllMixin
 from ...domain.repositories.unit_of_work import IUnitOfWork, BaseUnitOfWork
 
 # Adaptadores - importación condicional desde el paquete adapters
@@ -30,27 +30,28 @@ except ImportError:
     _mongodb_available = False
 
 # Exportar contratos base siempre
-__all__ = [
+__all__ = (
     "IRepository",
     "BaseRepository", 
+    "SequentialSaveAllMixin",
     "IUnitOfWork",
-    "BaseUnitOfWork"
-]
+    "BaseUnitOfWork",
+)
 
 # Exportar adaptadores solo si están disponibles
 if _sqlalchemy_available:
-    __all__.extend([
+    __all__ += (
         "SQLAlchemyRepository",
         "SQLAlchemyUnitOfWork",
-        "SQLAlchemySpecificationTranslator"
-    ])
+        "SQLAlchemySpecificationTranslator",
+    )
 
 if _mongodb_available:
-    __all__.extend([
+    __all__ += (
         "MongoDBRepository", 
         "MongoDBUnitOfWork",
-        "MongoDBSpecificationTranslator"
-    ])
+        "MongoDBSpecificationTranslator",
+    )
 
 # Funciones de utilidad
 def is_sqlalchemy_adapter_available() -> bool:
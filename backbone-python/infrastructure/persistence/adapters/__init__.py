@@ -24,21 +24,21 @@ except ImportError:
     _mongodb_available = False
 
 # Exportar solo los adaptadores disponibles
-__all__ = []
+__all__ = ()
 
 if _sqlalchemy_available:
-    __all__.extend([
+    __all__ += (
         "SQLAlchemyRepository",
         "SQLAlchemyUnitOfWork", 
-        "SQLAlchemySpecificationTranslator"
-    ])
+        "SQLAlchemySpecificationTranslator",
+    )
 
 if _mongodb_available:
-    __all__.extend([
+    __all__ += (
         "MongoDBRepository",
         "MongoDBUnitOfWork",
-        "MongoDBSpecificationTranslator"
-    ])
+        "MongoDBSpecificationTranslator",
+    )
 
 # Funciones de utilidad para verificar disponibilidad
 def is_sqlalchemy_available() -> bool:
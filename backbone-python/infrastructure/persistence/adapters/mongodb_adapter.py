@@ -3,14 +3,14 @@ MongoDB Adapter - Adaptador para MongoDB con Motor (PyMongo Async)
 """
 from typing import TypeVar, Generic, Optional, List, Any, Dict, Type, Union
 from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING, InsertOne, ReplaceOne
 from pymongo.errors import PyMongoError
 from bson import ObjectId
 from bson.errors import InvalidId
 import re
 from ...domain.repositories.base_repository import BaseRepository, IRepository
 from ...domain.repositories.unit_of_work import BaseUnitOfWork, IUnitOfWork
-from ...domain.specifications.base_specification import Specification
+from ...domain.specifications.base_specification import Specification, OpExpr
 from ...domain.specifications.sort_specification import MultipleSortSpecification, SortDirection
 from ..exceptions.infrastructure_exceptions import DatabaseException
 
@@ -53,30 +53,26 @@ class MongoDBSpecificationTranslator:
         Returns:
             Filtro MongoDB
         """
-        if "operator" in expression:
+        if isinstance(expression, OpExpr):
             # Es una expresión compuesta (AND, OR, NOT)
             return self._translate_composite(expression)
+        elif "field" not in expression:
+            # Expresión compuesta en formato dict (legacy)
+            return self._translate_composite(OpExpr.from_dict(expression))
         else:
             # Es una expresión de filtro simple
             return self._translate_filter(expression)
     
-    def _translate_composite(self, expression: Dict[str, Any]) -> Dict[str, Any]:
+    def _translate_composite(self, expression: OpExpr) -> Dict[str, Any]:
         """Traduce expresión compuesta."""
-        operator = expression["operator"]
-        
-        if operator == "AND":
-            left = self._translate_expression(expression["left"])
-            right = self._translate_expression(expression["right"])
-            return {"$and": [left, right]}
+        operator, operands = expression
         
-        elif operator == "OR":
-            left = self._translate_expression(expression["left"])
-            right = self._translate_expression(expression["right"])
-            return {"$or": [left, right]}
+        if operator == "NOT":
+            return {"$not": self._translate_expression(operands[0])}
         
-        elif operator == "NOT":
-            spec_expr = self._translate_expression(expression["spec"])
-            return {"$not": spec_expr}
+        elif operator in ("AND", "OR"):
+            clauses = [self._translate_expression(operand) for operand in operands]
+            return {"$and" if operator == "AND" else "$or": clauses}
         
         else:
             raise ValueError(f"Unsupported composite operator: {operator}")
@@ -158,7 +154,7 @@ class MongoDBRepository(BaseRepository[T, ID]):
         self,
         database: AsyncIOMotorDatabase,
         collection_name: str,
-        entity_class: Type[T]
+        entity_class: Optional[Type[T]] = None
     ):
         super().__init__(entity_class)
         self.database = database
@@ -181,7 +177,7 @@ class MongoDBRepository(BaseRepository[T, ID]):
         if "_id" in doc and isinstance(doc["_id"], ObjectId):
             doc["_id"] = str(doc["_id"])
         
-        return self.entity_class(**doc) if hasattr(self.entity_class, '__init__') else doc
+        return self.entity_class(**doc)
     
     def _to_document(self, entity: T) -> Dict[str, Any]:
         """
@@ -351,6 +347,42 @@ class MongoDBRepository(BaseRepository[T, ID]):
                 original_error=str(e)
             )
     
+    async def save_all(self, entities: List[T]) -> List[T]:
+        """
+        Guarda múltiples entidades en un solo bulk_write.
+        
+        Igual que `save`: documentos con _id se reemplazan (upsert) y
+        los demás se insertan.
+        """
+        if not entities:
+            return []
+        
+        try:
+            docs = [self._to_document(entity) for entity in entities]
+            operations = []
+            for doc in docs:
+                if doc.get("_id") is not None:
+                    # ReplaceOne guarda su propia copia: el reemplazo no lleva _id
+                    replacement = {k: v for k, v in doc.items() if k != "_id"}
+                    operations.append(
+                        ReplaceOne({"_id": doc["_id"]}, replacement, upsert=True)
+                    )
+                else:
+                    doc.pop("_id", None)
+                    # pymongo asigna el _id generado al documento en bulk_write
+                    operations.append(InsertOne(doc))
+            
+            await self.collection.bulk_write(operations, ordered=True)
+            return [self._to_entity(doc) for doc in docs]
+            
+        except PyMongoError as e:
+            raise DatabaseException(
+                message="Error saving entities",
+                operation="save_all",
+                table=self.collection_name,
+                original_error=str(e)
+            )
+    
     async def delete(self, entity: T) -> None:
         """Elimina entidad."""
         try:
@@ -368,6 +400,28 @@ class MongoDBRepository(BaseRepository[T, ID]):
                 original_error=str(e)
             )
     
+    async def _delete_by_id_native(self, entity_id: ID) -> int:
+        """Elimina por _id con un único delete_one."""
+        try:
+            # Convertir a ObjectId si es string
+            query_id = entity_id
+            if isinstance(entity_id, str):
+                try:
+                    query_id = ObjectId(entity_id)
+                except InvalidId:
+                    pass  # Dejar como string
+            
+            result = await self.collection.delete_one({"_id": query_id})
+            return result.deleted_count
+            
+        except PyMongoError as e:
+            raise DatabaseException(
+                message=f"Error deleting entity by ID: {entity_id}",
+                operation="delete_by_id",
+                table=self.collection_name,
+                original_error=str(e)
+            )
+    
     async def delete_by_specification(
         self,
         spec: Specification[T]
@@ -396,8 +450,11 @@ class MongoDBUnitOfWork(BaseUnitOfWork):
     operaciones batch y tracking de cambios.
     """
     
-    def __init__(self, database: AsyncIOMotorDatabase):
-        super().__init__()
+    # commit() solo ejecuta las operaciones registradas
+    _skip_empty_commit = True
+    
+    def __init__(self, database: AsyncIOMotorDatabase, max_pending: Optional[int] = None):
+        super().__init__(max_pending)
         self.database = database
         self._session = None
         self._repositories: Dict[str, MongoDBRepository] = {}
@@ -482,7 +539,7 @@ class MongoDBUnitOfWork(BaseUnitOfWork):
         # Operaciones agrupadas por colección
         collections_ops = {}
         
-        for entity in self._new_entities:
+        for entity in self.iter_new():
             collection_name = self._get_collection_name(entity)
             if collection_name not in collections_ops:
                 collections_ops[collection_name] = {"inserts": [], "updates": [], "deletes": []}
@@ -491,11 +548,11 @@ class MongoDBUnitOfWork(BaseUnitOfWork):
             repo = self._get_repository_for_entity(entity)
             await repo.save(entity)
         
-        for entity in self._dirty_entities:
+        for entity in self.iter_dirty():
             repo = self._get_repository_for_entity(entity)
             await repo.save(entity)
         
-        for entity in self._removed_entities:
+        for entity in self.iter_removed():
             repo = self._get_repository_for_entity(entity)
             await repo.delete(entity)
     
@@ -4,11 +4,11 @@ SQLAlchemy Adapter - Adaptador para SQLAlchemy ORM
 from typing import TypeVar, Generic, Optional, List, Any, Dict, Type
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import select, func, update, delete, and_, or_, not_
+from sqlalchemy import select, func, update, delete, and_, or_, not_, inspect
 from sqlalchemy.exc import SQLAlchemyError
 from ...domain.repositories.base_repository import BaseRepository, IRepository
 from ...domain.repositories.unit_of_work import BaseUnitOfWork, IUnitOfWork
-from ...domain.specifications.base_specification import Specification
+from ...domain.specifications.base_specification import Specification, OpExpr
 from ...domain.specifications.sort_specification import MultipleSortSpecification, SortDirection
 from ..exceptions.infrastructure_exceptions import DatabaseException
 
@@ -51,30 +51,26 @@ class SQLAlchemySpecificationTranslator:
         Returns:
             Clausula SQLAlchemy
         """
-        if "operator" in expression:
+        if isinstance(expression, OpExpr):
             # Es una expresión compuesta (AND, OR, NOT)
             return self._translate_composite(expression)
+        elif "field" not in expression:
+            # Expresión compuesta en formato dict (legacy)
+            return self._translate_composite(OpExpr.from_dict(expression))
         else:
             # Es una expresión de filtro simple
             return self._translate_filter(expression)
     
-    def _translate_composite(self, expression: Dict[str, Any]) -> Any:
+    def _translate_composite(self, expression: OpExpr) -> Any:
         """Traduce expresión compuesta."""
-        operator = expression["operator"]
-        
-        if operator == "AND":
-            left = self._translate_expression(expression["left"])
-            right = self._translate_expression(expression["right"])
-            return and_(left, right)
+        operator, operands = expression
         
-        elif operator == "OR":
-            left = self._translate_expression(expression["left"])
-            right = self._translate_expression(expression["right"])
-            return or_(left, right)
+        if operator == "NOT":
+            return not_(self._translate_expression(operands[0]))
         
-        elif operator == "NOT":
-            spec_expr = self._translate_expression(expression["spec"])
-            return not_(spec_expr)
+        elif operator in ("AND", "OR"):
+            clauses = [self._translate_expression(operand) for operand in operands]
+            return and_(*clauses) if operator == "AND" else or_(*clauses)
         
         else:
             raise ValueError(f"Unsupported composite operator: {operator}")
@@ -161,7 +157,7 @@ class SQLAlchemyRepository(BaseRepository[T, ID]):
         model_class: Type[T],
         entity_class: Type[T] = None
     ):
-        super().__init__(entity_class or model_class)
+        super().__init__(entity_class or self.ENTITY_CLASS or model_class)
         self.session = session
         self.model_class = model_class
         self.translator = SQLAlchemySpecificationTranslator(model_class)
@@ -295,6 +291,27 @@ class SQLAlchemyRepository(BaseRepository[T, ID]):
                 original_error=str(e)
             )
     
+    async def save_all(self, entities: List[T]) -> List[T]:
+        """
+        Guarda múltiples entidades con un único flush.
+        
+        A diferencia de `save`, no hace refresh por entidad: los IDs
+        generados quedan asignados tras el flush, pero los valores por
+        defecto calculados en el servidor no se recargan.
+        """
+        try:
+            self.session.add_all(entities)
+            await self.session.flush()
+            return list(entities)
+            
+        except SQLAlchemyError as e:
+            raise DatabaseException(
+                message="Error saving entities",
+                operation="save_all",
+                table=self.model_class.__tablename__,
+                original_error=str(e)
+            )
+    
     async def delete(self, entity: T) -> None:
         """Elimina entidad."""
         try:
@@ -308,6 +325,28 @@ class SQLAlchemyRepository(BaseRepository[T, ID]):
                 original_error=str(e)
             )
     
+    async def _delete_by_id_native(self, entity_id: ID) -> int:
+        """
+        DELETE por clave primaria en un solo round trip.
+        
+        Igual que delete_by_specification, es un DELETE directo: no
+        aplica cascadas ORM sobre entidades cargadas en la sesión.
+        """
+        try:
+            pk_column = inspect(self.model_class).primary_key[0]
+            query = delete(self.model_class).where(pk_column == entity_id)
+            
+            result = await self.session.execute(query)
+            return result.rowcount or 0
+            
+        except SQLAlchemyError as e:
+            raise DatabaseException(
+                message=f"Error deleting entity by ID: {entity_id}",
+                operation="delete_by_id",
+                table=self.model_class.__tablename__,
+                original_error=str(e)
+            )
+    
     async def delete_by_specification(
         self,
         spec: Specification[T]
@@ -337,8 +376,11 @@ class SQLAlchemyUnitOfWork(BaseUnitOfWork):
     de múltiples entidades.
     """
     
-    def __init__(self, session: AsyncSession):
-        super().__init__()
+    # Sin cambios registrados, __aexit__ confirma la transacción directamente
+    _skip_empty_commit = True
+    
+    def __init__(self, session: AsyncSession, max_pending: Optional[int] = None):
+        super().__init__(max_pending)
         self.session = session
         self._transaction = None
     
@@ -362,15 +404,15 @@ class SQLAlchemyUnitOfWork(BaseUnitOfWork):
         """Confirma cambios."""
         try:
             # Procesar entidades registradas
-            for entity in self._new_entities:
+            for entity in self.iter_new():
                 self.session.add(entity)
             
-            for entity in self._dirty_entities:
+            for entity in self.iter_dirty():
                 # SQLAlchemy detecta cambios automáticamente si la entidad
                 # está en la sesión, sino la agregamos
                 self.session.add(entity)
             
-            for entity in self._removed_entities:
+            for entity in self.iter_removed():
                 await self.session.delete(entity)
             
             # Commit de la transacción
@@ -2,8 +2,8 @@
 Mock Repository - Implementación de repositorio para testing
 """
 from typing import TypeVar, Generic, Optional, List, Dict, Any, Type
-from ...domain.repositories.base_repository import BaseRepository
-from ...domain.specifications.base_specification import Specification
+from ...domain.repositories.base_repository import BaseRepository, SequentialSaveAllMixin
+from ...domain.specifications.base_specification import Specification, OpExpr
 from ...domain.specifications.sort_specification import MultipleSortSpecification
 
 
@@ -11,7 +11,7 @@ T = TypeVar('T')
 ID = TypeVar('ID')
 
 
-class MockRepository(BaseRepository[T, ID]):
+class MockRepository(SequentialSaveAllMixin, BaseRepository[T, ID]):
     """
     Repositorio en memoria para testing.
     
@@ -20,7 +20,7 @@ class MockRepository(BaseRepository[T, ID]):
     persistencia sin dependencias externas.
     """
     
-    def __init__(self, entity_class: Type[T]):
+    def __init__(self, entity_class: Optional[Type[T]] = None):
         super().__init__(entity_class)
         self._data: Dict[ID, T] = {}
         self._next_id: int = 1
@@ -95,32 +95,45 @@ class MockRepository(BaseRepository[T, ID]):
             # Si no se puede evaluar, asumir que no cumple
             return False
     
+    def _filter_by_specification(self, spec: Optional[Specification[T]]) -> List[T]:
+        """
+        Filtra las entidades almacenadas por especificación.
+        
+        Usa la evaluación por lotes cuando la especificación la soporta;
+        los errores de la especificación se propagan.
+        """
+        entities = list(self._data.values())
+        if spec is None:
+            return entities
+        
+        filter_many = getattr(spec, 'filter_many', None)
+        if filter_many is not None:
+            return filter_many(entities)
+        
+        return [entity for entity in entities if self._matches_specification(entity, spec)]
+    
     def _evaluate_expression(self, entity: T, expression: Dict[str, Any]) -> bool:
         """Evalúa expresión contra entidad."""
-        if "operator" in expression:
+        if isinstance(expression, OpExpr):
             # Expresión compuesta
             return self._evaluate_composite(entity, expression)
+        elif "field" not in expression:
+            # Expresión compuesta en formato dict (legacy)
+            return self._evaluate_composite(entity, OpExpr.from_dict(expression))
         else:
             # Expresión de filtro simple
             return self._evaluate_filter(entity, expression)
     
-    def _evaluate_composite(self, entity: T, expression: Dict[str, Any]) -> bool:
+    def _evaluate_composite(self, entity: T, expression: OpExpr) -> bool:
         """Evalúa expresión compuesta."""
-        operator = expression["operator"]
+        operator, operands = expression
         
-        if operator == "AND":
-            left_result = self._evaluate_expression(entity, expression["left"])
-            right_result = self._evaluate_expression(entity, expression["right"])
-            return left_result and right_result
+        if operator == "NOT":
+            return not self._evaluate_expression(entity, operands[0])
         
-        elif operator == "OR":
-            left_result = self._evaluate_expression(entity, expression["left"])
-            right_result = self._evaluate_expression(entity, expression["right"])
-            return left_result or right_result
-        
-        elif operator == "NOT":
-            spec_result = self._evaluate_expression(entity, expression["spec"])
-            return not spec_result
+        elif operator in ("AND", "OR"):
+            results = (self._evaluate_expression(entity, operand) for operand in operands)
+            return all(results) if operator == "AND" else any(results)
         
         return False
     
@@ -211,10 +224,7 @@ class MockRepository(BaseRepository[T, ID]):
         sort: Optional[MultipleSortSpecification] = None
     ) -> List[T]:
         """Busca entidades por especificación."""
-        matching_entities = [
-            entity for entity in self._data.values()
-            if self._matches_specification(entity, spec)
-        ]
+        matching_entities = self._filter_by_specification(spec)
         
         if sort:
             matching_entities = self._apply_sort(matching_entities, sort)
@@ -249,12 +259,7 @@ class MockRepository(BaseRepository[T, ID]):
         if spec is None:
             return len(self._data)
         
-        matching_count = sum(
-            1 for entity in self._data.values()
-            if self._matches_specification(entity, spec)
-        )
-        
-        return matching_count
+        return len(self._filter_by_specification(spec))
     
     async def save(self, entity: T) -> T:
         """Guarda entidad."""
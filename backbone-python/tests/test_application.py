@@ -2,6 +2,7 @@
 Test Application Layer - Tests for use cases, services, and event handling system
 """
 import asyncio
+import dataclasses
 import json
 from datetime import datetime, timezone
 from unittest.mock import Mock, AsyncMock
@@ -20,7 +21,10 @@ from backbone import (
     ValidationException,
     AuthorizationException,
     ResourceNotFoundException,
-    ResourceConflictException
+    ResourceConflictException,
+    event_handler,
+    EventHandlerRegistry,
+    RetryPolicy
 )
 
 
@@ -125,6 +129,370 @@ class TestBaseEvent(BaseTestCase):
         self.assertEqual(event.metadata["microservice"], "test-service")
         self.assertEqual(event.metadata["functionality"], "test-function")
     
+    def test_base_event_ids_are_ulids(self):
+        """Test: generated eventId and correlationId are sortable ULIDs"""
+        import time
+        
+        # Arrange
+        crockford = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+        before_ms = time.time_ns() // 1_000_000
+        
+        # Act
+        event = BaseEvent(
+            event_name="TestEvent",
+            source="test-service",
+            data={},
+            microservice="test-service",
+            functionality="test-function"
+        )
+        
+        # Assert
+        for ulid in (event.event_id, event.metadata["correlationId"]):
+            self.assertEqual(len(ulid), 26)
+            value = 0
+            for char in ulid:
+                value = value * 32 + crockford.index(char)
+            self.assertLessEqual(before_ms, value >> 80)
+            self.assertLessEqual(value >> 80, time.time_ns() // 1_000_000)
+        self.assertNotEqual(event.event_id, event.metadata["correlationId"])
+    
+    def test_base_event_ids_uuid4_mode(self):
+        """Test: BACKBONE_EVENT_ID_FORMAT=uuid4 keeps RFC 4122 ids"""
+        import uuid
+        from unittest import mock
+        from backbone.domain.ports import _ids
+        
+        # Arrange & Act
+        with mock.patch.object(_ids, "_UUID4_IDS", True):
+            event = BaseEvent(
+                event_name="TestEvent",
+                source="test-service",
+                data={},
+                microservice="test-service",
+                functionality="test-function"
+            )
+        
+        # Assert
+        self.assertEqual(uuid.UUID(event.event_id).version, 4)
+        self.assertEqual(str(uuid.UUID(event.event_id)), event.event_id)
+        self.assertEqual(uuid.UUID(event.metadata["correlationId"]).version, 4)
+    
+    def test_infrastructure_event_ids(self):
+        """Test: infrastructure events get distinct RFC 4122 v4 ids and UTC timestamps"""
+        import uuid
+        from backbone.infrastructure.events.base_event import UserCreatedEvent
+        
+        # Act
+        events = [UserCreatedEvent({"id": i}, source_service="users") for i in range(300)]
+        
+        # Assert
+        ids = [e.event_id for e in events]
+        self.assertEqual(len(set(ids)), len(ids))
+        for event_id in ids[:3] + ids[-3:]:
+            self.assertEqual(uuid.UUID(event_id).version, 4)
+            self.assertEqual(str(uuid.UUID(event_id)), event_id)
+        self.assertIs(events[0].timestamp.tzinfo, timezone.utc)
+    
+    def test_infrastructure_events_use_slots(self):
+        """Test: infrastructure events and their metadata have no instance __dict__"""
+        from backbone.infrastructure.events.base_event import IntegrationEvent, UserCreatedEvent
+        
+        # Act
+        events = [
+            UserCreatedEvent({"id": 1}, source_service="users"),
+            IntegrationEvent({"id": 1}, "user.synced", target_service="crm", source_service="users"),
+        ]
+        
+        # Assert
+        for event in events:
+            self.assertFalse(hasattr(event, "__dict__"), type(event).__name__)
+            self.assertFalse(hasattr(event.metadata, "__dict__"))
+        self.assertEqual(events[1].to_dict()["target_service"], "crm")
+    
+    def test_infrastructure_event_to_json(self):
+        """Test: infrastructure to_json round-trips with and without orjson"""
+        from decimal import Decimal
+        from unittest import mock
+        from backbone.infrastructure.events import base_event
+        
+        # Arrange
+        created = datetime(2024, 5, 1, 10, 30, tzinfo=timezone.utc)
+        payload = {"name": "Ñandú", "balance": Decimal("1.50"), 1: "x", "created": created}
+        expected = {"name": "Ñandú", "balance": "1.50", "1": "x", "created": str(created)}
+        
+        for orjson_available in (True, False):
+            # Act
+            events = [
+                base_event.UserCreatedEvent(payload, source_service="users"),
+                base_event.UserCreatedEvent({"big": 2 ** 70}, source_service="users"),
+            ]
+            with mock.patch.object(base_event, "_orjson_available", orjson_available):
+                data, big = [json.loads(event.to_json()) for event in events]
+            
+            # Assert
+            self.assertEqual(data["payload"], expected)
+            self.assertEqual(data["metadata"], events[0].metadata.to_dict())
+            self.assertEqual(big["payload"], {"big": 2 ** 70})
+    
+    def test_infrastructure_event_to_json_matches_across_encoders(self):
+        """Test: orjson and the stdlib fallback produce identical JSON text"""
+        from decimal import Decimal
+        from unittest import mock
+        from backbone.infrastructure.events import base_event
+        
+        # Arrange
+        payload = {"name": "José", "balance": Decimal("1.50"), 1: ["x", {"y": None}]}
+        event = base_event.UserCreatedEvent(payload, source_service="users")
+        
+        # Act
+        encoded = []
+        for orjson_available in (True, False):
+            with mock.patch.object(base_event, "_orjson_available", orjson_available):
+                try:
+                    del event._json_cache
+                except AttributeError:
+                    pass
+                encoded.append(event.to_json())
+        
+        # Assert
+        self.assertEqual(encoded[0], encoded[1])
+        self.assertIn('"name":"José"', encoded[1])
+    
+    def test_infrastructure_event_payload_serializers(self):
+        """Test: payloads serialize by type (dict as-is, models via dict(), objects via __dict__)"""
+        from backbone.infrastructure.events.base_event import DomainEvent
+        
+        # Arrange
+        class Model:
+            def __init__(self, name):
+                self.name = name
+            
+            def dict(self):
+                return {"model": self.name}
+        
+        class Plain:
+            def __init__(self, name):
+                self.name = name
+        
+        payloads = [{"name": "a"}, Model("b"), Model("c"), Plain("d"), "raw"]
+        
+        # Act
+        serialized = [DomainEvent(p, "t", source_service="s").to_dict()["payload"] for p in payloads]
+        
+        # Assert
+        self.assertIs(serialized[0], payloads[0])
+        self.assertEqual(serialized[1:], [{"model": "b"}, {"model": "c"}, {"name": "d"}, "raw"])
+    
+    def test_entity_event_types(self):
+        """Test: entity events share one interned event_type string per entity"""
+        from backbone.infrastructure.events.base_event import EntityCreatedEvent, EntityDeletedEvent
+        
+        # Act
+        first = EntityCreatedEvent("Order", {"id": 1}, source_service="orders")
+        second = EntityCreatedEvent("Order", {"id": 2}, source_service="orders")
+        deleted = EntityDeletedEvent("Order", "2", source_service="orders")
+        
+        # Assert
+        self.assertEqual(first.event_type, "order.created")
+        self.assertIs(first.event_type, second.event_type)
+        self.assertEqual(deleted.event_type, "order.deleted")
+    
+    def test_event_type_is_interned(self):
+        """Test: event types decoded from JSON are interned on construction"""
+        import sys
+        from backbone.infrastructure.events import base_event
+        
+        # Arrange
+        decoded = json.loads('{"event_type": "order.shipped"}')["event_type"]
+        
+        # Act
+        event = base_event.DomainEvent({}, decoded, source_service="orders")
+        
+        # Assert
+        self.assertIs(event.event_type, sys.intern("order.shipped"))
+    
+    def test_event_metadata_parses_timestamp_lazily(self):
+        """Test: EventMetadata.from_dict keeps the timestamp string until it is read"""
+        # Arrange
+        stored = {
+            "event_id": "e-1",
+            "timestamp": "2024-05-01T10:30:00+00:00",
+            "source_service": "orders",
+        }
+        
+        # Act
+        metadata = EventMetadata.from_dict(stored)
+        
+        # Assert
+        self.assertEqual(metadata.to_dict()["timestamp"], stored["timestamp"])
+        self.assertEqual(metadata.timestamp, datetime(2024, 5, 1, 10, 30, tzinfo=timezone.utc))
+        self.assertIs(metadata.timestamp, metadata.timestamp)
+        self.assertEqual(metadata.to_dict()["timestamp"], stored["timestamp"])
+        self.assertEqual(metadata, EventMetadata.from_dict(metadata.to_dict()))
+        self.assertFalse(hasattr(metadata, "__dict__"))
+    
+    def test_event_metadata_dataclass_api(self):
+        """Test: replace/asdict/fields expose a parsed `timestamp` field"""
+        # Arrange
+        metadata = EventMetadata.from_dict({
+            "event_id": "e-1",
+            "timestamp": "2024-05-01T10:30:00+00:00",
+            "source_service": "orders",
+        })
+        
+        # Act
+        updated = dataclasses.replace(metadata, user_id="u")
+        as_dict = dataclasses.asdict(updated)
+        
+        # Assert
+        self.assertEqual(
+            [field.name for field in dataclasses.fields(EventMetadata)][:3],
+            ["event_id", "timestamp", "source_service"]
+        )
+        self.assertEqual(updated.user_id, "u")
+        self.assertEqual(updated.timestamp, metadata.timestamp)
+        self.assertNotIn("_timestamp", as_dict)
+        self.assertEqual(as_dict["timestamp"], datetime(2024, 5, 1, 10, 30, tzinfo=timezone.utc))
+        with self.assertRaises(TypeError):
+            EventMetadata(event_id="e-2", source_service="orders")
+    
+    def test_infrastructure_event_serialization_is_cached(self):
+        """Test: to_dict/to_json are built once and subclasses extend the cached dict"""
+        from backbone.infrastructure.events.base_event import SystemEvent
+        
+        # Arrange
+        event = SystemEvent({"disk": "full"}, "disk.alert", severity="ERROR", source_service="ops")
+        
+        # Act
+        first = event.to_dict()
+        
+        # Assert
+        self.assertIs(event.to_dict(), first)
+        self.assertIs(event.to_json(), event.to_json())
+        self.assertEqual(first["severity"], "ERROR")
+        self.assertEqual(json.loads(event.to_json())["severity"], "ERROR")
+    
+    def test_event_subclass_serialized_fields(self):
+        """Test: _serialized_fields accumulate along subclasses, in declaration order"""
+        from backbone.infrastructure.events.base_event import IntegrationEvent
+        
+        # Arrange
+        class TenantEvent(IntegrationEvent):
+            __slots__ = ("tenant",)
+            _serialized_fields = ("tenant",)
+            
+            def __init__(self, tenant, **kwargs):
+                super().__init__({"id": 1}, "tenant.synced", **kwargs)
+                self.tenant = tenant
+        
+        # Act
+        data = TenantEvent("acme", target_service="crm", source_service="users").to_dict()
+        
+        # Assert
+        self.assertEqual(TenantEvent._extra_fields, ("target_service", "tenant"))
+        self.assertEqual(list(data), ["event_type", "payload", "metadata", "target_service", "tenant"])
+        self.assertEqual((data["target_service"], data["tenant"]), ("crm", "acme"))
+    
+    def test_base_event_to_dict_timestamps(self):
+        """Test: to_dict formats each timestamp, before and after status changes"""
+        # Arrange
+        event = BaseEvent(
+            event_name="TestEvent",
+            source="test-service",
+            data={"k": 1},
+            microservice="test-service",
+            functionality="test-function"
+        )
+        
+        # Act
+        created = event.to_dict()
+        event.mark_as_published()
+        published = event.to_dict()
+        
+        # Assert
+        self.assertEqual(created["timestamp"], event.timestamp.isoformat())
+        self.assertEqual(created["createdAt"], created["timestamp"])
+        self.assertEqual(created["updatedAt"], created["timestamp"])
+        self.assertEqual(published["createdAt"], created["createdAt"])
+        self.assertEqual(published["updatedAt"], event.updated_at.isoformat())
+        self.assertEqual(published["status"], "published")
+        self.assertEqual(json.loads(event.to_json()), published)
+        
+        event.data = {"name": "Ñandú", 1: "int key"}
+        self.assertEqual(json.loads(event.to_json())["data"], {"name": "Ñandú", "1": "int key"})
+        from unittest import mock
+        from backbone.domain.ports import event_bus
+        for orjson_available in (True, False):
+            with mock.patch.object(event_bus, "_orjson_available", orjson_available):
+                encoded = event.to_json()
+            self.assertEqual(json.loads(encoded)["data"], {"name": "Ñandú", "1": "int key"})
+            self.assertIn("Ñandú", encoded)
+        
+        event.data = {"big": 2 ** 70}
+        for orjson_available in (True, False):
+            with mock.patch.object(event_bus, "_orjson_available", orjson_available):
+                self.assertEqual(json.loads(event.to_json())["data"], {"big": 2 ** 70})
+    
+    def test_make_batch(self):
+        """Test: make_batch builds events equivalent to the constructor"""
+        # Arrange
+        specs = [
+            {
+                "event_name": f"Event{i}",
+                "source": "test-service",
+                "data": {"i": i},
+                "microservice": "test-service",
+                "functionality": "batch"
+            }
+            for i in range(3)
+        ]
+        specs[1]["correlation_id"] = "corr-1"
+        
+        # Act
+        events = BaseEvent.make_batch(specs)
+        
+        # Assert
+        self.assertEqual([e.event_name for e in events], ["Event0", "Event1", "Event2"])
+        self.assertEqual(events[1].metadata["correlationId"], "corr-1")
+        ids = [e.event_id for e in events] + [events[0].metadata["correlationId"]]
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertTrue(all(e.created_at is events[0].timestamp for e in events))
+        self.assertTrue(all(e.is_valid() and e.status == "created" for e in events))
+        with self.assertRaises(TypeError):
+            DomainEvent.make_batch(specs)
+        with self.assertRaises(TypeError):
+            BaseEvent.make_batch([{**specs[0], "corelation_id": "typo"}])
+    
+    def test_make_batch_matches_constructor(self):
+        """Test: make_batch sets every slot exactly as the constructor does"""
+        import inspect
+        from backbone.domain.ports import event_bus
+        
+        # Arrange
+        spec = {
+            "event_name": "UserCreated",
+            "source": "users-service",
+            "data": {"user_id": "1"},
+            "microservice": "users-service",
+            "functionality": "create-user",
+            "correlation_id": "corr-1",
+            "event_version": "2.0",
+            "event_id": "evt-1",
+        }
+        
+        # Act
+        expected = BaseEvent(**spec)
+        [event] = BaseEvent.make_batch([spec])
+        
+        # Assert
+        params = set(inspect.signature(BaseEvent.__init__).parameters) - {"self"}
+        self.assertEqual(event_bus._EVENT_INIT_PARAMS, params)
+        for name in BaseEvent.__slots__:
+            if name in ("timestamp", "created_at", "updated_at"):
+                self.assertIs(type(getattr(event, name)), type(getattr(expected, name)))
+            else:
+                self.assertEqual(getattr(event, name), getattr(expected, name), name)
+    
     def test_event_status_transitions(self):
         """Test: Event status transitions work correctly"""
         # Arrange
@@ -162,12 +530,19 @@ class TestBaseEvent(BaseTestCase):
         
         # Assert
         self.assertTrue(event.is_valid())
+        self.assertIs(event.is_valid(), True)
         
         # Test with required fields
         self.assertIsNotNone(event.event_name)
         self.assertIsNotNone(event.source)
         self.assertIsNotNone(event.metadata.get("microservice"))
         self.assertIsNotNone(event.metadata.get("functionality"))
+        
+        # Missing or empty metadata invalidates the event
+        event.metadata["functionality"] = ""
+        self.assertIs(event.is_valid(), False)
+        event.metadata = {}
+        self.assertIs(event.is_valid(), False)
     
     def test_domain_event_specialization(self):
         """Test: DomainEvent has proper domain-specific fields"""
@@ -187,6 +562,22 @@ class TestBaseEvent(BaseTestCase):
         self.assertEqual(domain_event.aggregate_version, 1)
         self.assertEqual(domain_event.event_type, "domain")
     
+    def test_events_use_slots(self):
+        """Test: built-in events have no per-instance __dict__"""
+        # Arrange & Act
+        domain_event = DomainEvent(
+            event_name="UserCreated",
+            source="users-service",
+            data={},
+            microservice="users-service",
+            functionality="create-user"
+        )
+        
+        # Assert
+        self.assertFalse(hasattr(domain_event, "__dict__"))
+        with self.assertRaises(AttributeError):
+            domain_event.unknown_field = 1
+    
     def test_integration_event_specialization(self):
         """Test: IntegrationEvent has proper integration fields"""
         # Arrange & Act
@@ -313,6 +704,172 @@ class TestJsonFileEventStore(BaseTestCase):
             self.fail(f"Failed to save event to file: {e}")
 
 
+# === EVENT HANDLER DECORATOR TESTS ===
+
+class TestEventHandlerDecorator(BaseTestCase):
+    """Test event_handler decorator validation and execution"""
+
+    def _make_event(self, name="UserCreated"):
+        return BaseEvent(
+            event_name=name, source="users-service", data={"user_id": "123"},
+            microservice="users-service", functionality="create-user",
+        )
+
+    def test_valid_event_is_processed(self):
+        """Test: Decorated handler runs and marks event as processed"""
+        received = []
+
+        @event_handler("UserCreated")
+        async def handle(event):
+            received.append(event.event_id)
+
+        event = self._make_event()
+        asyncio.run(handle(event))
+        self.assertEqual(received, [event.event_id])
+        self.assertEqual(event.status, "processed")
+
+    def test_missing_metadata_marks_event_failed(self):
+        """Test: Event without required metadata is rejected before handler runs"""
+        received = []
+
+        @event_handler("UserCreated")
+        async def handle(event):
+            received.append(event.event_id)
+
+        event = self._make_event()
+        event.metadata["correlationId"] = None
+        del event.metadata["functionality"]
+        logger = Mock()
+        asyncio.run(handle(event, logger))
+        self.assertEqual(received, [])
+        self.assertEqual(event.status, "failed")
+        logger.error.assert_called_once()
+        self.assertEqual(
+            logger.error.call_args.kwargs["extra_data"]["missing_metadata"],
+            ["functionality", "correlationId"]
+        )
+
+    def test_retry_until_success(self):
+        """Test: Failing handler is retried according to its retry policy"""
+        attempts = []
+
+        @event_handler("UserCreated", retry_policy=RetryPolicy(max_attempts=3, delay_seconds=0))
+        async def handle(event):
+            attempts.append(event.event_id)
+            if len(attempts) < 3:
+                raise RuntimeError("transient failure")
+
+        event = self._make_event()
+        asyncio.run(handle(event))
+        self.assertEqual(len(attempts), 3)
+        self.assertEqual(event.status, "processed")
+
+    def test_retry_exhausted_raises_application_exception(self):
+        """Test: Handler failing on every attempt raises ApplicationException"""
+        @event_handler("UserCreated", retry_policy=RetryPolicy(max_attempts=2, delay_seconds=0))
+        async def handle(event):
+            raise RuntimeError("permanent failure")
+
+        event = self._make_event()
+        with self.assertRaises(ApplicationException):
+            asyncio.run(handle(event))
+        self.assertEqual(event.status, "failed")
+
+    def test_retry_policy_dict_is_shared(self):
+        """Test: RetryPolicy is immutable and builds its subscribe dict once"""
+        policy = RetryPolicy(max_attempts=5, delay_seconds=2)
+        self.assertIs(policy.as_dict, policy.as_dict)
+        self.assertEqual(policy.as_dict["max_attempts"], 5)
+        with self.assertRaises(AttributeError):
+            policy.max_attempts = 1
+
+    def test_sync_handler_is_rejected_at_decoration(self):
+        """Test: Decorating a non-async handler raises TypeError"""
+        with self.assertRaises(TypeError):
+            @event_handler("UserCreated")
+            def handle(event):
+                pass
+
+    def test_missing_field_marks_event_failed(self):
+        """Test: Event with a missing required field is rejected"""
+        @event_handler("UserCreated")
+        async def handle(event):
+            pass
+
+        event = self._make_event()
+        event.data = None
+        asyncio.run(handle(event))
+        self.assertEqual(event.status, "failed")
+
+    def test_values_equal_to_none_are_not_missing(self):
+        """Test: Required-field check uses identity, not equality, against None"""
+        class EqualsEverything(dict):
+            def __eq__(self, other):
+                return True
+            __hash__ = dict.__hash__
+
+        received = []
+
+        @event_handler("UserCreated")
+        async def handle(event):
+            received.append(event.event_id)
+
+        # Arrange
+        event = self._make_event()
+        event.data = EqualsEverything(user_id="123")
+
+        # Act
+        asyncio.run(handle(event))
+
+        # Assert
+        self.assertEqual(received, [event.event_id])
+        self.assertEqual(event.status, "processed")
+
+
+class TestEventHandlerRegistry(BaseTestCase):
+    """Test automatic registration of decorated handlers"""
+
+    def test_register_object_handlers_skips_properties(self):
+        """Test: Registry finds decorated methods without evaluating properties"""
+        class UserHandlers:
+            @property
+            def broken(self):
+                raise RuntimeError("property must not be evaluated")
+
+            @event_handler("UserCreated")
+            async def on_created(self, event):
+                pass
+
+            async def not_a_handler(self, event):
+                pass
+
+        class AuditHandlers(UserHandlers):
+            @event_handler("UserDeleted")
+            async def on_deleted(self, event):
+                pass
+
+        handlers = AuditHandlers()
+        event_bus = AsyncMock()
+        registry = EventHandlerRegistry(event_bus)
+        asyncio.run(registry.register_handlers(handlers))
+
+        self.assertEqual(event_bus.subscribe.await_count, 2)
+        subscribed_policies = [call.args[2] for call in event_bus.subscribe.await_args_list]
+        self.assertEqual(subscribed_policies, [None, None])
+        self.assertEqual(
+            registry.get_registered_handlers(),
+            {"UserDeleted": ["on_deleted"], "UserCreated": ["on_created"]}
+        )
+
+        self.assertIs(registry.get_registered_handlers(), registry.get_registered_handlers())
+        self.assertEqual(registry.get_handlers("UserCreated"), (handlers.on_created,))
+        self.assertEqual(registry.get_handlers("Unknown"), ())
+
+        asyncio.run(registry.unregister_handlers(handlers))
+        self.assertEqual(event_bus.unsubscribe.await_count, 2)
+        self.assertEqual(registry.get_registered_handlers(), {})
+
+
 # === APPLICATION EXCEPTION TESTS ===
 
 class TestApplicationExceptions(BaseTestCase):
@@ -333,6 +890,36 @@ class TestApplicationExceptions(BaseTestCase):
         self.assertEqual(exception.details["use_case"], "CreateUserUseCase")
         self.assertTrue(str(exception.code).startswith("10"))  # Application layer
     
+    def test_application_code_ranges(self):
+        """Test: legacy 10XXXXXX and 9-digit 12XXXXXXX codes are accepted"""
+        # Arrange, Act & Assert
+        for code in (10000000, 10999999, 120000000, 129999999):
+            self.assertEqual(UseCaseException("x", "uc", code=code).code, code)
+        for code in (9999999, 11000000, 12000000, 119999999, 130000000):
+            with self.assertRaises(ValueError):
+                UseCaseException("x", "uc", code=code)
+    
+    def test_subclass_init_is_typed_and_cooperative(self):
+        """Test: subclass __init__ keeps annotations and goes through super()"""
+        # Arrange
+        calls = []
+        
+        class TracingException(ApplicationException):
+            def __init__(self, code, message, **kwargs):
+                calls.append(code)
+                super().__init__(code, message, **kwargs)
+        
+        class TracedUseCaseException(UseCaseException, TracingException):
+            pass
+        
+        # Act
+        exception = TracedUseCaseException("x", "uc")
+        
+        # Assert
+        self.assertEqual(UseCaseException.__init__.__annotations__["use_case_name"], str)
+        self.assertEqual(calls, [10001001])
+        self.assertEqual(exception.details, {"use_case": "uc"})
+    
     def test_validation_exception_with_field_errors(self):
         """Test: ValidationException includes field-specific errors"""
         # Arrange & Act
@@ -400,6 +987,42 @@ class TestApplicationExceptions(BaseTestCase):
         self.assertIn("conflict_value", exception.details)
         self.assertEqual(exception.details["conflict_value"], "alice@example.com")
         self.assertEqual(exception.http_code, 409)
+    
+    def test_application_error_codes_are_ints(self):
+        """Test: ApplicationErrorCodes members behave as plain int codes"""
+        from backbone.application.exceptions import ApplicationErrorCodes
+        
+        exception = ResourceNotFoundException(
+            message="User not found",
+            resource_type="user",
+            resource_id="42",
+            code=ApplicationErrorCodes.USER_NOT_FOUND
+        )
+        
+        self.assertEqual(exception.code, 10004002)
+        self.assertIsInstance(ApplicationErrorCodes.USER_NOT_FOUND, int)
+        self.assertEqual(ApplicationErrorCodes(10004002).name, "USER_NOT_FOUND")
+        self.assertEqual(json.dumps(exception.to_error_contract()["error_code"]), "10004002")
+    
+    def test_exception_details_merge_with_caller_details(self):
+        """Test: Subclass fields merge into caller details without mutating them"""
+        # Arrange
+        caller_details = {"request": "abc"}
+        
+        # Act
+        exception = AuthorizationException(
+            message="Forbidden",
+            required_permission="users:write",
+            details=caller_details
+        )
+        
+        # Assert
+        self.assertEqual(
+            exception.details,
+            {"request": "abc", "required_permission": "users:write"}
+        )
+        self.assertEqual(caller_details, {"request": "abc"})
+        self.assertNotIn("user_id", exception.details)
 
 
 # === APPLICATION SERVICE TESTS ===
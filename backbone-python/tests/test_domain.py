@@ -28,6 +28,7 @@ from backbone import (
     SortDirection,
     BaseTestCase
 )
+from backbone.domain.specifications import OpExpr
 
 
 # === MOCK ENTITIES FOR TESTING ===
@@ -64,6 +65,40 @@ class TestDomainExceptions(BaseTestCase):
         self.assertIsNotNone(exception.rid)
         self.assertEqual(exception.http_code, 500)  # default value
     
+    def test_rid_is_unique_hex(self):
+        """Test: RIDs are 32-char hex and unique across pool refills"""
+        # Arrange & Act
+        rids = [BaseKernelException(code=11001001, message="x").rid for _ in range(600)]
+        
+        # Assert
+        self.assertEqual(len(set(rids)), len(rids))
+        for rid in rids:
+            self.assertEqual(len(rid), 32)
+            int(rid, 16)
+    
+    def test_timestamp_is_lazy_iso_string(self):
+        """Test: timestamp is formatted on first access and stays stable"""
+        # Arrange
+        exception = BaseKernelException(code=11001001, message="x")
+        self.assertNotIn("timestamp", exception.__dict__)
+        
+        # Act
+        first = exception.timestamp
+        
+        # Assert
+        self.assertEqual(first, exception.to_log_format()["timestamp"])
+        self.assertIsNone(datetime.fromisoformat(first).tzinfo)
+    
+    def test_code_range_validation(self):
+        """Test: kernel and domain ranges are still enforced"""
+        # Arrange, Act & Assert
+        with self.assertRaises(ValueError):
+            BaseKernelException(code=1234, message="x")
+        with self.assertRaises(ValueError):
+            DomainException(code=10001001, message="x")
+        with self.assertRaises(ValueError):
+            BusinessRuleViolationException("x", rule_name="r", code=12001001)
+    
     def test_domain_exception_with_correct_layer_code(self):
         """Test: DomainException uses correct 11 layer code"""
         # Arrange & Act
@@ -76,6 +111,141 @@ class TestDomainExceptions(BaseTestCase):
         self.assertTrue(str(exception.code).startswith("11"))
         self.assertEqual(exception.http_code, 400)  # Domain exceptions default to 400
     
+    def test_layer_name_and_code(self):
+        """Test: layer properties and log format agree"""
+        # Arrange & Act
+        exception = DomainException(code=11001001, message="x")
+        log_data = exception.to_log_format()
+        
+        # Assert
+        self.assertEqual(exception.layer_code, 11)
+        self.assertEqual(exception.layer_name, "Domain")
+        self.assertEqual(log_data["layer_code"], 11)
+        self.assertEqual(log_data["layer_name"], "Domain")
+        self.assertEqual(BaseKernelException(code=99001001, message="x").layer_name, "Unknown")
+    
+    def test_subclass_details_do_not_mutate_caller_dict(self):
+        """Test: subclass detail fields are merged into a new dict"""
+        # Arrange
+        caller_details = {"user_id": "u-1"}
+        
+        # Act
+        exception = InvalidEntityStateException(
+            message="Invalid state",
+            entity_type="Trip",
+            entity_id="t-1",
+            current_state="completed",
+            required_state="active",
+            details=caller_details
+        )
+        
+        # Assert
+        self.assertEqual(caller_details, {"user_id": "u-1"})
+        self.assertEqual(exception.details["user_id"], "u-1")
+        self.assertEqual(exception.details["current_state"], "completed")
+        self.assertEqual(exception.http_code, 412)
+    
+    def test_domain_error_codes_enum_and_from_code(self):
+        """Test: DomainErrorCodes is an IntEnum and from_code picks the HTTP code"""
+        from backbone.domain.exceptions import DomainErrorCodes
+        
+        # Arrange & Act
+        underage = DomainException.from_code(DomainErrorCodes.UNDERAGE_USER, "Too young")
+        inactive = DomainException.from_code(DomainErrorCodes.USER_INACTIVE, "Inactive", details={"id": 1})
+        
+        # Assert
+        self.assertEqual(DomainErrorCodes(11001002).name, "UNDERAGE_USER")
+        self.assertEqual(underage.code, 11001002)
+        self.assertEqual(underage.http_code, 400)
+        self.assertEqual(inactive.http_code, 412)
+        self.assertEqual(inactive.details, {"id": 1})
+        self.assertEqual(str(inactive), f"[11002002] Inactive (RID: {inactive.rid})")
+        self.assertEqual(DomainException.from_code(11999999, "Unknown").http_code, 400)
+        with self.assertRaises(ValueError):
+            DomainException.from_code(10001001, "Not a domain code")
+    
+    def test_invalid_value_object_stores_value_as_string(self):
+        """Test: invalid_value is recorded as a string for any input type"""
+        # Arrange & Act
+        email_error = InvalidValueObjectException("Bad email", "Email", "not-an-email")
+        rating_error = InvalidValueObjectException("Bad rating", "Rating", 7.5)
+        
+        # Assert
+        self.assertEqual(email_error.details["invalid_value"], "not-an-email")
+        self.assertEqual(rating_error.details["invalid_value"], "7.5")
+        self.assertEqual(rating_error.details["value_object_type"], "Rating")
+    
+    def test_exceptions_package_lazy_exports(self):
+        """Test: domain.exceptions resolves exports on demand"""
+        import backbone.domain.exceptions as exceptions_pkg
+        
+        # Assert
+        self.assertIs(exceptions_pkg.DomainException, DomainException)
+        self.assertIn("DomainErrorCodes", dir(exceptions_pkg))
+        with self.assertRaises(AttributeError):
+            exceptions_pkg.NotAnException
+    
+    def test_package_exposes_layer_submodules(self):
+        """Test: backbone resolves its layer subpackages as attributes"""
+        import importlib
+        import backbone
+        
+        # Assert
+        for name in ("domain", "application", "infrastructure", "interfaces"):
+            self.assertIs(getattr(backbone, name), importlib.import_module(f"backbone.{name}"))
+            self.assertIn(name, dir(backbone))
+    
+    def test_package_all_omits_unavailable_persistence(self):
+        """Test: persistence exports are listed in __all__ only if persistence imports"""
+        from unittest import mock
+        import backbone
+        
+        # Arrange
+        saved = vars(backbone).pop("__all__", None)
+        try:
+            # Act
+            with mock.patch.object(backbone, "_persistence", return_value=None):
+                public = backbone.__all__
+            
+            # Assert
+            self.assertIn("FilterParser", public)
+            self.assertNotIn("BaseUnitOfWork", public)
+        finally:
+            vars(backbone).pop("__all__", None)
+            if saved is not None:
+                backbone.__all__ = saved
+    
+    def test_eager_import_tolerates_missing_persistence(self):
+        """Test: BACKBONE_EAGER_IMPORT skips persistence exports when they can't import"""
+        import os
+        import subprocess
+        import sys
+        
+        # Arrange
+        package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        script = (
+            "import importlib.util, sys\n"
+            "sys.modules['backbone.infrastructure.persistence'] = None\n"
+            f"spec = importlib.util.spec_from_file_location('backbone', {os.path.join(package_dir, '__init__.py')!r},"
+            f" submodule_search_locations=[{package_dir!r}])\n"
+            "module = importlib.util.module_from_spec(spec)\n"
+            "sys.modules['backbone'] = module\n"
+            "spec.loader.exec_module(module)\n"
+            "assert 'FilterParser' in vars(module)\n"
+            "assert 'JsonFileEventStore' not in module.__all__\n"
+        )
+        
+        # Act
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            env={**os.environ, "BACKBONE_EAGER_IMPORT": "1"},
+            capture_output=True,
+            text=True,
+        )
+        
+        # Assert
+        self.assertEqual(result.returncode, 0, result.stderr)
+    
     def test_business_rule_exception_inheritance(self):
         """Test: BusinessRuleViolationException inherits from DomainException"""
         # Arrange & Act
@@ -284,6 +454,321 @@ class TestSpecificationPattern(BaseTestCase):
         self.assertIn("Diana", names)
         self.assertIn("Charlie", names)
         self.assertNotIn("Bob", names)  # Bob is 30 and active (doesn't match either condition)
+    
+    def test_and_evaluates_most_selective_side_first(self):
+        """Test: AND short-circuits on the more selective specification"""
+        # Arrange
+        calls = []
+        
+        class TracingSpec(Specification):
+            def __init__(self, name, hint, result):
+                self.name, self.selectivity_hint, self.result = name, hint, result
+            
+            def is_satisfied_by(self, candidate):
+                calls.append(self.name)
+                return self.result
+            
+            def to_expression(self):
+                return {"field": self.name, "operator": "eq", "value": None}
+        
+        spec = TracingSpec("broad", 0.9, True) & TracingSpec("narrow", 0.05, False)
+        
+        # Act
+        result = spec.is_satisfied_by(self.users[0])
+        
+        # Assert
+        self.assertFalse(result)
+        self.assertEqual(calls, ["narrow"])
+        self.assertEqual(spec.to_expression().operands[0]["field"], "broad")
+        self.assertEqual(spec.selectivity_hint, 0.05)
+    
+    def test_to_expression_is_cached(self):
+        """Test: expressions are built once and IN values are frozen"""
+        # Arrange
+        values = ["Alice", "Charlie"]
+        in_spec = InSpecification("name", values)
+        spec = in_spec & GreaterThanSpecification("age", 20)
+        
+        # Act
+        first = spec.to_expression()
+        values.append("Bob")
+        
+        # Assert
+        self.assertIs(spec.to_expression(), first)
+        self.assertIs(first.operands[0], in_spec.to_expression())
+        self.assertEqual(first.operands[0]["value"], ("Alice", "Charlie"))
+    
+    def test_specifications_have_no_instance_dict(self):
+        """Test: built-in specifications use __slots__"""
+        spec = ~(EqualSpecification("name", "Alice") & BetweenSpecification("age", 20, 30))
+        
+        for node in (spec, spec.spec, *spec.spec.children):
+            self.assertFalse(hasattr(node, "__dict__"), type(node).__name__)
+        
+        for sort in (SortSpecification("age"), MultipleSortSpecification()):
+            self.assertFalse(hasattr(sort, "__dict__"), type(sort).__name__)
+    
+    def test_filter_supports_dotted_fields(self):
+        """Test: filters resolve nested attributes through dotted paths"""
+        # Arrange
+        class Holder:
+            def __init__(self, user):
+                self.user = user
+        
+        holders = [Holder(u) for u in self.users]
+        spec = EqualSpecification("user.name", "Bob")
+        
+        # Act & Assert
+        self.assertEqual([spec.is_satisfied_by(h) for h in holders], [False, True, False, False])
+        self.assertEqual(spec.is_satisfied_by_batch(holders), [False, True, False, False])
+        self.assertFalse(spec.is_satisfied_by(self.users[0]))
+    
+    def test_batch_evaluation_matches_scalar(self):
+        """Test: is_satisfied_by_batch agrees with is_satisfied_by"""
+        # Arrange
+        specs = [
+            EqualSpecification("name", "Alice") | BetweenSpecification("age", 26, 32),
+            InSpecification("name", ["Bob", "Diana"]) & ~EqualSpecification("is_active", False),
+            GreaterThanSpecification("age", 20) & BetweenSpecification("missing", 1, 2),
+            ~(LikeSpecification("name", "li") | EqualSpecification("missing", None)),
+            LessThanSpecification("name", 5) | LessThanSpecification("age", 30),
+            InSpecification("age", [25, 35, [1]]) | InSpecification("name", ["Bob"]),
+            BetweenSpecification("age", 40, 20) | EqualSpecification("name", "Diana"),
+        ]
+        
+        for spec in specs:
+            # Act
+            batch = spec.is_satisfied_by_batch(self.users)
+            
+            # Assert
+            self.assertEqual(batch, [spec.is_satisfied_by(u) for u in self.users])
+    
+    def test_filter_many(self):
+        """Test: filter_many returns matching entities in order"""
+        # Arrange
+        spec = GreaterThanSpecification("age", 26) & EqualSpecification("is_active", True)
+        
+        # Act
+        from_list = spec.filter_many(self.users)
+        from_iter = spec.filter_many(iter(self.users))
+        
+        # Assert
+        self.assertEqual([u.name for u in from_list], ["Bob", "Diana"])
+        self.assertEqual(from_iter, from_list)
+    
+    def test_columnar_mask_matches_scalar(self):
+        """Test: to_mask over columns agrees with is_satisfied_by"""
+        # Arrange
+        columns = {
+            "name": [u.name for u in self.users],
+            "age": [u.age for u in self.users],
+            "is_active": [u.is_active for u in self.users],
+        }
+        specs = [
+            EqualSpecification("name", "Alice") | BetweenSpecification("age", 26, 32),
+            InSpecification("name", ["Bob", "Diana"]) & ~EqualSpecification("is_active", False),
+            GreaterThanSpecification("age", 20) & BetweenSpecification("missing", 1, 2),
+            ~LikeSpecification("name", "LI"),
+            BetweenSpecification("age", 40, 20) | IsNullSpecification("missing"),
+        ]
+        
+        for spec in specs:
+            # Act
+            mask = spec.to_mask(columns)
+            
+            # Assert
+            self.assertEqual(mask, [spec.is_satisfied_by(u) for u in self.users])
+    
+    def test_columnar_mask_not_implemented_on_custom_leaf(self):
+        """Test: to_mask raises NotImplementedError on leaves without columnar support"""
+        from backbone.domain.specifications import Specification
+        
+        # Arrange
+        class AdultSpecification(Specification):
+            def is_satisfied_by(self, candidate):
+                return candidate.age >= 18
+        
+        # Act & Assert
+        with self.assertRaises(NotImplementedError):
+            AdultSpecification().to_mask({"age": [20]})
+        with self.assertRaises(NotImplementedError):
+            (AdultSpecification() & EqualSpecification("age", 20)).to_mask({"age": [20]})
+    
+    def test_query_builder_compile_predicate(self):
+        """Test: compiled predicate combines all filters and is reused"""
+        from backbone.domain.repositories import QueryBuilder
+        
+        # Arrange
+        builder = (QueryBuilder(SampleUser)
+                   .filter(GreaterThanSpecification("age", 26))
+                   .filter(EqualSpecification("is_active", True)))
+        
+        # Act
+        predicate = builder.compile_predicate()
+        
+        # Assert
+        self.assertIs(builder.compile_predicate(), predicate)
+        self.assertEqual([u.name for u in self.users if predicate(u)], ["Bob", "Diana"])
+        builder.filter(LessThanSpecification("age", 35))
+        self.assertIsNot(builder.compile_predicate(), predicate)
+    
+    def test_query_builder_clone_is_independent(self):
+        """Test: clones share state but diverge on further changes"""
+        from backbone.domain.repositories import JoinType, QueryBuilder
+        
+        # Arrange
+        base = QueryBuilder(SampleUser).filter(EqualSpecification("is_active", True)).select(["name"])
+        
+        # Act
+        page = base.clone().filter(GreaterThanSpecification("age", 26)).join(SampleUser, "id = id")
+        
+        # Assert
+        self.assertIs(base.to_query_definition()["filters"], base.paginate(1, 10).to_query_definition()["filters"])
+        self.assertEqual(len(base.to_query_definition()["filters"]), 1)
+        self.assertFalse(base.has_joins)
+        self.assertEqual(len(page.to_query_definition()["filters"]), 2)
+        self.assertEqual(page.to_query_definition()["select_fields"], ["name"])
+        self.assertTrue(page.has_joins)
+        self.assertEqual(page.to_query_definition()["joins"][0].join_type, JoinType.INNER)
+        with self.assertRaises(ValueError):
+            page.join(SampleUser, "id = id", "sideways")
+    
+    def test_query_builder_plan_key_ignores_literals(self):
+        """Test: plan_key depends on query shape, not parameter values"""
+        from backbone.domain.repositories import QueryBuilder
+        
+        def build(name, min_age, page):
+            return (QueryBuilder(SampleUser)
+                    .filter(EqualSpecification("name", name) | InSpecification("email", [name]))
+                    .filter(GreaterThanSpecification("age", min_age))
+                    .paginate(page, 20))
+        
+        # Act
+        key = build("Alice", 20, 0).plan_key()
+        
+        # Assert
+        self.assertEqual(len(key), 16)
+        self.assertEqual(build("Bob", 30, 3).plan_key(), key)
+        self.assertNotEqual(build("Bob", 30, 3).filter(IsNullSpecification("email")).plan_key(), key)
+    
+    def test_query_builder_plan_key_follows_canonical_filters(self):
+        """Test: plan_key reflects canonicalized filters and the empty flag"""
+        from backbone.domain.repositories import QueryBuilder
+        
+        def build(first, second):
+            return (QueryBuilder(SampleUser)
+                    .filter(EqualSpecification("age", first))
+                    .filter(EqualSpecification("age", second)))
+        
+        # Act
+        duplicate = build(1, 1)
+        contradiction = build(1, 2)
+        
+        # Assert
+        self.assertFalse(duplicate.to_query_definition()["empty"])
+        self.assertTrue(contradiction.to_query_definition()["empty"])
+        self.assertNotEqual(duplicate.plan_key(), contradiction.plan_key())
+        self.assertEqual(duplicate.plan_key(), build(5, 5).plan_key())
+    
+    def test_query_builder_canonicalizes_filters(self):
+        """Test: duplicate and overlapping filters are merged, contradictions flagged"""
+        from backbone.domain.repositories import QueryBuilder
+        
+        # Arrange
+        builder = (QueryBuilder(SampleUser)
+                   .filter(InSpecification("name", ["Alice", "Bob", "Diana"]))
+                   .filter(GreaterThanSpecification("age", 20))
+                   .filter(InSpecification("name", ["Bob", "Diana", "Eve"]) & GreaterThanSpecification("age", 20)))
+        
+        # Act
+        definition = builder.to_query_definition()
+        
+        # Assert
+        self.assertFalse(definition["empty"])
+        self.assertEqual(definition["filters"], (
+            {"field": "name", "operator": "in", "value": ("Bob", "Diana")},
+            {"field": "age", "operator": "gt", "value": 20},
+        ))
+        builder.filter(EqualSpecification("name", "Alice"))
+        self.assertTrue(builder.to_query_definition()["empty"])
+        self.assertTrue(
+            QueryBuilder(SampleUser)
+            .filter(IsNullSpecification("email"))
+            .filter(IsNotNullSpecification("email"))
+            .to_query_definition()["empty"]
+        )
+    
+    def test_and_reorders_children_by_observed_rejections(self):
+        """Test: the operand that rejects most moves to the front"""
+        # Arrange: the hint says "name" is more selective, but "age" rejects everyone
+        name = EqualSpecification("name", "Alice")
+        age = GreaterThanSpecification("age", 100)
+        spec = name & age
+        alice = self.users[0]
+        self.assertIs(spec._ordered[0], name)
+        
+        # Act
+        for _ in range(1100):
+            self.assertFalse(spec.is_satisfied_by(alice))
+        
+        # Assert
+        self.assertIs(spec._ordered[0], age)
+        self.assertEqual(spec.children, (name, age))
+    
+    def test_double_negation_is_folded(self):
+        """Test: ~~x returns x and NOT(NOT x) emits x's expression"""
+        # Arrange
+        name = EqualSpecification("name", "Alice")
+        active = EqualSpecification("is_active", True)
+        
+        # Act
+        double = ~~name
+        and_negated = ~(name & active)
+        
+        # Assert
+        self.assertIs(double, name)
+        self.assertEqual(NotSpecification(~name).to_expression(), name.to_expression())
+        self.assertIsInstance(and_negated, NotSpecification)
+    
+    def test_nested_and_or_are_flattened(self):
+        """Test: chained AND/OR build a single n-ary node"""
+        # Arrange
+        a = EqualSpecification("name", "Alice")
+        b = GreaterThanSpecification("age", 20)
+        c = EqualSpecification("is_active", True)
+        
+        # Act
+        and_spec = a & b & c
+        or_spec = a | (b | c)
+        
+        # Assert
+        self.assertIsInstance(and_spec, AndSpecification)
+        self.assertEqual(and_spec.children, (a, b, c))
+        self.assertEqual(
+            [op["field"] for op in and_spec.to_expression().operands],
+            ["name", "age", "is_active"]
+        )
+        self.assertEqual(or_spec.children, (a, b, c))
+        self.assertEqual(or_spec.to_expression().op, "OR")
+        self.assertEqual((~a).to_expression(), OpExpr("NOT", (a.to_expression(),)))
+        self.assertEqual([u.name for u in self.users if and_spec.is_satisfied_by(u)], ["Alice"])
+        self.assertEqual(len([u for u in self.users if or_spec.is_satisfied_by(u)]), 4)
+    
+    def test_query_builder_orders_filters_by_selectivity(self):
+        """Test: to_query_definition emits the most selective filters first"""
+        from backbone.domain.repositories import QueryBuilder
+        
+        # Arrange
+        builder = (QueryBuilder(SampleUser)
+                   .filter(LikeSpecification("name", "a"))
+                   .filter(GreaterThanSpecification("age", 20))
+                   .filter(EqualSpecification("is_active", True)))
+        
+        # Act
+        definition = builder.to_query_definition()
+        
+        # Assert
+        self.assertEqual([f["operator"] for f in definition["filters"]], ["eq", "gt", "like"])
 
 
 # === FILTER PARSER TESTS ===
@@ -358,6 +843,66 @@ class TestFilterParser(BaseTestCase):
         self.assertFalse(spec.is_satisfied_by(user_20))
         self.assertFalse(spec.is_satisfied_by(user_40))
     
+    def test_parse_filters_reuses_cached_specifications(self):
+        """Test: identical filters return the same specification instance"""
+        # Act
+        first = self.parser.parse_filters({"age__gte": "18", "name": "Bob"})
+        
+        # Assert
+        self.assertIs(self.parser.parse_filters({"age__gte": "18", "name": "Bob"}), first)
+        self.assertIsNot(self.parser.parse_filters({"age__gte": "21", "name": "Bob"}), first)
+        self.assertIs(self.parser.parse_filters(["age,gt,20"]), self.parser.parse_filters(["age,gt,20"]))
+        self.assertIsNot(FilterParser(cache_size=0).parse_filters(["age,gt,20"]), self.parser.parse_filters(["age,gt,20"]))
+    
+    def test_null_checks_are_shared_per_field(self):
+        """Test: the factory reuses IS NULL / IS NOT NULL specs per field"""
+        from backbone.domain.specifications.filter_specification import SpecificationFactory
+        
+        # Act
+        first = SpecificationFactory.create("email", "is_null", None)
+        
+        # Assert
+        self.assertIs(SpecificationFactory.create("email", "is_null", None), first)
+        self.assertIsNot(SpecificationFactory.create("name", "is_null", None), first)
+        self.assertIsInstance(SpecificationFactory.create("email", "is_not_null", None), IsNotNullSpecification)
+    
+    def test_parse_dict_reuses_shape_plan(self):
+        """Test: dict filters with the same keys reuse the resolved plan"""
+        # Act
+        first = self.parser.parse_filters({"age__gte": "18", "name__in": "Bob|Ann"})
+        second = self.parser.parse_filters({"age__gte": "30", "name__in": "Eve"})
+        
+        # Assert
+        self.assertEqual(len(self.parser._shape_plans), 1)
+        self.assertEqual(first.children[1].value, ("Bob", "Ann"))
+        self.assertEqual(second.children[0].value, 30)
+        self.assertEqual(second.children[1].value, ("Eve",))
+    
+    def test_parse_list_groups_connector_runs(self):
+        """Test: consecutive filters with the same connector form one node"""
+        # Act
+        spec = self.parser.parse_filters([
+            "age,gt,20,and", "age,lt,40,and", "is_active,eq,true,or", "name,eq,Charlie"
+        ])
+        
+        # Assert
+        self.assertIsInstance(spec, OrSpecification)
+        self.assertIsInstance(spec.children[0], AndSpecification)
+        self.assertEqual(len(spec.children[0].children), 3)
+    
+    def test_parse_dict_operator_suffixes(self):
+        """Test: operator suffixes are case-insensitive and unknown ones are rejected"""
+        # Act
+        spec = self.parser.parse_filters({"age__GTE": "30", "name": "Bob"})
+        
+        # Assert
+        self.assertEqual(
+            [child.to_expression()["operator"] for child in spec.children],
+            ["gte", "eq"]
+        )
+        with self.assertRaises(InvalidValueObjectException):
+            self.parser.parse_filters({"age__around": "30"})
+    
     def test_parse_multiple_filters(self):
         """Test: Parse multiple filters combined with AND"""
         # Arrange
@@ -384,6 +929,20 @@ class TestFilterParser(BaseTestCase):
 class TestSortSpecification(BaseTestCase):
     """Test sort specification functionality"""
     
+    def test_sort_criteria_follow_reassigned_fields(self):
+        """Test: reassigning field/direction updates the emitted criteria"""
+        # Arrange
+        sort_spec = SortSpecification("a")
+        
+        # Act
+        sort_spec.direction = SortDirection.DESC
+        sort_spec.field = "b"
+        
+        # Assert
+        self.assertEqual(sort_spec.to_sort_criteria(), [("b", "desc")])
+        self.assertEqual(sort_spec.to_expression(), {"field": "b", "direction": "desc"})
+        self.assertEqual(str(sort_spec), "b DESC")
+    
     def test_single_sort_specification(self):
         """Test: Single field sorting specification"""
         # Arrange
@@ -416,6 +975,158 @@ class TestSortSpecification(BaseTestCase):
         self.assertEqual(SortDirection.DESC.value, "desc")
 
 
+# === UNIT OF WORK TESTS ===
+
+class TestBaseUnitOfWork(BaseTestCase):
+    """Test entity tracking in BaseUnitOfWork"""
+    
+    def setUp(self):
+        super().setUp()
+        from backbone.domain.repositories.unit_of_work import BaseUnitOfWork
+        
+        class InMemoryUnitOfWork(BaseUnitOfWork):
+            async def commit(self):
+                self._committed = True
+            
+            async def rollback(self):
+                self._rolled_back = True
+        
+        self.uow = InMemoryUnitOfWork()
+    
+    def test_entities_move_between_registries(self):
+        """Test: each entity lives in a single registry"""
+        # Arrange
+        user = SampleUser("1", "Ana", "ana@example.com", 30)
+        
+        # Act & Assert
+        self.uow.register_clean(user)
+        self.assertFalse(self.uow.has_changes)
+        self.uow.register_dirty(user)
+        self.assertEqual(self.uow.dirty_entities, [user])
+        self.uow.register_removed(user)
+        self.assertEqual(self.uow.dirty_entities, [])
+        self.assertEqual(self.uow.removed_entities, [user])
+        self.uow.register_dirty(user)
+        self.assertEqual(self.uow.dirty_entities, [])
+        self.uow.register_new(user)
+        self.assertEqual(self.uow.new_entities, [user])
+        self.assertEqual(self.uow.removed_entities, [])
+        self.assertEqual(list(self.uow.iter_new()), [user])
+        self.assertEqual(list(self.uow.iter_removed()), [])
+    
+    def test_tracking_uses_identity(self):
+        """Test: equal but distinct entities are tracked separately"""
+        # Arrange
+        first = {"id": "1"}
+        second = {"id": "1"}
+        
+        # Act
+        self.uow.register_new(first)
+        self.uow.register_new(second)
+        self.uow.register_new(first)
+        self.uow.register_dirty(first)
+        
+        # Assert
+        self.assertEqual(len(self.uow.new_entities), 2)
+        self.assertEqual(self.uow.dirty_entities, [])
+        self.uow.clear_tracking()
+        self.assertFalse(self.uow.has_changes)
+    
+    def test_max_pending_bounds_tracked_changes(self):
+        """Test: registering past max_pending raises, existing entries still move"""
+        from backbone.domain.repositories import UnitOfWorkFullError
+        
+        # Arrange
+        uow = type(self.uow)(max_pending=2)
+        first, second, third = {"id": "1"}, {"id": "2"}, {"id": "3"}
+        uow.register_clean(third)
+        uow.register_new(first)
+        uow.register_dirty(second)
+        
+        # Act & Assert
+        uow.register_removed(first)
+        with self.assertRaises(UnitOfWorkFullError):
+            uow.register_dirty(third)
+        self.assertEqual(uow.dirty_entities, [second])
+    
+    def test_max_pending_defaults_to_unbounded(self):
+        """Test: without max_pending, bulk registrations are never rejected"""
+        # Arrange
+        entities = [{"id": str(i)} for i in range(20_000)]
+        
+        # Act
+        for entity in entities:
+            self.uow.register_new(entity)
+        
+        # Assert
+        self.assertIsNone(self.uow.max_pending)
+        self.assertEqual(len(self.uow.new_entities), 20_000)
+    
+    def test_exit_without_changes_skips_commit(self):
+        """Test: read-only units of work opting in don't commit on exit"""
+        # Arrange
+        class CountingUnitOfWork(type(self.uow)):
+            _skip_empty_commit = True
+            commits = 0
+            
+            async def commit(self):
+                self.commits += 1
+        
+        async def run(register):
+            uow = CountingUnitOfWork()
+            async with uow:
+                if register:
+                    uow.register_new({"id": "1"})
+            return uow.commits
+        
+        # Act & Assert
+        self.assertEqual(asyncio.run(run(False)), 0)
+        self.assertEqual(asyncio.run(run(True)), 1)
+    
+    def test_manager_commit_all_rolls_back_on_failure(self):
+        """Test: a failed commit rolls back every registered unit of work"""
+        from backbone.domain.repositories.unit_of_work import UnitOfWorkManager
+        
+        # Arrange
+        class FailingUnitOfWork(type(self.uow)):
+            async def commit(self):
+                raise RuntimeError("boom")
+        
+        manager = UnitOfWorkManager()
+        failing = FailingUnitOfWork()
+        manager.register_unit_of_work("primary", self.uow)
+        manager.register_unit_of_work("secondary", failing)
+        
+        # Act & Assert
+        with self.assertRaises(RuntimeError):
+            asyncio.run(manager.commit_all())
+        self.assertTrue(self.uow._rolled_back)
+        self.assertTrue(failing._rolled_back)
+    
+    def test_manager_commit_all_groups_base_exceptions(self):
+        """Test: several failures, including a CancelledError, are raised together"""
+        from backbone.domain.repositories.unit_of_work import UnitOfWorkManager
+        
+        # Arrange
+        def failing_uow(error):
+            class FailingUnitOfWork(type(self.uow)):
+                async def commit(self):
+                    raise error
+            return FailingUnitOfWork()
+        
+        manager = UnitOfWorkManager()
+        manager.register_unit_of_work("cancelled", failing_uow(asyncio.CancelledError()))
+        manager.register_unit_of_work("broken", failing_uow(RuntimeError("boom")))
+        
+        # Act & Assert
+        with self.assertRaises(BaseExceptionGroup) as context:
+            asyncio.run(manager.commit_all())
+        self.assertEqual(
+            [type(error) for error in context.exception.exceptions],
+            [asyncio.CancelledError, RuntimeError]
+        )
+
+
 # === RUN TESTS ===
 
 def run_domain_tests():
@@ -252,6 +252,57 @@ class TestMockRepository(BaseTestCase):
         saved_entities = self.repository.get_saved_entities()
         self.assertEqual(len(saved_entities), 1)
 
+    def test_save_all_entities(self):
+        """Test: save_all persists every entity through the sequential mixin"""
+        import asyncio
+        entities = [{"id": "1"}, {"name": "no id"}]
+        saved = asyncio.run(self.repository.save_all(entities))
+        self.assertEqual(saved, entities)
+        self.assertEqual(len(asyncio.run(self.repository.get_all())), 2)
+        self.assertIsNotNone(saved[1]["id"])
+
+    def test_base_repository_requires_save_all(self):
+        """Test: BaseRepository no longer provides a default save_all"""
+        from backbone.domain.repositories.base_repository import BaseRepository
+        self.assertIn("save_all", BaseRepository.__abstractmethods__)
+
+    def test_base_delete_by_id_prefers_native_path(self):
+        """Test: BaseRepository.delete_by_id skips find_by_id when native delete exists"""
+        import asyncio
+        from backbone.domain.repositories.base_repository import BaseRepository
+
+        class NativeRepository(MockRepository):
+            async def find_by_id(self, entity_id):
+                raise AssertionError("find_by_id must not be called")
+
+            async def _delete_by_id_native(self, entity_id):
+                return 1 if self._data.pop(entity_id, None) is not None else 0
+
+        repository = NativeRepository(dict)
+        repository.seed_data([{"id": "1"}])
+        self.assertTrue(asyncio.run(BaseRepository.delete_by_id(repository, "1")))
+        self.assertFalse(asyncio.run(BaseRepository.delete_by_id(repository, "1")))
+
+    def test_base_delete_by_id_defaults_to_find_and_delete(self):
+        """Test: without a native override, delete_by_id goes through find_by_id + delete"""
+        import asyncio
+        from backbone.domain.repositories.base_repository import BaseRepository
+
+        self.repository.seed_data([{"id": "1"}])
+        self.assertTrue(asyncio.run(BaseRepository.delete_by_id(self.repository, "1")))
+        self.assertFalse(asyncio.run(BaseRepository.delete_by_id(self.repository, "1")))
+        self.assertEqual(asyncio.run(self.repository.get_all()), [])
+
+    def test_entity_class_from_class_attribute(self):
+        """Test: repositories can declare ENTITY_CLASS instead of passing it"""
+        class DictRepository(MockRepository):
+            ENTITY_CLASS = dict
+
+        self.assertIs(DictRepository().entity_class, dict)
+        self.assertIs(DictRepository(list).entity_class, list)
+        with self.assertRaises(TypeError):
+            MockRepository(None)
+
     def test_get_by_id(self):
         """Test: Get entity by ID from mock repository"""
         import asyncio
@@ -298,6 +349,26 @@ class TestMockRepository(BaseTestCase):
         for entity in active_entities:
             self.assertTrue(entity["is_active"])
 
+    def test_find_propagates_batch_specification_errors(self):
+        """Test: errors raised by a batch specification are not swallowed"""
+        import asyncio
+        from backbone.domain.specifications.base_specification import Specification
+
+        self.repository.seed_data([{"id": "1"}, {"id": "2"}])
+        calls = []
+
+        class BrokenSpec(Specification):
+            def is_satisfied_by(self, entity):
+                calls.append(entity["id"])
+                return True
+
+            def is_satisfied_by_batch(self, candidates):
+                raise ValueError("bug in batch path")
+
+        with self.assertRaises(ValueError):
+            asyncio.run(self.repository.find(BrokenSpec()))
+        self.assertEqual(calls, [])
+
 
 # === INFRASTRUCTURE EXCEPTION TESTS ===
 